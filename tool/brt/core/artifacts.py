@@ -50,6 +50,16 @@ logger = logging.getLogger(__name__)
 _UNSAFE_CHARS = re.compile(r"[^\w\-]")
 """ファイル名に使用できない文字を検出する正規表現。"""
 
+_HYPHEN_RUN = re.compile(r"-+")
+"""連続するハイフンを検出する正規表現。"""
+
+_ASCII_SANITIZE_TABLE = str.maketrans({
+    chr(c): "-"
+    for c in range(128)
+    if not (chr(c).isalnum() or chr(c) in "-_")
+})
+"""ASCII のみのステップ名用の置換テーブル（_UNSAFE_CHARS と同じ文字をハイフンへ）。"""
+
 
 # ---------------------------------------------------------------------------
 # ArtifactsManager 本体
@@ -386,8 +396,12 @@ def _sanitize_step_name(name: str) -> str:
     Returns:
         サニタイズ済みのステップ名
     """
-    sanitized = _UNSAFE_CHARS.sub("-", name)
+    # ASCII のみなら \w は [A-Za-z0-9_] と一致するため、置換テーブルで済ませる
+    if name.isascii():
+        sanitized = name.translate(_ASCII_SANITIZE_TABLE)
+    else:
+        sanitized = _UNSAFE_CHARS.sub("-", name)
     # 連続するハイフンを1つにまとめる
-    sanitized = re.sub(r"-+", "-", sanitized)
+    sanitized = _HYPHEN_RUN.sub("-", sanitized)
     # 先頭・末尾のハイフンを除去
     return sanitized.strip("-")
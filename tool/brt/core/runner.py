@@ -201,7 +201,7 @@ class Runner:
 
                 selector_resolver = SelectorResolver(healing=scenario.healing)
                 variable_expander = VariableExpander(
-                    env={}, vars=dict(scenario.vars)
+                    env={}, vars=scenario.vars
                 )
                 step_context = StepContext(
                     selector_resolver=selector_resolver,
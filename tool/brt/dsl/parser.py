@@ -6,20 +6,33 @@ Pydantic モデルとの相互変換を行う。
 
 要件 3.7: YAML ファイルのスキーマ検証、違反箇所の報告
 要件 3.8: パース-出力ラウンドトリップ特性（意味的等価性の保証）
+
+cache=True を指定すると、検証済み Scenario を YAML と同じディレクトリの
+.trace-weaver-cache/ 配下に pickle として保存し、内容ハッシュが一致する
+限り次回以降の load() で YAML パースと Pydantic 検証を省略する。
 """
 
 from __future__ import annotations
 
+import hashlib
+import os
+import pickle
+import tempfile
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
+import pydantic_core
 from pydantic import ValidationError as PydanticValidationError
-from ruamel.yaml import YAML
-from ruamel.yaml.error import YAMLError
 
 from .schema import Scenario
 
+if TYPE_CHECKING:
+    from ruamel.yaml import YAML
+
+# パース済みツリーキャッシュの保存先ディレクトリ名（YAML と同階層に作成）
+CACHE_DIR_NAME = ".trace-weaver-cache"
+
 
 # ---------------------------------------------------------------------------
 # バリデーションエラー表現
@@ -51,13 +64,29 @@ class DslParser:
     Pydantic v2 の Scenario モデルとの相互変換を提供する。
     """
 
-    def __init__(self) -> None:
-        """ruamel.yaml インスタンスを初期化する。"""
-        self._yaml = YAML()
-        # ラウンドトリップモード（デフォルト）でコメントを保持
-        self._yaml.preserve_quotes = True
-        # 出力時のインデント設定
-        self._yaml.default_flow_style = False
+    def __init__(self, cache: bool = False) -> None:
+        """パーサーを初期化する。
+
+        ruamel.yaml の import は重いため、実際に YAML を読み書きするまで遅延する。
+
+        Args:
+            cache: True の場合、load() で検証済み Scenario のディスクキャッシュを使用する
+        """
+        self._cache = cache
+        self._yaml = None
+
+    @property
+    def yaml(self) -> YAML:
+        """ruamel.yaml インスタンス（初回アクセス時に生成）。"""
+        if self._yaml is None:
+            from ruamel.yaml import YAML
+
+            self._yaml = YAML()
+            # ラウンドトリップモード（デフォルト）でコメントを保持
+            self._yaml.preserve_quotes = True
+            # 出力時のインデント設定
+            self._yaml.default_flow_style = False
+        return self._yaml
 
     # ----- load -----
 
@@ -80,10 +109,25 @@ class DslParser:
         if not path.exists():
             raise FileNotFoundError(f"YAML ファイルが見つかりません: {path}")
 
+        if not self._cache:
+            return self._load_uncached(path)
+
+        # 内容ハッシュでキャッシュを引き、ヒットすればパース・検証を省略
+        cache_path = self._cache_path(path, path.read_bytes())
+        scenario = self._read_cache(cache_path)
+        if scenario is None:
+            scenario = self._load_uncached(path)
+            self._write_cache(cache_path, scenario)
+        return scenario
+
+    def _load_uncached(self, path: Path) -> Scenario:
+        """YAML をパースし、Pydantic 検証を行って Scenario を返す。"""
+        from ruamel.yaml.error import YAMLError
+
         # YAML 読み込み
         try:
             with open(path, "r", encoding="utf-8") as f:
-                data = self._yaml.load(f)
+                data = self.yaml.load(f)
         except YAMLError as e:
             # 行番号付きエラーメッセージを生成
             line_info = ""
@@ -130,7 +174,7 @@ class DslParser:
 
         # YAML ファイルに書き出し
         with open(path, "w", encoding="utf-8") as f:
-            self._yaml.dump(data, f)
+            self.yaml.dump(data, f)
 
     # ----- validate -----
 
@@ -157,10 +201,12 @@ class DslParser:
             ))
             return errors
 
+        from ruamel.yaml.error import YAMLError
+
         # YAML 構文チェック
         try:
             with open(path, "r", encoding="utf-8") as f:
-                data = self._yaml.load(f)
+                data = self.yaml.load(f)
         except YAMLError as e:
             line = None
             if hasattr(e, "problem_mark") and e.problem_mark is not None:
@@ -184,17 +230,69 @@ class DslParser:
         try:
             Scenario(**plain_data)
         except PydanticValidationError as e:
-            for err in e.errors():
-                # フィールドパスを文字列に変換
-                loc_parts = [str(part) for part in err.get("loc", [])]
-                location = " -> ".join(loc_parts) if loc_parts else "unknown"
-                errors.append(DslValidationError(
+            # url / ctx / input は使わないため生成させない
+            raw_errors = e.errors(
+                include_url=False, include_context=False, include_input=False,
+            )
+            errors.extend(
+                DslValidationError(
                     message=err.get("msg", "不明なエラー"),
-                    location=location,
-                ))
+                    # フィールドパスを文字列に変換
+                    location=" -> ".join(map(str, err.get("loc", ()))) or "unknown",
+                )
+                for err in raw_errors
+            )
 
         return errors
 
+    # ----- パース済みツリーキャッシュ -----
+
+    @staticmethod
+    def _cache_path(path: Path, content: bytes) -> Path:
+        """YAML の内容ハッシュからキャッシュファイルのパスを求める。
+
+        blake3 パッケージがあればそれを使い、無ければ hashlib.blake2b で代替する。
+        ハッシュが内容に追従するため、mtime による無効化は行わない。
+        """
+        try:
+            from blake3 import blake3
+            digest = blake3(content).hexdigest()[:16]
+        except ImportError:
+            digest = hashlib.blake2b(content, digest_size=8).hexdigest()
+        return path.parent / CACHE_DIR_NAME / f"{path.name}.{digest}.pkl"
+
+    @staticmethod
+    def _read_cache(cache_path: Path) -> Optional[Scenario]:
+        """キャッシュを読み込む。存在しない・壊れている・バージョン不一致なら None。"""
+        try:
+            with open(cache_path, "rb") as f:
+                version, scenario = pickle.load(f)
+        except Exception:
+            # 未作成・破損したキャッシュは無視して通常パースにフォールバック
+            return None
+        if version != pydantic_core.__version__ or not isinstance(scenario, Scenario):
+            return None
+        return scenario
+
+    @staticmethod
+    def _write_cache(cache_path: Path, scenario: Scenario) -> None:
+        """キャッシュを一時ファイル経由で原子的に書き込む。失敗は無視する。"""
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=cache_path.parent, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    pickle.dump(
+                        (pydantic_core.__version__, scenario), f,
+                        protocol=pickle.HIGHEST_PROTOCOL,
+                    )
+                os.replace(tmp_name, cache_path)
+            except BaseException:
+                os.unlink(tmp_name)
+                raise
+        except OSError:
+            pass
+
     # ----- ユーティリティ -----
 
     def _to_plain_dict(self, data: object) -> object:
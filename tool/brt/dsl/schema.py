@@ -15,6 +15,7 @@ import re
 from typing import Literal, Optional, Union
 
 from pydantic import BaseModel, Field, field_validator
+from pydantic.dataclasses import dataclass
 
 
 # ---------------------------------------------------------------------------
@@ -545,6 +546,10 @@ class SetDatePickerStep(BaseModel):
     format: Optional[str] = Field(
         default=None, description="日付フォーマット（例: YYYY-MM-DD）"
     )
+    directSet: bool = Field(
+        default=False,
+        description="クリック・fill を経由せず value を直接設定するか（1 回の evaluate で入力）",
+    )
     name: Optional[str] = Field(default=None, description="ステップ名（任意）")
 
 
@@ -709,14 +714,22 @@ Scenario モデルの steps フィールドで使用する。
 # ===========================================================================
 
 # 変数展開構文のパターン: ${env.X} または ${vars.X}
-_VAR_PATTERN = re.compile(r"\$\{(env|vars)\.[a-zA-Z_][a-zA-Z0-9_]*\}")
+_VAR_PATTERN = re.compile(r"\$\{(env|vars)\.[a-zA-Z_][a-zA-Z0-9_]*\}", re.ASCII)
+
+# 不正な変数参照パターン: ${ で始まるが env. / vars. 以外のもの
+_INVALID_VAR_PATTERN = re.compile(r"\$\{(?!env\.|vars\.)[^}]*\}", re.ASCII)
 
 
 # ---------------------------------------------------------------------------
 # アーティファクト設定
 # ---------------------------------------------------------------------------
 
-class ScreenshotConfig(BaseModel):
+# 以下の設定モデルはシナリオ読み込み時に一度だけ検証され、以後変更されないため、
+# BaseModel ではなく __slots__ 付きの不変な Pydantic dataclass として定義する。
+# 検証（Literal / 値域）と ValidationError の送出は BaseModel と同じく行われる。
+
+@dataclass(slots=True, frozen=True)
+class ScreenshotConfig:
     """スクリーンショット撮影の設定。
 
     mode でステップ前後の撮影タイミングを制御し、
@@ -735,7 +748,8 @@ class ScreenshotConfig(BaseModel):
     )
 
 
-class TraceConfig(BaseModel):
+@dataclass(slots=True, frozen=True)
+class TraceConfig:
     """Playwright トレースの設定。
 
     mode で記録タイミングを制御する。on_failure は失敗時のみ保存。
@@ -747,7 +761,8 @@ class TraceConfig(BaseModel):
     )
 
 
-class VideoConfig(BaseModel):
+@dataclass(slots=True, frozen=True)
+class VideoConfig:
     """動画録画の設定。
 
     mode で録画タイミングを制御する。on_failure は失敗時のみ保存。
@@ -759,7 +774,8 @@ class VideoConfig(BaseModel):
     )
 
 
-class ArtifactsConfig(BaseModel):
+@dataclass(slots=True, frozen=True)
+class ArtifactsConfig:
     """テスト実行成果物の設定。
 
     screenshots, trace, video の各設定をまとめて管理する。
@@ -783,7 +799,8 @@ class ArtifactsConfig(BaseModel):
 # フック設定
 # ---------------------------------------------------------------------------
 
-class HooksConfig(BaseModel):
+@dataclass(slots=True, frozen=True)
+class HooksConfig:
     """ステップ実行前後のフック定義。
 
     beforeEachStep: 各ステップ実行前に実行するステップ配列
@@ -804,7 +821,8 @@ class HooksConfig(BaseModel):
 # セクション定義
 # ---------------------------------------------------------------------------
 
-class Section(BaseModel):
+@dataclass(slots=True, frozen=True)
+class Section:
     """ステップのグループ化と章立てを表現するセクション。
 
     複数のステップを論理的にまとめ、テストの意図を章立てで表現する。
@@ -860,13 +878,10 @@ class Scenario(BaseModel):
         ${env.X} および ${vars.X} パターンのみを許可する。
         不正な構文（例: ${unknown.X}）が含まれる場合はエラーを返す。
         """
-        # 不正な変数参照パターン: ${ で始まるが env. / vars. 以外のもの
-        _INVALID_VAR_PATTERN = re.compile(
-            r"\$\{(?!env\.|vars\.)[^}]*\}"
-        )
         for key, value in v.items():
-            invalid_matches = _INVALID_VAR_PATTERN.findall(value)
-            if invalid_matches:
+            # 大半の値は不正参照を含まないため、search で先に判定する
+            if _INVALID_VAR_PATTERN.search(value) is not None:
+                invalid_matches = _INVALID_VAR_PATTERN.findall(value)
                 raise ValueError(
                     f"vars['{key}'] に不正な変数参照が含まれています: "
                     f"{', '.join(invalid_matches)}。"
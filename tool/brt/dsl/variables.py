@@ -17,6 +17,8 @@
 from __future__ import annotations
 
 import re
+from collections.abc import Mapping
+from types import MappingProxyType
 from typing import Any
 
 
@@ -24,11 +26,61 @@ from typing import Any
 # 変数参照パターン
 # ---------------------------------------------------------------------------
 
-# ${env.X} または ${vars.X} にマッチする正規表現
-_VAR_PATTERN = re.compile(r"\$\{(env|vars)\.([a-zA-Z_][a-zA-Z0-9_]*)\}")
+# ${...} 形式の参照全般にマッチする正規表現。
+# 展開と未解決パターンの検出を 1 回の走査で行うため、名前空間は置換時に判定する
+_ANY_VAR_PATTERN = re.compile(r"\$\{([^}]+)\}", re.ASCII)
 
-# 展開後に残っている未解決の ${...} パターンを検出する正規表現
-_UNRESOLVED_PATTERN = re.compile(r"\$\{[^}]+\}")
+# 複数テキストを連結して一括展開する際の区切り文字（ASCII Record Separator）と、
+# 区切り文字をまたいでマッチしないようにした一括展開用パターン
+_BATCH_SEPARATOR = "\x1e"
+_BATCH_VAR_PATTERN = re.compile(r"\$\{([^}\x1e]+)\}", re.ASCII)
+
+# 変数名として有効な識別子
+_VAR_NAME_PATTERN = re.compile(r"[a-zA-Z_][a-zA-Z0-9_]*", re.ASCII)
+
+# expand() 結果キャッシュの最大エントリ数（動的テキストによる無制限な増加を防ぐ）
+_EXPAND_CACHE_SIZE = 1024
+
+
+# ---------------------------------------------------------------------------
+# 値の種別ディスパッチ
+# ---------------------------------------------------------------------------
+
+# _expand_value で扱う値の種別
+_KIND_STR = 0
+_KIND_DICT = 1
+_KIND_LIST = 2
+_KIND_LEAF = 3
+
+# 型（完全一致）→ 種別。YAML 由来の値はほぼこの表で判定でき、isinstance の連鎖を避けられる
+_KIND_BY_TYPE: dict[type, int] = {
+    str: _KIND_STR,
+    dict: _KIND_DICT,
+    list: _KIND_LIST,
+    int: _KIND_LEAF,
+    float: _KIND_LEAF,
+    bool: _KIND_LEAF,
+    type(None): _KIND_LEAF,
+}
+
+
+def _kind_of(value: Any) -> int:
+    """値の種別を返す。表にない型（サブクラス等）は isinstance で判定する。"""
+    kind = _KIND_BY_TYPE.get(type(value))
+    if kind is not None:
+        return kind
+    if isinstance(value, str):
+        return _KIND_STR
+    if isinstance(value, dict):
+        return _KIND_DICT
+    if isinstance(value, list):
+        return _KIND_LIST
+    return _KIND_LEAF
+
+
+def _iter_items(container: Any) -> Any:
+    """dict / list の (キー, 値) を文書順に返すイテレータを返す。"""
+    return iter(container.items()) if isinstance(container, dict) else enumerate(container)
 
 
 # ---------------------------------------------------------------------------
@@ -51,6 +103,20 @@ class VariableNotFoundError(Exception):
         )
 
 
+def _check_unresolved(result: str) -> None:
+    """展開後のテキストに未解決の ${...} パターンが残っていないことを検証する。
+
+    変数の値自体が ${...} を含む場合に、それが展開されないまま残るのを防ぐ。
+
+    Raises:
+        VariableNotFoundError: 未解決パターンが残っている場合
+    """
+    if "${" in result:
+        unresolved = _ANY_VAR_PATTERN.search(result)
+        if unresolved:
+            raise VariableNotFoundError("unknown", unresolved.group())
+
+
 # ---------------------------------------------------------------------------
 # VariableExpander 本体
 # ---------------------------------------------------------------------------
@@ -66,15 +132,21 @@ class VariableExpander:
     set_var() で vars に格納し、後続ステップで参照可能にする。
     """
 
-    def __init__(self, env: dict[str, str], vars: dict[str, str]) -> None:
+    def __init__(self, env: Mapping[str, str], vars: Mapping[str, str]) -> None:
         """変数展開エンジンを初期化する。
 
+        env は読み取り専用として参照のまま保持する（コピーしない）。
+        呼び出し側は渡した後に env を変更しないこと。
+        vars は set_var() で更新するため、一度だけコピーする。
+
         Args:
             env: 環境変数辞書（os.environ 相当。テスタビリティのため直接渡す）
             vars: シナリオ変数辞書（Scenario.vars の初期値）
         """
-        self._env: dict[str, str] = dict(env)
+        self._env: Mapping[str, str] = env
         self._vars: dict[str, str] = dict(vars)
+        # 展開結果のキャッシュ（テキスト → 展開後テキスト）。set_var() で破棄する
+        self._cache: dict[str, str] = {}
 
     # ----- 公開メソッド -----
 
@@ -84,8 +156,9 @@ class VariableExpander:
         ${env.X} は環境変数辞書から、${vars.X} はシナリオ変数辞書から
         対応する値を取得して置換する。
 
-        展開後に未解決の ${...} パターンが残っていないことを検証し、
-        残っている場合は VariableNotFoundError を送出する。
+        env / vars 以外の ${...} パターンは展開と同じ走査で検出し、
+        VariableNotFoundError を送出する。変数の値自体に ${...} が含まれる場合も
+        展開後の検証で検出するため、未解決パターンは残らない。
 
         Args:
             text: 展開対象のテキスト
@@ -96,15 +169,17 @@ class VariableExpander:
         Raises:
             VariableNotFoundError: 未定義の変数が参照された場合
         """
-        result = _VAR_PATTERN.sub(self._replace_match, text)
+        # 大半の値は変数参照を含まないため、正規表現を通さずに返す
+        if "${" not in text:
+            return text
 
-        # 展開後に未解決パターンが残っていないことを保証
-        unresolved = _UNRESOLVED_PATTERN.search(result)
-        if unresolved:
-            # 未解決パターンから名前空間と変数名を抽出して報告
-            raw = unresolved.group()
-            raise VariableNotFoundError("unknown", raw)
+        cached = self._cache.get(text)
+        if cached is not None:
+            return cached
 
+        result = _ANY_VAR_PATTERN.sub(self._replace_match, text)
+        _check_unresolved(result)
+        self._remember(text, result)
         return result
 
     def expand_step(self, step: dict) -> dict:
@@ -135,68 +210,149 @@ class VariableExpander:
             value: 変数の値
         """
         self._vars[name] = value
+        # 変数値が変わるため、展開結果のキャッシュを破棄
+        self._cache.clear()
 
     # ----- プロパティ（テスト・デバッグ用） -----
 
     @property
-    def env(self) -> dict[str, str]:
-        """環境変数辞書の読み取り専用コピーを返す。"""
-        return dict(self._env)
+    def env(self) -> Mapping[str, str]:
+        """環境変数辞書の読み取り専用ビューを返す。"""
+        return MappingProxyType(self._env)
 
     @property
-    def vars(self) -> dict[str, str]:
-        """シナリオ変数辞書の読み取り専用コピーを返す。"""
-        return dict(self._vars)
+    def vars(self) -> Mapping[str, str]:
+        """シナリオ変数辞書の読み取り専用ビューを返す。"""
+        return MappingProxyType(self._vars)
 
     # ----- 内部メソッド -----
 
+    def _remember(self, text: str, result: str) -> None:
+        """展開結果をキャッシュに格納する。"""
+        if len(self._cache) >= _EXPAND_CACHE_SIZE:
+            # 最も古いエントリを破棄（dict は挿入順を保持する）
+            del self._cache[next(iter(self._cache))]
+        self._cache[text] = result
+
+    def _expand_batch(self, pending: list[tuple[Any, Any, str]]) -> None:
+        """未展開テキストをまとめて展開し、書き込み先コンテナに反映する。
+
+        全テキストを区切り文字で連結して正規表現を 1 回だけ適用し、
+        結果を区切り文字で分割して元の位置に書き戻す。
+        テキストや展開後の値に区切り文字が含まれる場合は 1 件ずつ展開する。
+
+        Args:
+            pending: (書き込み先コンテナ, キー, 展開対象テキスト) のリスト
+        """
+        texts = [text for _, _, text in pending]
+        results: list[str] | None = None
+        if len(texts) > 1 and not any(_BATCH_SEPARATOR in t for t in texts):
+            joined = _BATCH_VAR_PATTERN.sub(
+                self._replace_match, _BATCH_SEPARATOR.join(texts),
+            )
+            results = joined.split(_BATCH_SEPARATOR)
+            if len(results) != len(texts) or "${" in joined:
+                # 展開後の値に区切り文字または ${ が含まれていた。
+                # 1 件ずつ展開し直し、未解決パターンの検証もテキスト順に行う
+                results = None
+
+        if results is None:
+            results = [self.expand(text) for text in texts]
+        else:
+            for text, result in zip(texts, results):
+                self._remember(text, result)
+
+        for (dst, key, _), result in zip(pending, results):
+            dst[key] = result
+
     def _replace_match(self, match: re.Match) -> str:
         """正規表現マッチから変数値を取得して返す。
 
         Args:
-            match: _VAR_PATTERN にマッチした結果
+            match: _ANY_VAR_PATTERN にマッチした結果
 
         Returns:
             変数の値
 
         Raises:
-            VariableNotFoundError: 変数が未定義の場合
+            VariableNotFoundError: 変数が未定義、または env / vars 以外の参照の場合
         """
-        namespace = match.group(1)  # "env" or "vars"
-        var_name = match.group(2)   # 変数名
+        # "env.X" / "vars.X" を名前空間と変数名に分割
+        namespace, sep, var_name = match.group(1).partition(".")
 
-        if namespace == "env":
-            if var_name not in self._env:
-                raise VariableNotFoundError("env", var_name)
-            return self._env[var_name]
+        if sep and _VAR_NAME_PATTERN.fullmatch(var_name):
+            if namespace == "env":
+                if var_name not in self._env:
+                    raise VariableNotFoundError("env", var_name)
+                return self._env[var_name]
 
-        if namespace == "vars":
-            if var_name not in self._vars:
-                raise VariableNotFoundError("vars", var_name)
-            return self._vars[var_name]
+            if namespace == "vars":
+                if var_name not in self._vars:
+                    raise VariableNotFoundError("vars", var_name)
+                return self._vars[var_name]
 
-        # ここには到達しないはず（正規表現で env|vars に限定済み）
-        raise VariableNotFoundError(namespace, var_name)
+        # env / vars 以外の未解決パターン
+        raise VariableNotFoundError("unknown", match.group())
 
     def _expand_value(self, value: Any) -> Any:
-        """値を再帰的に展開する。
+        """値を展開する（ネストはスタックで反復的に辿り、再帰呼び出しを行わない）。
 
         - str: expand() で変数参照を展開
-        - dict: 各値を再帰的に展開（キーは展開しない）
-        - list: 各要素を再帰的に展開
+        - dict: 各値を展開（キーは展開しない）
+        - list: 各要素を展開
         - その他: そのまま返す
 
         Args:
             value: 展開対象の値
 
         Returns:
-            展開後の値
+            展開後の値（dict / list は新しいコンテナ）
         """
-        if isinstance(value, str):
+        kind = _kind_of(value)
+        if kind == _KIND_STR:
+            if "${" not in value:
+                return value
             return self.expand(value)
-        if isinstance(value, dict):
-            return {k: self._expand_value(v) for k, v in value.items()}
-        if isinstance(value, list):
-            return [self._expand_value(item) for item in value]
-        # int, float, bool, None 等はそのまま返す
-        return value
+        if kind == _KIND_DICT:
+            root: Any = {}
+        elif kind == _KIND_LIST:
+            root = [None] * len(value)
+        else:
+            # int, float, bool, None 等はそのまま返す
+            return value
+
+        cache_get = self._cache.get
+        kind_by_type = _KIND_BY_TYPE
+        # キャッシュに無い展開対象テキスト。走査後にまとめて展開する
+        # （エラー時に文書順で最初の未定義変数を報告できるよう、文書順に積む）
+        pending: list[tuple[Any, Any, str]] = []
+        # (展開元の要素イテレータ, 書き込み先コンテナ) の作業スタック。
+        # 子コンテナに降りる際は親のイテレータを途中のまま残し、戻ってから続きを辿る
+        stack: list[tuple[Any, Any]] = [(_iter_items(value), root)]
+        while stack:
+            items, dst = stack[-1]
+            for key, item in items:
+                kind = kind_by_type.get(type(item))
+                if kind is None:
+                    kind = _kind_of(item)
+                if kind == _KIND_STR:
+                    if "${" in item:
+                        cached = cache_get(item)
+                        if cached is None:
+                            pending.append((dst, key, item))
+                        item = cached
+                    dst[key] = item
+                elif kind == _KIND_LEAF:
+                    dst[key] = item
+                else:
+                    child: Any = {} if kind == _KIND_DICT else [None] * len(item)
+                    dst[key] = child
+                    stack.append((_iter_items(item), child))
+                    break
+            else:
+                # このコンテナの要素を辿り終えた
+                stack.pop()
+
+        if pending:
+            self._expand_batch(pending)
+        return root
@@ -15,8 +15,10 @@ Mapper が生成した DSL ステップリストに対して、以下の後処
 
 from __future__ import annotations
 
+import functools
 import logging
-import re
+import sys
+from collections.abc import Iterator
 from urllib.parse import urlparse
 
 logger = logging.getLogger(__name__)
@@ -44,6 +46,15 @@ _STEP_VERB_MAP: dict[str, str] = {
 }
 
 
+# expect 系ステップ種別（insert_expects で直後の expect 有無の判定に使用）
+_EXPECT_STEP_TYPES: frozenset[str] = frozenset(
+    step_type for step_type in _STEP_VERB_MAP if step_type.startswith("expect")
+)
+
+# 直後に expectVisible を補助挿入する候補となるステップ種別
+_EXPECT_TRIGGER_STEP_TYPES: frozenset[str] = frozenset(("click", "press"))
+
+
 # ---------------------------------------------------------------------------
 # secret 検出キーワード
 # ---------------------------------------------------------------------------
@@ -56,10 +67,9 @@ _SECRET_KEYWORDS: list[str] = [
     "api_key", "apiKey", "API_KEY",
 ]
 
-# 大文字小文字を無視した検索用パターン
-_SECRET_PATTERN = re.compile(
-    "|".join(re.escape(kw) for kw in _SECRET_KEYWORDS),
-    re.IGNORECASE,
+# 大文字小文字を無視した検索用の小文字キーワード（重複除去・順序固定）
+_SECRET_KEYWORDS_LOWER: tuple[str, ...] = tuple(
+    dict.fromkeys(kw.lower() for kw in _SECRET_KEYWORDS)
 )
 
 
@@ -82,9 +92,17 @@ _PATH_SECTION_MAP: dict[str, str] = {
     "/": "トップページ",
 }
 
-# ステップ名に使える文字（ASCII 英数字とハイフン）
+# ステップ名の最大長
 _NAME_MAX_LENGTH = 40
-_NAME_SANITIZE_PATTERN = re.compile(r"[^a-zA-Z0-9\-]")
+
+# ステップ名に使える文字（ASCII 英数字とハイフン）への変換テーブル。
+# 英数字は小文字化、ハイフンはそのまま、それ以外の ASCII 文字はハイフンに置換する
+_SANITIZE_TABLE = str.maketrans({
+    chr(code): (
+        chr(code).lower() if chr(code).isalnum() or chr(code) == "-" else "-"
+    )
+    for code in range(128)
+})
 
 
 # ---------------------------------------------------------------------------
@@ -95,11 +113,13 @@ def _get_step_type(step: dict) -> str | None:
     """ステップ dict からステップ種別名を取得する。
 
     section ステップの場合は None を返す。
+    ステップ dict は通常 1 キーのため、先頭キーだけを見て判定する。
     """
-    for key in step:
-        if key != "section":
-            return key
-    return None
+    key = next(iter(step), None)
+    if key != "section":
+        return key
+    # 先頭が section の場合のみ残りのキーを探す
+    return next((k for k in step if k != "section"), None)
 
 
 def _get_step_body(step: dict) -> dict | None:
@@ -131,6 +151,26 @@ def _extract_target_from_by(by: dict) -> str:
     return "unknown"
 
 
+def _iter_secret_hint_texts(body: dict) -> Iterator[str]:
+    """secret 検出の対象テキストを順に返す。
+
+    ステップの name フィールド、by セレクタの値（label, placeholder, name, testId, css）の順。
+    """
+    # name フィールド
+    name = body.get("name")
+    if name:
+        yield name
+
+    # by セレクタの値
+    by = body.get("by")
+    if by and isinstance(by, dict):
+        for key in ("label", "placeholder", "name", "testId", "css"):
+            val = by.get(key)
+            if val:
+                yield val
+
+
+@functools.lru_cache(maxsize=1024)
 def _sanitize_name(raw_name: str) -> str:
     """ステップ名を ASCII 英数字とハイフンのみに正規化する。
 
@@ -139,16 +179,13 @@ def _sanitize_name(raw_name: str) -> str:
     - 先頭・末尾のハイフンを除去
     - 40文字で切り詰める
     """
-    # スペースをハイフンに変換
-    name = raw_name.replace(" ", "-")
-    # 許可されない文字をハイフンに置換
-    name = _NAME_SANITIZE_PATTERN.sub("-", name)
+    # 非 ASCII 文字を "?" に落とし、変換テーブルで許可外文字のハイフン化と小文字化を一度に行う
+    name = raw_name.encode("ascii", "replace").decode("ascii").translate(_SANITIZE_TABLE)
     # 連続ハイフンを1つにまとめる
-    name = re.sub(r"-{2,}", "-", name)
+    while "--" in name:
+        name = name.replace("--", "-")
     # 先頭・末尾のハイフンを除去
     name = name.strip("-")
-    # 小文字に統一
-    name = name.lower()
     # 長さ制限
     if len(name) > _NAME_MAX_LENGTH:
         name = name[:_NAME_MAX_LENGTH].rstrip("-")
@@ -161,10 +198,8 @@ def _path_to_section_name(url: str) -> str:
     既知のパスはマッピングから取得し、
     未知のパスはパス文字列をそのままセクション名にする。
     """
-    try:
-        parsed = urlparse(url)
-        path = parsed.path.rstrip("/") or "/"
-    except Exception:
+    path = _parse_url_path(url)
+    if path is None:
         return url
 
     # 既知パスのマッピングを確認
@@ -179,11 +214,22 @@ def _path_to_section_name(url: str) -> str:
 
 def _extract_path_from_url(url: str) -> str:
     """URL からパス部分を抽出する。"""
+    path = _parse_url_path(url)
+    return url if path is None else path
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_url_path(url: str) -> str | None:
+    """URL を解析して末尾スラッシュを除いたパスを返す（解析失敗時は None）。
+
+    auto_name / auto_section で同じ URL を繰り返し解析するため、結果をキャッシュする。
+    パスは _PATH_SECTION_MAP の検索キーになるため intern しておく
+    （マップのキーはリテラルのため既に intern 済み）。
+    """
     try:
-        parsed = urlparse(url)
-        return parsed.path.rstrip("/") or "/"
+        return sys.intern(urlparse(url).path.rstrip("/") or "/")
     except Exception:
-        return url
+        return None
 
 
 # ---------------------------------------------------------------------------
@@ -223,27 +269,25 @@ class Heuristics:
         Returns:
             ヒューリスティック適用後のステップリスト
         """
-        # 1. ステップ名の自動付与
+        # 1-2. ステップ名の自動付与と secret 検出（1回の走査で行う）
         for step in steps:
             step_type = _get_step_type(step)
             if step_type is None:
                 continue
             body = step[step_type]
-            if isinstance(body, dict) and "name" not in body:
+            if not isinstance(body, dict):
+                continue
+
+            # 1. ステップ名の自動付与（secret 検出が name を参照するため先に行う）
+            if "name" not in body:
                 name = self.auto_name(step)
                 if name:
                     body["name"] = name
 
-        # 2. secret 検出
-        for step in steps:
-            step_type = _get_step_type(step)
-            if step_type is None:
-                continue
-            body = step[step_type]
-            if isinstance(body, dict) and not body.get("secret"):
-                if self.detect_secret(step):
-                    body["secret"] = True
-                    logger.info("secret 検出: %s", body.get("name", step_type))
+            # 2. secret 検出
+            if not body.get("secret") and self.detect_secret(step):
+                body["secret"] = True
+                logger.info("secret 検出: %s", body.get("name", step_type))
 
         # 3. expect 補助挿入
         if self._with_expects:
@@ -351,28 +395,12 @@ class Heuristics:
         if not isinstance(body, dict):
             return False
 
-        # 検索対象テキストを収集
-        texts_to_check: list[str] = []
-
-        # name フィールド
-        name = body.get("name")
-        if name:
-            texts_to_check.append(name)
-
-        # by セレクタの値
-        by = body.get("by")
-        if by and isinstance(by, dict):
-            for key in ("label", "placeholder", "name", "testId", "css"):
-                val = by.get(key)
-                if val:
-                    texts_to_check.append(val)
-
-        # キーワード検索
-        for text in texts_to_check:
-            if _SECRET_PATTERN.search(text):
-                return True
-
-        return False
+        # キーワード検索（各テキストは一度だけ小文字化し、最初に一致した時点で打ち切る）
+        return any(
+            kw in text
+            for text in map(str.lower, _iter_secret_hint_texts(body))
+            for kw in _SECRET_KEYWORDS_LOWER
+        )
 
     # -------------------------------------------------------------------
     # auto_section: URL パスに基づくセクション自動生成
@@ -393,57 +421,39 @@ class Heuristics:
         if len(steps) <= 5:
             return steps
 
-        # goto ステップの位置とパスを収集
-        goto_indices: list[tuple[int, str]] = []
+        # セクション境界（直前の goto とパスが異なる goto の位置）を1回の走査で収集
+        boundaries: list[int] = []
+        prev_path = None
         for i, step in enumerate(steps):
             if "goto" in step:
-                body = step["goto"]
-                url = body.get("url", "")
-                path = _extract_path_from_url(url)
-                goto_indices.append((i, path))
+                path = _extract_path_from_url(step["goto"].get("url", ""))
+                if path != prev_path:
+                    boundaries.append(i)
+                    prev_path = path
 
-        # goto が1つ以下ならセクション化不要
-        if len(goto_indices) <= 1:
+        # セクションが1つ以下ならセクション化不要
+        if len(boundaries) <= 1:
             return steps
 
-        # 重複パスを除去（連続する同じパスはスキップ）
-        unique_gotos: list[tuple[int, str]] = []
-        prev_path = None
-        for idx, path in goto_indices:
-            if path != prev_path:
-                unique_gotos.append((idx, path))
-                prev_path = path
-
-        # セクションが1つしかない場合はセクション化不要
-        if len(unique_gotos) <= 1:
-            return steps
-
-        # セクション化
-        result: list[dict] = []
-        for section_idx, (start_idx, path) in enumerate(unique_gotos):
-            # 次のセクションの開始位置を決定
-            if section_idx + 1 < len(unique_gotos):
-                end_idx = unique_gotos[section_idx + 1][0]
-            else:
-                end_idx = len(steps)
+        # goto より前のステップがある場合は先頭にそのまま残す
+        result: list[dict] = steps[:boundaries[0]]
 
+        # セクション化（各境界から次の境界の直前まで）
+        ends = boundaries[1:]
+        ends.append(len(steps))
+        for start_idx, end_idx in zip(boundaries, ends):
             section_name = _path_to_section_name(
                 steps[start_idx]["goto"].get("url", "")
             )
-            section_steps = steps[start_idx:end_idx]
 
             result.append({
                 "section": {
                     "name": section_name,
-                    "steps": section_steps,
+                    # セクション内ステップは出力用の新しいリストとして切り出す
+                    "steps": steps[start_idx:end_idx],
                 },
             })
 
-        # goto より前のステップがある場合は先頭に追加
-        if unique_gotos and unique_gotos[0][0] > 0:
-            prefix_steps = steps[:unique_gotos[0][0]]
-            result = prefix_steps + result
-
         return result
 
     # -------------------------------------------------------------------
@@ -473,11 +483,10 @@ class Heuristics:
 
             # 次のステップが expect 系かどうかを確認
             next_step = steps[i + 1] if i + 1 < len(steps) else None
-            next_is_expect = False
-            if next_step:
-                next_type = _get_step_type(next_step)
-                if next_type and next_type.startswith("expect"):
-                    next_is_expect = True
+            next_is_expect = (
+                next_step is not None
+                and _get_step_type(next_step) in _EXPECT_STEP_TYPES
+            )
 
             if not next_is_expect:
                 expect_step = self._maybe_create_expect(step, steps, i)
@@ -502,6 +511,8 @@ class Heuristics:
             expectVisible ステップ dict。挿入不要の場合は None。
         """
         step_type = _get_step_type(step)
+        if step_type not in _EXPECT_TRIGGER_STEP_TYPES:
+            return None
 
         # click（ボタン）の後に expectVisible を挿入
         if step_type == "click":
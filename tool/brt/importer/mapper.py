@@ -20,7 +20,10 @@ YAML DSL のステップリスト（dict のリスト）に変換する。
 from __future__ import annotations
 
 import logging
-from typing import Optional
+import sys
+from collections.abc import Callable, Mapping, Sequence
+from types import MappingProxyType
+from typing import Final, Optional
 
 from .py_ast_parser import RawAction
 
@@ -31,7 +34,7 @@ logger = logging.getLogger(__name__)
 # action_type → DSL ステップ名マッピング
 # ---------------------------------------------------------------------------
 
-_ACTION_TYPE_TO_DSL: dict[str, str] = {
+_ACTION_TYPE_TO_DSL: Final[Mapping[str, str]] = MappingProxyType({
     "goto": "goto",
     "click": "click",
     "dblclick": "dblclick",
@@ -46,21 +49,33 @@ _ACTION_TYPE_TO_DSL: dict[str, str] = {
     "expect_url": "expectUrl",
     "scroll": "scroll",
     "scroll_into_view": "scrollIntoView",
-}
+})
+
+
+# ---------------------------------------------------------------------------
+# DSL ステップ名 → (RawAction.args のキー, ステップ body のキー)
+# ---------------------------------------------------------------------------
+
+_STEP_ARG_KEY: Final[Mapping[str, tuple[str, str]]] = MappingProxyType({
+    "fill": ("value", "value"),
+    "press": ("key", "key"),
+    "selectOption": ("value", "value"),
+    "expectText": ("text", "text"),
+})
 
 
 # ---------------------------------------------------------------------------
 # locator_chain メソッド名 → by セレクタキーのマッピング
 # ---------------------------------------------------------------------------
 
-_LOCATOR_METHOD_TO_KEY: dict[str, str] = {
+_LOCATOR_METHOD_TO_KEY: Final[Mapping[str, str]] = MappingProxyType({
     "get_by_role": "role",
     "get_by_test_id": "testId",
     "get_by_label": "label",
     "get_by_placeholder": "placeholder",
     "get_by_text": "text",
     "locator": "css",
-}
+})
 
 
 # ---------------------------------------------------------------------------
@@ -79,16 +94,16 @@ def normalize_locator(value: str) -> str:
     Returns:
         正規化済みの locator 文字列
     """
-    if value.startswith("css="):
-        return value[len("css="):]
-    return value
+    return value.removeprefix("css=")
 
 
 # ---------------------------------------------------------------------------
 # locator_chain → by セレクタ dict 変換
 # ---------------------------------------------------------------------------
 
-def _build_by_selector(locator_chain: list[str]) -> Optional[dict]:
+def _build_by_selector(
+    locator_chain: Sequence[str], locator_kwargs: Optional[dict] = None
+) -> Optional[dict]:
     """locator_chain を by セレクタ dict に変換する。
 
     変換ルール:
@@ -107,6 +122,8 @@ def _build_by_selector(locator_chain: list[str]) -> Optional[dict]:
 
     Args:
         locator_chain: PyAstParser が生成したロケータチェーン
+        locator_kwargs: 元の型のまま保持されたロケータのキーワード引数。
+            空の場合は locator_chain 内の ``key=value`` 文字列から復元する。
 
     Returns:
         by セレクタ dict。変換できない場合は None。
@@ -130,9 +147,15 @@ def _build_by_selector(locator_chain: list[str]) -> Optional[dict]:
             return None
         by["role"] = locator_chain[1]
         # キーワード引数（name=..., exact=True 等）を処理
+        if locator_kwargs:
+            # パーサーが保持した値をそのまま使う（文字列の再解析不要）
+            by.update(locator_kwargs)
+            return by
         for item in locator_chain[2:]:
             if "=" in item:
                 kw_key, kw_value = item.split("=", 1)
+                # split で生成されたキーを intern し、by dict のキーとして共有する
+                kw_key = sys.intern(kw_key)
                 # ブール値の変換
                 if kw_value == "True":
                     by[kw_key] = True
@@ -167,6 +190,20 @@ class Mapper:
     YAML DSL で使用する dict 形式のステップリストに変換する。
     """
 
+    def __init__(self) -> None:
+        """ロケータを持たないステップの変換ハンドラ表を構築する。
+
+        表にない DSL ステップ名はロケータ付きステップとして変換する。
+        """
+        self._handlers: dict[str, Callable[[RawAction], dict]] = {
+            # goto ステップ — URL のみ
+            "goto": self._map_goto,
+            # expectUrl ステップ — URL のみ（ロケータなし）
+            "expectUrl": self._map_expect_url,
+            # scroll ステップ — deltaX / deltaY のみ（ロケータなし）
+            "scroll": self._map_scroll,
+        }
+
     def map(self, raw_actions: list[RawAction]) -> list[dict]:
         """RawAction リストを DSL ステップリストに変換する。
 
@@ -176,12 +213,12 @@ class Mapper:
         Returns:
             DSL ステップの dict リスト
         """
-        steps: list[dict] = []
-        for action in raw_actions:
-            step = self._map_single(action)
-            if step is not None:
-                steps.append(step)
-        return steps
+        map_single = self._map_single
+        return [
+            step
+            for step in map(map_single, raw_actions)
+            if step is not None
+        ]
 
     def _map_single(self, action: RawAction) -> Optional[dict]:
         """単一の RawAction を DSL ステップ dict に変換する。
@@ -201,17 +238,9 @@ class Mapper:
             )
             return None
 
-        # goto ステップ — URL のみ
-        if dsl_name == "goto":
-            return self._map_goto(action)
-
-        # expectUrl ステップ — URL のみ（ロケータなし）
-        if dsl_name == "expectUrl":
-            return self._map_expect_url(action)
-
-        # scroll ステップ — deltaX / deltaY のみ（ロケータなし）
-        if dsl_name == "scroll":
-            return self._map_scroll(action)
+        handler = self._handlers.get(dsl_name)
+        if handler is not None:
+            return handler(action)
 
         # ロケータ付きステップ
         return self._map_locator_step(dsl_name, action)
@@ -268,7 +297,7 @@ class Mapper:
         Returns:
             DSL ステップ dict。ロケータ変換に失敗した場合は None。
         """
-        by = _build_by_selector(action.locator_chain)
+        by = _build_by_selector(action.locator_chain, action.locator_kwargs)
         if by is None:
             logger.warning(
                 "行 %d: ロケータチェーンを変換できません: %s",
@@ -284,24 +313,11 @@ class Mapper:
             body["frame"] = action.frame_locator
 
         # アクション固有の引数を追加
-        if dsl_name == "fill":
-            value = action.args.get("value")
+        arg_keys = _STEP_ARG_KEY.get(dsl_name)
+        if arg_keys is not None:
+            src, dst = arg_keys
+            value = action.args.get(src)
             if value is not None:
-                body["value"] = value
-
-        elif dsl_name == "press":
-            key = action.args.get("key")
-            if key is not None:
-                body["key"] = key
-
-        elif dsl_name == "selectOption":
-            value = action.args.get("value")
-            if value is not None:
-                body["value"] = value
-
-        elif dsl_name == "expectText":
-            text = action.args.get("text")
-            if text is not None:
-                body["text"] = text
+                body[dst] = value
 
         return {dsl_name: body}
@@ -23,9 +23,13 @@ RawAction 中間表現リストに変換する。
 from __future__ import annotations
 
 import ast
+import itertools
 import logging
+import sys
+from collections.abc import Iterator, Mapping
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, Optional
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Final, Optional
 
 logger = logging.getLogger(__name__)
 
@@ -34,23 +38,39 @@ logger = logging.getLogger(__name__)
 # RawAction データクラス
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True)
 class RawAction:
     """Python AST から抽出された操作の中間表現。
 
     Attributes:
         action_type: 操作種別（"goto", "click", "fill", "expect_visible" 等）
-        locator_chain: ロケータチェーン（例: ["get_by_role", "button", "name=Submit"]）
+        locator_chain: ロケータチェーン（例: ("get_by_role", "button", "name=Submit")）
+            解析後に変更されないため tuple で保持する
         args: 操作引数（例: {"url": "...", "value": "..."}）
         line_number: 元の Python スクリプトの行番号
         frame_locator: iframe 内操作の場合、iframe のセレクタ文字列（例: "iframe"）
+        locator_kwargs: ロケータのキーワード引数を元の型のまま保持した dict
+            （例: {"name": "Submit", "exact": True}）
     """
 
     action_type: str
-    locator_chain: list[str] = field(default_factory=list)
+    locator_chain: tuple[str, ...] = field(default_factory=tuple)
     args: dict = field(default_factory=dict)
     line_number: int = 0
     frame_locator: Optional[str] = None
+    locator_kwargs: dict = field(default_factory=dict)
+
+
+# ---------------------------------------------------------------------------
+# 判定用の識別子
+# ---------------------------------------------------------------------------
+
+# ast.parse が返す識別子（Name.id / Attribute.attr）は実際には intern 済みだが、
+# 比較相手をここで sys.intern しておくことで ``is`` による比較を保証する。
+_PAGE: Final = sys.intern("page")
+_EXPECT: Final = sys.intern("expect")
+_CONTENT_FRAME: Final = sys.intern("content_frame")
+_LOCATOR: Final = sys.intern("locator")
 
 
 # ---------------------------------------------------------------------------
@@ -58,7 +78,7 @@ class RawAction:
 # ---------------------------------------------------------------------------
 
 # Playwright のロケータ生成メソッド
-_LOCATOR_METHODS = frozenset({
+_LOCATOR_METHODS: Final = frozenset({
     "get_by_role",
     "get_by_test_id",
     "get_by_label",
@@ -71,28 +91,69 @@ _LOCATOR_METHODS = frozenset({
     "last",
 })
 
-# Playwright のアクションメソッド
-_ACTION_METHODS = frozenset({
-    "click",
-    "dblclick",
-    "fill",
-    "press",
-    "check",
-    "uncheck",
-    "select_option",
-    "scroll_into_view_if_needed",
+# Playwright のアクションメソッド → action_type
+# （1 回の検索で「対応メソッドか」の判定と変換を兼ねる）
+_ACTION_METHOD_TO_TYPE: Final[Mapping[str, str]] = MappingProxyType({
+    "click": "click",
+    "dblclick": "dblclick",
+    "fill": "fill",
+    "press": "press",
+    "check": "check",
+    "uncheck": "uncheck",
+    "select_option": "select_option",
+    "scroll_into_view_if_needed": "scroll_into_view",
 })
 
-# expect のアサーションメソッド
-_EXPECT_METHODS = frozenset({
-    "to_be_visible",
-    "to_be_hidden",
-    "to_have_text",
-    "to_have_url",
-    "to_contain_text",
+# expect のアサーションメソッド → action_type
+_EXPECT_METHOD_TO_ACTION_TYPE: Final[Mapping[str, str]] = MappingProxyType({
+    "to_be_visible": "expect_visible",
+    "to_be_hidden": "expect_hidden",
+    "to_have_text": "expect_text",
+    "to_contain_text": "expect_text",
+    "to_have_url": "expect_url",
 })
 
 
+# ---------------------------------------------------------------------------
+# 式文の列挙
+# ---------------------------------------------------------------------------
+
+# 文のリストを保持するフィールド名（ソース上の出現順）。
+# ExceptHandler / match_case も body を持つため、同じ扱いで辿れる
+_BLOCK_FIELDS: Final = ("body", "handlers", "cases", "orelse", "finalbody")
+
+
+def _iter_expr_statements(tree: ast.Module) -> Iterator[ast.Expr]:
+    """モジュール内の式文（ast.Expr）をソース順に列挙する。
+
+    ast.walk のように全ノード（引数や定数を含む）を辿らず、
+    関数・with・if・try 等のブロック文の中だけを明示的なスタックで降りる。
+
+    Args:
+        tree: ast.parse() の結果
+
+    Yields:
+        式文ノード
+    """
+    stack: list[Iterator[ast.AST]] = [iter(tree.body)]
+    while stack:
+        for node in stack[-1]:
+            if isinstance(node, ast.Expr):
+                yield node
+                continue
+            blocks = [
+                block
+                for name in _BLOCK_FIELDS
+                if (block := getattr(node, name, None))
+            ]
+            if blocks:
+                # 子ブロックを先に処理し、終わったら兄弟の続きに戻る
+                stack.append(itertools.chain.from_iterable(blocks))
+                break
+        else:
+            stack.pop()
+
+
 # ---------------------------------------------------------------------------
 # PyAstParser 本体
 # ---------------------------------------------------------------------------
@@ -104,8 +165,6 @@ class PyAstParser:
     認識して RawAction 中間表現リストを生成する。
     """
 
-    _current_frame_locator: Optional[str] = None
-
     def parse(self, source: str) -> list[RawAction]:
         """Python ソースコードを解析し、RawAction リストを返す。
 
@@ -125,32 +184,40 @@ class PyAstParser:
         tree = ast.parse(source)
 
         actions: list[RawAction] = []
+        self._collect_actions(tree, actions)
+        return actions
 
-        for node in ast.walk(tree):
-            # 式文（Expression Statement）のみを対象
-            if not isinstance(node, ast.Expr):
-                continue
-
+    def _collect_actions(self, tree: ast.Module, actions: list[RawAction]) -> None:
+        """AST 内の式文を解析し、認識できた RawAction を actions に追加する。"""
+        # ループ内で繰り返し参照するメソッドをローカルに束縛しておく
+        is_expect_call = self._is_expect_call
+        parse_expect = self._parse_expect
+        parse_page_call = self._parse_page_call
+        warn_unsupported = self._warn_unsupported
+        append = actions.append
+        call_type = ast.Call
+
+        # 式文（Expression Statement）のみを対象
+        for node in _iter_expr_statements(tree):
             expr = node.value
+            if not isinstance(expr, call_type):
+                continue
 
             # expect(...) パターンの処理
-            if isinstance(expr, ast.Call) and self._is_expect_call(expr):
-                action = self._parse_expect(expr)
+            if is_expect_call(expr):
+                action = parse_expect(expr)
                 if action is not None:
-                    actions.append(action)
+                    append(action)
                 continue
 
             # page.xxx() パターンの処理
-            if isinstance(expr, ast.Call):
-                action = self._parse_page_call(expr)
-                if action is not None:
-                    actions.append(action)
-                    continue
-
-                # 未対応パターンの警告
-                self._warn_unsupported(expr)
+            action = parse_page_call(expr)
+            if action is not None:
+                append(action)
+                continue
 
-        return actions
+            # 未対応パターンの警告
+            warn_unsupported(expr)
 
     # -------------------------------------------------------------------
     # expect パターンの判定と解析
@@ -175,13 +242,13 @@ class PyAstParser:
             return False
 
         # func.attr が expect メソッド名かチェック
-        if func.attr not in _EXPECT_METHODS:
+        if func.attr not in _EXPECT_METHOD_TO_ACTION_TYPE:
             return False
 
         # func.value が expect(...) 呼び出しかチェック
         inner = func.value
         if isinstance(inner, ast.Call) and isinstance(inner.func, ast.Name):
-            return inner.func.id == "expect"
+            return inner.func.id is _EXPECT
 
         return False
 
@@ -212,22 +279,23 @@ class PyAstParser:
         inner_expr = expect_args[0]
 
         # expect(page).to_have_url("...") パターン
-        if isinstance(inner_expr, ast.Name) and inner_expr.id == "page":
+        if isinstance(inner_expr, ast.Name) and inner_expr.id is _PAGE:
             if assertion_method == "to_have_url" and node.args:
                 url = self._extract_string(node.args[0])
                 return RawAction(
                     action_type="expect_url",
-                    locator_chain=[],
+                    locator_chain=(),
                     args={"url": url} if url else {},
                     line_number=node.lineno,
                 )
             return None
 
         # expect(page.get_by_xxx(...)).to_xxx() パターン
-        # iframe 対応: _extract_locator_chain 内で _current_frame_locator が設定される
-        self._current_frame_locator = None
-        locator_chain = self._extract_locator_chain(inner_expr)
-        frame_locator = self._current_frame_locator
+        # iframe 対応: content_frame 経由の場合は frame_locator も返される
+        locator_kwargs: dict = {}
+        locator_chain, frame_locator = self._extract_locator_chain(
+            inner_expr, locator_kwargs
+        )
         if not locator_chain:
             logger.warning(
                 "行 %d: expect 内のロケータチェーンを解析できません",
@@ -251,6 +319,7 @@ class PyAstParser:
             args=args,
             line_number=node.lineno,
             frame_locator=frame_locator,
+            locator_kwargs=locator_kwargs,
         )
 
     def _expect_method_to_action_type(self, method: str) -> str:
@@ -262,14 +331,7 @@ class PyAstParser:
         Returns:
             対応する action_type 文字列
         """
-        mapping = {
-            "to_be_visible": "expect_visible",
-            "to_be_hidden": "expect_hidden",
-            "to_have_text": "expect_text",
-            "to_contain_text": "expect_text",
-            "to_have_url": "expect_url",
-        }
-        return mapping.get(method, f"expect_{method}")
+        return _EXPECT_METHOD_TO_ACTION_TYPE.get(method, f"expect_{method}")
 
     # -------------------------------------------------------------------
     # page.xxx() パターンの解析
@@ -290,23 +352,32 @@ class PyAstParser:
         Returns:
             RawAction、または解析できない場合は None
         """
-        func = node.func
-
-        # page.goto("url") — 直接メソッド呼び出し
-        if isinstance(func, ast.Attribute):
+        match node.func:
             # page.mouse.wheel(dx, dy) パターン
-            if func.attr == "wheel" and self._is_page_mouse_ref(func.value):
+            case ast.Attribute(
+                attr="wheel",
+                value=ast.Attribute(attr="mouse", value=ast.Name(id="page")),
+            ):
                 return self._parse_mouse_wheel(node)
 
             # page.goto パターン
-            if func.attr == "goto" and self._is_page_ref(func.value):
+            case ast.Attribute(attr="goto", value=ast.Name(id="page")):
+                return self._parse_goto(node)
+
+            # iframe 内の goto（page.locator("iframe").content_frame.goto）
+            case ast.Attribute(attr="goto", value=value) if (
+                self._extract_frame_locator(value) is not None
+            ):
                 return self._parse_goto(node)
 
             # page.locator(...).action() / page.get_by_xxx(...).action() パターン
-            if func.attr in _ACTION_METHODS:
-                return self._parse_locator_action(node)
+            case ast.Attribute(attr=attr) if attr in _ACTION_METHOD_TO_TYPE:
+                return self._parse_locator_action(
+                    node, _ACTION_METHOD_TO_TYPE[attr]
+                )
 
-        return None
+            case _:
+                return None
 
     def _parse_goto(self, node: ast.Call) -> Optional[RawAction]:
         """page.goto("url") パターンを解析する。
@@ -323,18 +394,21 @@ class PyAstParser:
 
         return RawAction(
             action_type="goto",
-            locator_chain=[],
+            locator_chain=(),
             args={"url": url} if url else {},
             line_number=node.lineno,
         )
 
-    def _parse_locator_action(self, node: ast.Call) -> Optional[RawAction]:
+    def _parse_locator_action(
+        self, node: ast.Call, action_type: str
+    ) -> Optional[RawAction]:
         """page.get_by_xxx(...).action() パターンを解析する。
 
         iframe 内操作（content_frame 経由）にも対応する。
 
         Args:
             node: アクション呼び出しの AST ノード
+            action_type: アクションメソッド名から変換済みの action_type
 
         Returns:
             RawAction、または解析できない場合は None
@@ -346,17 +420,14 @@ class PyAstParser:
         action_method = func.attr  # "click", "fill", "press" 等
         locator_expr = func.value  # page.get_by_xxx(...) 部分
 
-        # frame 情報をリセット
-        self._current_frame_locator = None
-
-        # ロケータチェーンを抽出（内部で _current_frame_locator が設定される）
-        locator_chain = self._extract_locator_chain(locator_expr)
+        # ロケータチェーンと iframe セレクタを抽出
+        locator_kwargs: dict = {}
+        locator_chain, frame_locator = self._extract_locator_chain(
+            locator_expr, locator_kwargs
+        )
         if not locator_chain:
             return None
 
-        # action_type を決定
-        action_type = self._action_method_to_type(action_method)
-
         # アクション引数を抽出
         args = self._extract_action_args(action_method, node)
 
@@ -365,30 +436,10 @@ class PyAstParser:
             locator_chain=locator_chain,
             args=args,
             line_number=node.lineno,
-            frame_locator=self._current_frame_locator,
+            frame_locator=frame_locator,
+            locator_kwargs=locator_kwargs,
         )
 
-    def _action_method_to_type(self, method: str) -> str:
-        """アクションメソッド名を action_type に変換する。
-
-        Args:
-            method: Playwright のアクションメソッド名
-
-        Returns:
-            対応する action_type 文字列
-        """
-        mapping = {
-            "click": "click",
-            "dblclick": "dblclick",
-            "fill": "fill",
-            "press": "press",
-            "check": "check",
-            "uncheck": "uncheck",
-            "select_option": "select_option",
-            "scroll_into_view_if_needed": "scroll_into_view",
-        }
-        return mapping.get(method, method)
-
     def _extract_action_args(self, method: str, node: ast.Call) -> dict:
         """アクションメソッドの引数を抽出する。
 
@@ -438,7 +489,7 @@ class PyAstParser:
 
         return RawAction(
             action_type="scroll",
-            locator_chain=[],
+            locator_chain=(),
             args={"deltaX": delta_x, "deltaY": delta_y},
             line_number=node.lineno,
         )
@@ -447,119 +498,119 @@ class PyAstParser:
     # ロケータチェーンの抽出
     # -------------------------------------------------------------------
 
-    def _extract_locator_chain(self, node: ast.expr) -> list[str]:
+    def _extract_locator_chain(
+        self, node: ast.expr, kwargs: dict
+    ) -> tuple[tuple[str, ...], Optional[str]]:
         """AST ノードからロケータチェーンを抽出する。
 
         page.get_by_role("button", name="Submit") のような式から
-        ["get_by_role", "button", "name=Submit"] を生成する。
+        ("get_by_role", "button", "name=Submit") を生成する。
 
         チェーンされたロケータ（例: page.locator("#parent").locator("#child")）にも対応。
         iframe 内操作（page.locator("iframe").content_frame.xxx()）にも対応。
 
         Args:
             node: ロケータ式の AST ノード
+            kwargs: ロケータのキーワード引数を元の型のまま格納する dict
 
         Returns:
-            ロケータチェーンのリスト。解析できない場合は空リスト。
+            (ロケータチェーンの tuple, iframe セレクタ) のタプル。
+            チェーンを解析できない場合は空 tuple、iframe 外の場合セレクタは None。
         """
-        chain: list[str] = []
-        self._current_frame_locator = None
-        self._collect_locator_chain(node, chain)
-        return chain
+        # 収集中はリストに追加し、確定後に tuple 化する
+        buf: list[str] = []
+        _, frame_locator = self._collect_locator_chain(node, buf, kwargs)
+        return tuple(buf), frame_locator
 
     def _collect_locator_chain(
-        self, node: ast.expr, chain: list[str]
-    ) -> bool:
-        """ロケータチェーンを再帰的に収集する。
+        self, node: ast.expr, chain: list[str], kwargs: dict
+    ) -> tuple[bool, Optional[str]]:
+        """ロケータチェーンを収集する。
 
+        page 参照に到達するまで ``func.value`` を辿り、途中のロケータ呼び出しを
+        積んでから、page 側（外側）から順にチェーンへ追加する。
         iframe 内操作（content_frame 経由）にも対応する。
 
         Args:
             node: 現在の AST ノード
             chain: 収集先のチェーンリスト
+            kwargs: キーワード引数の収集先 dict
 
         Returns:
-            収集に成功した場合 True
+            (収集に成功した場合 True, content_frame 経由の場合の iframe セレクタ)
         """
-        if not isinstance(node, ast.Call):
-            return False
-
-        func = node.func
-        if not isinstance(func, ast.Attribute):
-            return False
-
-        method_name = func.attr
+        stack: list[tuple[str, ast.Call]] = []
+        cur = node
+        while True:
+            if not isinstance(cur, ast.Call):
+                return False, None
+            func = cur.func
+            if not isinstance(func, ast.Attribute):
+                return False, None
+            method_name = func.attr
+            if method_name not in _LOCATOR_METHODS:
+                return False, None
+            stack.append((method_name, cur))
 
-        # ロケータメソッドの場合
-        if method_name in _LOCATOR_METHODS:
             # page 参照の確認（直接 or content_frame 経由）
-            if self._is_page_ref(func.value):
-                # content_frame 経由の場合、frame 情報を保持
-                frame_sel = self._extract_frame_locator(func.value)
-                if frame_sel is not None:
-                    self._current_frame_locator = frame_sel
-                # page.get_by_xxx(...) — ベースケース
-                self._append_locator_info(method_name, node, chain)
-                return True
-            elif isinstance(func.value, ast.Call):
-                # チェーンされたロケータ: page.locator(...).locator(...)
-                parent_ok = self._collect_locator_chain(func.value, chain)
-                if parent_ok:
-                    self._append_locator_info(method_name, node, chain)
-                    return True
+            base = func.value
+            if isinstance(base, ast.Name) and base.id is _PAGE:
+                frame_sel = None
+                break
+            frame_sel = self._extract_frame_locator(base)
+            if frame_sel is not None:
+                break
 
-        return False
+            # チェーンされたロケータ: page.locator(...).locator(...)
+            cur = base
+
+        for method_name, call_node in reversed(stack):
+            self._append_locator_info(method_name, call_node, chain, kwargs)
+        return True, frame_sel
 
     def _append_locator_info(
-        self, method_name: str, node: ast.Call, chain: list[str]
+        self,
+        method_name: str,
+        node: ast.Call,
+        chain: list[str],
+        kwargs: dict,
     ) -> None:
         """ロケータメソッドの情報をチェーンに追加する。
 
+        キーワード引数はチェーンに ``key=value`` 形式で追加するとともに、
+        元の型（bool / int 等）のまま kwargs にも格納する。
+
         Args:
             method_name: ロケータメソッド名
             node: 関数呼び出しの AST ノード
             chain: 追加先のチェーンリスト
+            kwargs: キーワード引数の格納先 dict
         """
-        chain.append(method_name)
-
-        # 位置引数を追加
-        for arg in node.args:
-            val = self._extract_string(arg)
-            if val is not None:
-                chain.append(val)
+        extract_string = self._extract_string
+        extract_literal = self._extract_literal
+
+        # メソッド名と位置引数をまとめて組み立て、一括で extend する
+        tokens = [method_name]
+        tokens.extend(
+            val
+            for val in map(extract_string, node.args)
+            if val is not None
+        )
 
         # キーワード引数を追加（name=..., exact=True 等）
         for kw in node.keywords:
             if kw.arg is not None:
-                val = self._extract_literal(kw.value)
+                val = extract_literal(kw.value)
                 if val is not None:
-                    chain.append(f"{kw.arg}={val}")
+                    kwargs[kw.arg] = val
+                    tokens.append(f"{kw.arg}={val}")
+
+        chain.extend(tokens)
 
     # -------------------------------------------------------------------
     # ユーティリティ
     # -------------------------------------------------------------------
 
-    def _is_page_ref(self, node: ast.expr) -> bool:
-        """ノードが page 参照（直接 or iframe content_frame 経由）かを判定する。
-
-        以下のパターンを page 参照として認識する:
-          - page（直接参照）
-          - page.locator("iframe").content_frame（iframe 内操作）
-
-        Args:
-            node: AST ノード
-
-        Returns:
-            page 参照の場合 True
-        """
-        # 直接の page 参照
-        if isinstance(node, ast.Name) and node.id == "page":
-            return True
-
-        # page.locator("iframe").content_frame パターン
-        frame_sel = self._extract_frame_locator(node)
-        return frame_sel is not None
-
     def _extract_frame_locator(self, node: ast.expr) -> Optional[str]:
         """content_frame チェーンから iframe セレクタを抽出する。
 
@@ -575,7 +626,7 @@ class PyAstParser:
         # node が content_frame プロパティアクセスかチェック
         if not isinstance(node, ast.Attribute):
             return None
-        if node.attr != "content_frame":
+        if node.attr is not _CONTENT_FRAME:
             return None
 
         # content_frame の親が page.locator("iframe") かチェック
@@ -586,7 +637,7 @@ class PyAstParser:
         func = parent.func
         if not isinstance(func, ast.Attribute):
             return None
-        if func.attr != "locator":
+        if func.attr is not _LOCATOR:
             return None
 
         # locator の親が page かチェック
@@ -601,7 +652,7 @@ class PyAstParser:
     def _is_page_name(self, node: ast.expr) -> bool:
         """ノードが 'page' 変数名への直接参照かを判定する。
 
-        _is_page_ref との違い: こちらは再帰しない（無限ループ防止）。
+        content_frame 経由の参照は含まない（無限ループ防止）。
 
         Args:
             node: AST ノード
@@ -609,16 +660,7 @@ class PyAstParser:
         Returns:
             page 変数名の場合 True
         """
-        return isinstance(node, ast.Name) and node.id == "page"
-
-    def _is_page_mouse_ref(self, node: ast.expr) -> bool:
-        """node が page.mouse を指す場合に True を返す。"""
-        return (
-            isinstance(node, ast.Attribute)
-            and node.attr == "mouse"
-            and isinstance(node.value, ast.Name)
-            and node.value.id == "page"
-        )
+        return isinstance(node, ast.Name) and node.id is _PAGE
 
     def _extract_string(self, node: ast.expr) -> Optional[str]:
         """AST ノードから文字列リテラルを抽出する。
@@ -631,36 +673,46 @@ class PyAstParser:
         Returns:
             文字列値、または文字列リテラルでない場合は None
         """
-        if isinstance(node, ast.Constant) and isinstance(node.value, str):
-            return node.value
+        if node.__class__ is ast.Constant:
+            value = node.value
+            if value.__class__ is str:
+                return value
         return None
 
-    def _extract_literal(self, node: ast.expr) -> Optional[str]:
-        """AST ノードからリテラル値を文字列として抽出する。
+    def _extract_literal(
+        self, node: ast.expr
+    ) -> Optional[str | bool | int | float]:
+        """AST ノードからリテラル値を元の型のまま抽出する。
 
         文字列、ブール値、数値に対応する。
-        キーワード引数（exact=True 等）をチェーンに含めるために使用。
+        キーワード引数（exact=True 等）の値を取り出すために使用。
 
         Args:
             node: AST ノード
 
         Returns:
-            リテラル値の文字列表現、またはリテラルでない場合は None
+            リテラル値、またはリテラルでない場合は None
         """
-        if isinstance(node, ast.Constant):
-            if isinstance(node.value, str):
-                return node.value
-            if isinstance(node.value, bool):
-                # Python の True/False をそのまま文字列化
-                return str(node.value)
-            if isinstance(node.value, (int, float)):
-                return str(node.value)
+        if node.__class__ is ast.Constant:
+            value = node.value
+            value_type = value.__class__
+            if (
+                value_type is str
+                or value_type is bool
+                or value_type is int
+                or value_type is float
+            ):
+                return value
         return None
 
     def _extract_number(self, node: ast.expr) -> Optional[int]:
         """AST ノードから int/float リテラルを int として抽出する。"""
-        if isinstance(node, ast.Constant) and isinstance(node.value, (int, float)):
-            return int(node.value)
+        if node.__class__ is ast.Constant:
+            value = node.value
+            value_type = value.__class__
+            # bool は int のサブクラスのため、従来どおり数値として扱う
+            if value_type is int or value_type is float or value_type is bool:
+                return int(value)
         return None
 
     # codegen が生成するブラウザ/コンテキスト終了処理など、
@@ -682,7 +734,7 @@ class PyAstParser:
         Args:
             node: 未対応の AST ノード
         """
-        line = getattr(node, "lineno", "?")
+        line = node.lineno
         desc = "不明な式"
 
         if isinstance(node, ast.Call):
@@ -13,19 +13,31 @@ click / fill / press / navigation イベントを捕捉する。
 
 from __future__ import annotations
 
-import json
 import logging
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Optional
 
+try:
+    # orjson があれば高速なデコーダを使う（extras: speedups）
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
 logger = logging.getLogger(__name__)
 
 # 注入スクリプトのパス
 _INJECTED_JS_PATH = Path(__file__).parent / "injected.js"
 
+# 注入スクリプト本体（静的ファイルのため import 時に 1 度だけ読み込む）。
+# 欠落していても import は失敗させず、record() 開始時にエラーとする
+try:
+    _INJECTED_JS: Optional[str] = _INJECTED_JS_PATH.read_text(encoding="utf-8")
+except OSError:
+    _INJECTED_JS = None
+
 
-@dataclass
+@dataclass(slots=True)
 class RecordedAction:
     """記録された単一のブラウザ操作。
 
@@ -65,7 +77,6 @@ class BrowserRecorder:
     def __init__(self) -> None:
         """レコーダーを初期化する。"""
         self._actions: list[RecordedAction] = []
-        self._injected_js: str = ""
         self._last_url: str = ""
 
     def record(
@@ -92,8 +103,10 @@ class BrowserRecorder:
         self._actions = []
         self._last_url = url
 
-        # 注入スクリプトを読み込み
-        self._injected_js = _INJECTED_JS_PATH.read_text(encoding="utf-8")
+        if _INJECTED_JS is None:
+            raise FileNotFoundError(
+                f"注入スクリプトが見つかりません: {_INJECTED_JS_PATH}"
+            )
 
         # 最初の goto アクションを追加
         self._actions.append(RecordedAction(
@@ -126,13 +139,8 @@ class BrowserRecorder:
             logger.info("記録開始: %s", url)
             logger.info("操作を記録中... ブラウザを閉じると記録が終了します。")
 
-            # ブラウザが閉じられるまで待機
             # context の全ページが閉じられるか、ブラウザ自体が閉じられるまで待つ
-            try:
-                # ページの close イベントを待機
-                page.wait_for_event("close", timeout=0)
-            except Exception:
-                pass
+            self._wait_until_all_pages_closed(context)
 
             # ブラウザを閉じる
             try:
@@ -159,11 +167,33 @@ class BrowserRecorder:
             pass
 
         # ページ遷移時にスクリプトを再注入
-        page.on("load", lambda: self._inject_script(page))
+        # （load イベントは Page 自身を引数に渡すため、束縛メソッドをそのまま登録する）
+        page.on("load", self._inject_script)
 
         # 初回注入
         self._inject_script(page)
 
+    def _wait_until_all_pages_closed(self, context) -> None:
+        """記録中の全ページが閉じられるまで待機する。
+
+        sync API のイベントは Playwright の呼び出し中にしか配送されないため、
+        スレッド同期ではなく、context に残っているページの close を順に待つ。
+        待機中も他タブの操作記録や新規タブの追加は処理される。
+        終了判定は context.pages の実際の状態で行う（自前のページ数は数えない）。
+
+        Args:
+            context: Playwright の BrowserContext オブジェクト
+        """
+        while True:
+            live_pages = [p for p in context.pages if not p.is_closed()]
+            if not live_pages:
+                break
+            try:
+                live_pages[-1].wait_for_event("close", timeout=0)
+            except Exception:
+                # ブラウザ自体が閉じられた場合など
+                break
+
     def _inject_script(self, page) -> None:
         """ページに記録用 JavaScript を注入する。
 
@@ -171,7 +201,7 @@ class BrowserRecorder:
             page: Playwright の Page オブジェクト
         """
         try:
-            page.evaluate(self._injected_js)
+            page.evaluate(_INJECTED_JS)
         except Exception as exc:
             logger.debug("スクリプト注入をスキップ: %s", exc)
 
@@ -182,8 +212,9 @@ class BrowserRecorder:
             data_json: JSON 形式のアクションデータ
         """
         try:
-            data = json.loads(data_json)
-        except json.JSONDecodeError:
+            data = _json_loads(data_json)
+        except ValueError:
+            # json.JSONDecodeError / orjson.JSONDecodeError はいずれも ValueError
             logger.warning("不正なアクションデータ: %s", data_json)
             return
 
@@ -206,4 +237,6 @@ class BrowserRecorder:
         )
 
         self._actions.append(action)
-        logger.debug("記録: %s %s", action_type, data.get("selector", {}))
+        # DEBUG 無効時はログ引数の組み立て自体を省く
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("記録: %s %s", action_type, action.selector or {})
@@ -10,6 +10,8 @@ Playwright codegen 互換の Python スクリプトに変換する。
 from __future__ import annotations
 
 import logging
+import sys
+from collections.abc import Callable
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -18,6 +20,55 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# ヘッダー（codegen 互換）
+_HEADER_LINES: tuple[str, ...] = (
+    "import re",
+    "from playwright.sync_api import Playwright, sync_playwright, expect",
+    "",
+    "",
+    "def run(playwright: Playwright) -> None:",
+)
+
+# フッター（codegen 互換）
+_FOOTER_LINES: tuple[str, ...] = (
+    "    page.close()",
+    "",
+    "    # ---------------------",
+    "    context.close()",
+    "    browser.close()",
+    "",
+    "",
+    "with sync_playwright() as playwright:",
+    "    run(playwright)",
+    "",
+)
+
+# この件数を超えるアクションはストリーム書き出しにする
+_STREAM_THRESHOLD = 10_000
+_STREAM_BUFFER_SIZE = 64 * 1024
+
+# 複数の値を埋め込むコード行のテンプレート（呼び出しごとに共有する定数）
+_WHEEL_FMT = "page.mouse.wheel({}, {})"
+_FILL_FMT = '{}.fill("{}")'
+_PRESS_FMT = '{}.press("{}")'
+_VALUE_LOCATOR_FMT = 'page.{}("{}")'
+_ROLE_NAME_LOCATOR_FMT = 'page.get_by_role("{}", name="{}", exact=True)'
+
+# role セレクタ種別（intern 済みの type と ``is`` で比較する）
+_SEL_ROLE = sys.intern("role")
+
+# セレクタ種別 → 値 1 つを取る Playwright locator メソッド名
+_VALUE_LOCATOR_METHODS: dict[str, str] = {
+    "testId": "get_by_test_id",
+    "label": "get_by_label",
+    "placeholder": "get_by_placeholder",
+    "text": "get_by_text",
+    "css": "locator",
+}
+
+# Python 文字列リテラル用のエスケープ表（1 パスで置換する）
+_ESCAPE_TABLE = str.maketrans({"\\": "\\\\", '"': '\\"', "\n": "\\n"})
+
 
 class ScriptWriter:
     """記録結果を Python スクリプトに変換するライター。
@@ -31,6 +82,26 @@ class ScriptWriter:
         writer.write(actions, Path("output.py"))
     """
 
+    def __init__(self) -> None:
+        """アクション種別ごとのコード生成ハンドラ表を構築する。
+
+        表にないアクション種別は出力しない。
+        """
+        # ロケータを持たないアクション
+        self._page_emitters: dict[str, Callable[[RecordedAction], str]] = {
+            "goto": self._emit_goto,
+            "scroll": self._emit_scroll,
+        }
+        # ロケータ付きアクション（生成済みの locator コードを受け取る）
+        self._locator_emitters: dict[
+            str, Callable[[str, RecordedAction], str]
+        ] = {
+            "click": self._emit_click,
+            "scrollIntoView": self._emit_scroll_into_view,
+            "fill": self._emit_fill,
+            "press": self._emit_press,
+        }
+
     def write(
         self,
         actions: list[RecordedAction],
@@ -46,11 +117,50 @@ class ScriptWriter:
             channel: ブラウザチャンネル
             viewport: ビューポートサイズ
         """
-        lines = self._build_script(actions, channel, viewport)
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        output_path.write_text("\n".join(lines), encoding="utf-8")
+        if len(actions) > _STREAM_THRESHOLD:
+            # 大量のアクションはスクリプト全体を文字列化せず逐次書き出す
+            self._write_streaming(actions, output_path, channel, viewport)
+        else:
+            lines = self._build_script(actions, channel, viewport)
+            output_path.write_text("\n".join(lines), encoding="utf-8")
         logger.info("Python script written: %s", output_path)
 
+    def _write_streaming(
+        self,
+        actions: list[RecordedAction],
+        output_path: Path,
+        channel: str,
+        viewport: tuple[int, int],
+    ) -> None:
+        """スクリプトを 1 行ずつバッファ付きストリームに書き出す。
+
+        出力内容は ``"\n".join(self._build_script(...))`` と同一。
+
+        Args:
+            actions: 記録されたアクションのリスト
+            output_path: 出力先ファイルパス
+            channel: ブラウザチャンネル
+            viewport: ビューポートサイズ
+        """
+        action_to_line = self._action_to_line
+        with output_path.open(
+            "w", encoding="utf-8", buffering=_STREAM_BUFFER_SIZE
+        ) as f:
+            write = f.write
+            write("\n".join(_HEADER_LINES))
+            for line in _launch_lines(channel, viewport):
+                write("\n")
+                write(line)
+            for action in actions:
+                line = action_to_line(action)
+                if line:
+                    write("\n    ")
+                    write(line)
+            for line in _FOOTER_LINES:
+                write("\n")
+                write(line)
+
     def _build_script(
         self,
         actions: list[RecordedAction],
@@ -67,51 +177,18 @@ class ScriptWriter:
         Returns:
             スクリプトの行リスト
         """
-        lines: list[str] = []
-
-        # ヘッダー（codegen 互換）
-        lines.append("import re")
-        lines.append(
-            "from playwright.sync_api import Playwright, "
-            "sync_playwright, expect"
-        )
-        lines.append("")
-        lines.append("")
-        lines.append("def run(playwright: Playwright) -> None:")
-
         # ブラウザ起動
-        channel_arg = (
-            f'channel="{channel}", ' if channel != "chromium" else ""
-        )
-        lines.append(
-            f"    browser = playwright.chromium.launch("
-            f"{channel_arg}headless=False)"
-        )
-        lines.append(
-            f'    context = browser.new_context('
-            f'viewport={{"width":{viewport[0]},"height":{viewport[1]}}})'
-        )
-        lines.append("    page = context.new_page()")
+        launch = _launch_lines(channel, viewport)
 
         # アクションを変換
-        for action in actions:
-            line = self._action_to_line(action)
-            if line:
-                lines.append(f"    {line}")
-
-        # フッター（codegen 互換）
-        lines.append("    page.close()")
-        lines.append("")
-        lines.append("    # ---------------------")
-        lines.append("    context.close()")
-        lines.append("    browser.close()")
-        lines.append("")
-        lines.append("")
-        lines.append("with sync_playwright() as playwright:")
-        lines.append("    run(playwright)")
-        lines.append("")
-
-        return lines
+        action_to_line = self._action_to_line
+        body = [
+            f"    {line}"
+            for line in map(action_to_line, actions)
+            if line
+        ]
+
+        return [*_HEADER_LINES, *launch, *body, *_FOOTER_LINES]
 
     def _action_to_line(self, action: RecordedAction) -> str:
         """単一アクションを Python コード行に変換する。
@@ -122,16 +199,14 @@ class ScriptWriter:
         Returns:
             Python コード行（空文字列の場合はスキップ）
         """
-        if action.action == "goto":
-            url = action.url
-            if url:
-                return f'page.goto("{_escape_string(url)}")'
-            return ""
+        # ロケータを持たないアクション（goto / scroll）
+        emit = self._page_emitters.get(action.action)
+        if emit is not None:
+            return emit(action)
 
-        if action.action == "scroll":
-            dx = int((action.selector or {}).get("deltaX", 0) if action.selector else 0)
-            dy = int((action.selector or {}).get("deltaY", 0) if action.selector else 0)
-            return f"page.mouse.wheel({dx}, {dy})"
+        emit_locator = self._locator_emitters.get(action.action)
+        if emit_locator is None:
+            return ""
 
         selector = action.selector
         if not selector:
@@ -141,22 +216,50 @@ class ScriptWriter:
         if not locator:
             return ""
 
-        if action.action == "click":
-            return f"{locator}.click()"
-
-        if action.action == "scrollIntoView":
-            return f"{locator}.scroll_into_view_if_needed()"
-
-        if action.action == "fill":
-            value = _escape_string(action.value or "")
-            return f'{locator}.fill("{value}")'
+        return emit_locator(locator, action)
 
-        if action.action == "press":
-            key = action.key or ""
-            return f'{locator}.press("{key}")'
+    # -------------------------------------------------------------------
+    # アクション別のコード生成
+    # -------------------------------------------------------------------
 
+    def _emit_goto(self, action: RecordedAction) -> str:
+        """goto アクションを page.goto(...) 行に変換する。"""
+        url = action.url
+        if url:
+            return f'page.goto("{_escape_string(url)}")'
         return ""
 
+    def _emit_scroll(self, action: RecordedAction) -> str:
+        """scroll アクションを page.mouse.wheel(...) 行に変換する。"""
+        delta = action.selector or {}
+        dx = int(delta.get("deltaX", 0))
+        dy = int(delta.get("deltaY", 0))
+        return _WHEEL_FMT.format(dx, dy)
+
+    def _emit_click(self, locator: str, action: RecordedAction) -> str:
+        """click アクションを変換する。"""
+        return f"{locator}.click()"
+
+    def _emit_scroll_into_view(
+        self, locator: str, action: RecordedAction
+    ) -> str:
+        """scrollIntoView アクションを変換する。"""
+        return f"{locator}.scroll_into_view_if_needed()"
+
+    def _emit_fill(self, locator: str, action: RecordedAction) -> str:
+        """fill アクションを変換する。"""
+        value = _escape_string(action.value or "")
+        return _FILL_FMT.format(locator, value)
+
+    def _emit_press(self, locator: str, action: RecordedAction) -> str:
+        """press アクションを変換する。"""
+        key = action.key or ""
+        return _PRESS_FMT.format(locator, key)
+
+    # -------------------------------------------------------------------
+    # セレクタ → locator コード
+    # -------------------------------------------------------------------
+
     def _selector_to_locator(self, selector: dict) -> str:
         """セレクタ辞書を Playwright locator コードに変換する。
 
@@ -166,38 +269,47 @@ class ScriptWriter:
         Returns:
             Playwright locator コード文字列
         """
-        sel_type = selector.get("type", "")
-        value = selector.get("value", "")
-
-        if sel_type == "testId":
-            return f'page.get_by_test_id("{_escape_string(value)}")'
-
-        if sel_type == "role":
+        # intern しておくと辞書検索・役割判定がポインタ比較で済む
+        # （ページから届く JSON 由来のため、文字列以外の type は未知扱い）
+        raw_type = selector.get("type")
+        sel_type = sys.intern(raw_type) if isinstance(raw_type, str) else ""
+
+        # 値 1 つだけを取る locator（testId / label / placeholder / text / css）
+        method = _VALUE_LOCATOR_METHODS.get(sel_type)
+        if method is not None:
+            value = selector.get("value", "")
+            return _VALUE_LOCATOR_FMT.format(method, _escape_string(value))
+
+        if sel_type is _SEL_ROLE:
             role = selector.get("role", "")
             name = selector.get("name")
             if name:
-                escaped_name = _escape_string(name)
-                return (
-                    f'page.get_by_role("{role}", '
-                    f'name="{escaped_name}", exact=True)'
-                )
+                return _ROLE_NAME_LOCATOR_FMT.format(role, _escape_string(name))
             return f'page.get_by_role("{role}")'
 
-        if sel_type == "label":
-            return f'page.get_by_label("{_escape_string(value)}")'
+        return ""
 
-        if sel_type == "placeholder":
-            return (
-                f'page.get_by_placeholder("{_escape_string(value)}")'
-            )
 
-        if sel_type == "text":
-            return f'page.get_by_text("{_escape_string(value)}")'
+def _launch_lines(channel: str, viewport: tuple[int, int]) -> tuple[str, ...]:
+    """ブラウザ起動〜ページ作成までのスクリプト行を返す。
 
-        if sel_type == "css":
-            return f'page.locator("{_escape_string(value)}")'
+    Args:
+        channel: ブラウザチャンネル
+        viewport: ビューポートサイズ
 
-        return ""
+    Returns:
+        スクリプト行のタプル
+    """
+    channel_arg = (
+        f'channel="{channel}", ' if channel != "chromium" else ""
+    )
+    return (
+        f"    browser = playwright.chromium.launch("
+        f"{channel_arg}headless=False)",
+        f'    context = browser.new_context('
+        f'viewport={{"width":{viewport[0]},"height":{viewport[1]}}})',
+        "    page = context.new_page()",
+    )
 
 
 def _escape_string(s: str) -> str:
@@ -209,4 +321,4 @@ def _escape_string(s: str) -> str:
     Returns:
         エスケープ済み文字列
     """
-    return s.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+    return s.translate(_ESCAPE_TABLE)
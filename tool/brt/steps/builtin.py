@@ -794,9 +794,14 @@ class AssertNoConsoleErrorHandler:
         logger.info("assertNoConsoleError")
         if context.console_errors:
             errors_text = "\n".join(context.console_errors)
+            shown = (
+                f"（直近 {len(context.console_errors)} 件を表示）"
+                if context.console_errors_dropped
+                else ""
+            )
             raise AssertionError(
-                f"ブラウザコンソールに {len(context.console_errors)} 件のエラーが検出されました:\n"
-                f"{errors_text}"
+                f"ブラウザコンソールに {context.console_error_count} 件のエラーが検出されました"
+                f"{shown}:\n{errors_text}"
             )
 
     def get_schema(self) -> type[BaseModel]:
@@ -22,6 +22,27 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# directSet 指定時に、フォーカス・クリア・入力を 1 回の evaluate で行うスクリプト。
+# React 等の制御コンポーネントでも値の変更が検知されるよう、
+# プロトタイプチェーン上の value セッターを経由して設定し input / change を発火する。
+# セッターが見つからない要素（独自要素等）では el.value への代入で代替する。
+_SET_VALUE_JS = """(el, v) => {
+  let proto = Object.getPrototypeOf(el);
+  let desc;
+  while (proto && !(desc = Object.getOwnPropertyDescriptor(proto, 'value'))) {
+    proto = Object.getPrototypeOf(proto);
+  }
+  const set = desc && desc.set
+    ? (x) => desc.set.call(el, x)
+    : (x) => { el.value = x; };
+  el.focus();
+  set('');
+  el.dispatchEvent(new Event('input', { bubbles: true }));
+  set(v);
+  el.dispatchEvent(new Event('input', { bubbles: true }));
+  el.dispatchEvent(new Event('change', { bubbles: true }));
+}"""
+
 
 # ---------------------------------------------------------------------------
 # パラメータスキーマ
@@ -33,6 +54,7 @@ class SetDatePickerParams(BaseModel):
     by: dict
     date: str
     format: str | None = None
+    directSet: bool = False
     name: str | None = None
 
 
@@ -49,6 +71,10 @@ class SetDatePickerHandler:
       3. 既存の値をクリア
       4. 日付文字列を入力
       5. Enter キーで確定
+
+    directSet: true を指定した場合は 2〜4 を 1 回の evaluate で行う。
+    Playwright の操作可能性チェックやクリックを経由しないため、
+    実際の入力操作にのみ反応するピッカーでは使用しないこと。
     """
 
     async def execute(self, page: Page, params: dict, context: StepContext) -> None:
@@ -61,12 +87,16 @@ class SetDatePickerHandler:
         # 1. 入力フィールドを特定
         locator = await _resolve_selector(page, by, context)
 
-        # 2. フォーカスしてクリア
-        await locator.click()
-        await locator.fill("")
+        if params.get("directSet", False):
+            # 2〜4. フォーカス・クリア・入力をまとめて実行（往復 1 回）
+            await locator.evaluate(_SET_VALUE_JS, date_str)
+        else:
+            # 2. フォーカスしてクリア
+            await locator.click()
+            await locator.fill("")
 
-        # 3. 日付文字列を入力
-        await locator.fill(date_str)
+            # 3. 日付文字列を入力
+            await locator.fill(date_str)
 
         # 4. Enter キーで確定（日付ピッカーを閉じる）
         await locator.press("Enter")
@@ -17,6 +17,9 @@
 from __future__ import annotations
 
 import logging
+import os
+from collections import deque
+from collections.abc import Callable
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Optional, Protocol, runtime_checkable
 
@@ -30,6 +33,35 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# True の場合、register() で StepHandler Protocol の isinstance チェックも行う
+_STRICT_PROTOCOL_CHECK = False
+
+# console_errors に保持するエラー件数の上限（環境変数で上書き可能）
+_ENV_CONSOLE_ERRORS_CAP = "BRT_CONSOLE_ERRORS_CAP"
+_DEFAULT_CONSOLE_ERRORS_CAP = 1000
+
+
+def _console_errors_cap() -> int:
+    """console_errors の上限件数を環境変数から求める。不正値は既定値に戻す。"""
+    raw = os.environ.get(_ENV_CONSOLE_ERRORS_CAP)
+    if raw is None:
+        return _DEFAULT_CONSOLE_ERRORS_CAP
+    try:
+        cap = int(raw)
+    except ValueError:
+        cap = 0
+    if cap <= 0:
+        logger.warning(
+            "%s の値が不正です（正の整数を指定してください）: %s",
+            _ENV_CONSOLE_ERRORS_CAP,
+            raw,
+        )
+        return _DEFAULT_CONSOLE_ERRORS_CAP
+    return cap
+
+
+CONSOLE_ERRORS_CAP = _console_errors_cap()
+
 
 # ---------------------------------------------------------------------------
 # ステップ実行コンテキスト
@@ -46,13 +78,43 @@ class StepContext:
         selector_resolver: セレクタを Playwright Locator に変換するリゾルバ
         variable_expander: ${env.X} / ${vars.X} の変数展開エンジン
         artifacts_manager: 成果物管理（スクリーンショット等）。None の場合は成果物なし
-        console_errors: ブラウザコンソールに出力されたエラーメッセージのリスト
+        console_errors: ブラウザコンソールに出力されたエラーメッセージ。
+            長時間の実行でも肥大化しないよう、直近 CONSOLE_ERRORS_CAP 件のみ保持する
+        console_errors_dropped: 上限超過により console_errors から破棄したエラー件数
     """
 
     selector_resolver: SelectorResolver
     variable_expander: VariableExpander
     artifacts_manager: Optional[object] = None
-    console_errors: list[str] = field(default_factory=list)
+    console_errors: deque[str] = field(
+        default_factory=lambda: deque(maxlen=CONSOLE_ERRORS_CAP)
+    )
+    console_errors_dropped: int = 0
+
+    @property
+    def console_error_count(self) -> int:
+        """破棄分を含めたコンソールエラーの総数を返す。"""
+        return len(self.console_errors) + self.console_errors_dropped
+
+    def add_console_error(self, message: str) -> None:
+        """コンソールエラーを追加する。
+
+        保持件数が上限に達している場合は最古のエラーが破棄されるため、
+        破棄件数を数え、破棄が始まった時点で一度だけ警告を出す。
+
+        Args:
+            message: エラーメッセージ
+        """
+        errors = self.console_errors
+        maxlen = getattr(errors, "maxlen", None)
+        if maxlen is not None and len(errors) >= maxlen:
+            if self.console_errors_dropped == 0:
+                logger.warning(
+                    "コンソールエラーが上限 %d 件を超えたため、古いものから破棄します",
+                    maxlen,
+                )
+            self.console_errors_dropped += 1
+        errors.append(message)
 
 
 # ---------------------------------------------------------------------------
@@ -132,6 +194,12 @@ class StepRegistry:
         """空のレジストリを初期化する。"""
         self._handlers: dict[str, StepHandler] = {}
         self._info: dict[str, StepInfo] = {}
+        # get() で使うハンドラ検索関数（属性参照と添字アクセスを 1 回の呼び出しにまとめる）
+        self._lookup: Callable[[str], StepHandler] = self._handlers.__getitem__
+        self._frozen = False
+        # list_all() / names のソート結果キャッシュ（register で無効化）
+        self._sorted_info: Optional[list[StepInfo]] = None
+        self._sorted_names: Optional[list[str]] = None
 
     def register(
         self,
@@ -151,9 +219,24 @@ class StepRegistry:
 
         Raises:
             TypeError: handler が StepHandler Protocol を満たさない場合
+            RuntimeError: freeze() 済みのレジストリに登録しようとした場合
         """
-        # Protocol 準拠チェック
-        if not isinstance(handler, StepHandler):
+        if self._frozen:
+            raise RuntimeError(
+                f"凍結済みのレジストリにはステップを登録できません: {name}"
+            )
+
+        # Protocol 準拠チェック（必要なメソッドが呼び出し可能かだけを見る軽量版。
+        # runtime_checkable Protocol の isinstance は反射を伴うため、
+        # _STRICT_PROTOCOL_CHECK が有効な場合のみ併用する）
+        if not (
+            callable(getattr(handler, "execute", None))
+            and callable(getattr(handler, "get_schema", None))
+        ) or (
+            __debug__
+            and _STRICT_PROTOCOL_CHECK
+            and not isinstance(handler, StepHandler)
+        ):
             raise TypeError(
                 f"handler は StepHandler Protocol を満たす必要があります: "
                 f"{type(handler).__name__}"
@@ -169,6 +252,8 @@ class StepRegistry:
             )
 
         self._handlers[name] = handler
+        self._sorted_info = None
+        self._sorted_names = None
 
         # メタ情報の登録
         if info is not None:
@@ -195,13 +280,24 @@ class StepRegistry:
         Raises:
             KeyError: 指定名のハンドラが未登録の場合
         """
-        if name not in self._handlers:
-            registered = ", ".join(sorted(self._handlers.keys()))
+        try:
+            return self._lookup(name)
+        except KeyError:
+            # 登録済み名の一覧は失敗時にのみ組み立てる
+            registered = ", ".join(self.names)
             raise KeyError(
                 f"ステップ '{name}' は登録されていません。"
                 f"登録済みステップ: [{registered}]"
-            )
-        return self._handlers[name]
+            ) from None
+
+    def freeze(self) -> None:
+        """レジストリを読み取り専用にする。
+
+        全ハンドラの登録後に呼び出すと、以降の register() は RuntimeError となる。
+        ハンドラ表を書き換えるのは register() のみのため、凍結フラグで変更を防げる。
+        複数のタスクからロックなしで共有する場合に使用する。
+        """
+        self._frozen = True
 
     def list_all(self) -> list[StepInfo]:
         """登録済み全ステップのメタ情報を返す。
@@ -211,7 +307,10 @@ class StepRegistry:
         Returns:
             StepInfo のリスト
         """
-        return sorted(self._info.values(), key=lambda s: s.name)
+        if self._sorted_info is None:
+            self._sorted_info = sorted(self._info.values(), key=lambda s: s.name)
+        # 呼び出し側での変更がキャッシュに波及しないようコピーを返す
+        return list(self._sorted_info)
 
     def has(self, name: str) -> bool:
         """指定名のステップが登録されているかを返す。
@@ -227,4 +326,6 @@ class StepRegistry:
     @property
     def names(self) -> list[str]:
         """登録済み全ステップ名をソート済みリストで返す。"""
-        return sorted(self._handlers.keys())
+        if self._sorted_names is None:
+            self._sorted_names = sorted(self._handlers)
+        return list(self._sorted_names)
@@ -6,14 +6,36 @@ DSL スキーマモデル（Scenario, TestIdSelector 等）はまだ実装され
 ストラテジーはファクトリ関数として定義し、インポートを遅延させている。
 """
 
+import functools
 import os
 import tempfile
 from pathlib import Path
 
 import pytest
+from hypothesis import HealthCheck, settings
 from hypothesis import strategies as st
 
 
+# ---------------------------------------------------------------------------
+# Hypothesis 設定プロファイル
+#
+# 既定では Hypothesis 標準の設定で実行する。
+# HYPOTHESIS_PROFILE=ci_fast を指定すると例数を絞り、例データベースのディスク I/O も行わない。
+# 網羅的に確認したい場合は HYPOTHESIS_PROFILE=thorough を指定する。
+# ---------------------------------------------------------------------------
+
+settings.register_profile(
+    "ci_fast",
+    max_examples=25,
+    deadline=None,
+    database=None,
+    suppress_health_check=[HealthCheck.too_slow],
+)
+settings.register_profile("thorough", max_examples=200)
+if os.environ.get("HYPOTHESIS_PROFILE"):
+    settings.load_profile(os.environ["HYPOTHESIS_PROFILE"])
+
+
 # ---------------------------------------------------------------------------
 # pytest フィクスチャ
 # ---------------------------------------------------------------------------
@@ -27,12 +49,13 @@ def tmp_dir(tmp_path: Path) -> Path:
     return tmp_path
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_scenario_dict() -> dict:
     """サンプルの Scenario 辞書データ。
 
     YAML DSL の最小構成を辞書形式で返す。
     パーサーやスキーマ検証のテストで使用する。
+    セッション全体で共有するため、変更が必要なテストは copy.deepcopy してから使うこと。
     """
     return {
         "title": "ログインフローのテスト",
@@ -81,7 +104,7 @@ def sample_scenario_dict() -> dict:
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_yaml_content() -> str:
     """サンプルの YAML DSL 文字列。
 
@@ -131,17 +154,36 @@ healing: off
 """
 
 
+@pytest.fixture(scope="session")
+def sample_scenario_parsed(sample_yaml_content: str) -> dict:
+    """sample_yaml_content を 1 回だけパースした辞書。
+
+    YAML パースのコストをセッション全体で 1 回に抑える。
+    変更が必要なテストは copy.deepcopy してから使うこと。
+    """
+    from ruamel.yaml import YAML
+
+    return YAML(typ="safe").load(sample_yaml_content)
+
+
 # ---------------------------------------------------------------------------
 # Hypothesis ストラテジー（ファクトリ関数）
 #
 # DSL スキーマモデル（Scenario, TestIdSelector 等）がまだ実装されていない
 # 可能性があるため、ストラテジーはファクトリ関数として定義する。
 # スキーマが実装された後にインポートが解決され、正しく動作する。
+#
+# ストラテジー木の構築は呼び出しごとに同じものになるため、lru_cache で
+# プロセス内に 1 回だけ構築する。pytest.skip は例外なのでキャッシュされず、
+# スキップ判定は薄い外側の関数で毎回行う。
 # ---------------------------------------------------------------------------
 
+@functools.lru_cache(maxsize=None)
 def _import_schema():
     """DSL スキーマモジュールを遅延インポートする。
 
+    失敗時の結果もキャッシュし、インポートを呼び出しごとに再試行しない。
+
     Returns:
         schema モジュール。インポートに失敗した場合は None を返す。
     """
@@ -152,6 +194,84 @@ def _import_schema():
         return None
 
 
+# --- URL / ステップ名ストラテジー（インポート時に 1 回だけ構築） ---
+#
+# from_regex は文字単位の生成で遅いため、通常は固定プールからの
+# sampled_from を使う。正規表現の定義域は slow マーカー付きテストで
+# make_regex_goto_step_strategy() を使って別途カバーする。
+
+_STEP_NAME_POOL = (
+    "click-button", "click-submit", "click-login", "click-menu-item",
+    "fill-email", "fill-password", "fill-search-box", "fill-name",
+    "open-login", "open-dashboard", "open-settings-page", "select-option",
+    "check-agree", "press-enter", "wait-loading", "verify-title",
+    "verify-redirect", "scroll-list", "hover-menu", "close-dialog",
+)
+_URL_POOL = (
+    "http://a.b", "https://x.y", "http://localhost.dev", "https://example.com",
+    "http://test.org", "https://app.io", "http://shop.jp", "https://docs.net",
+    "http://a.b/", "https://x.y/p", "http://example.com/login",
+    "https://app.io/dashboard", "http://shop.jp/cart", "https://docs.net/api",
+    "http://test.org/search", "https://example.com/settings",
+    "http://localhost.dev/home", "https://app.io/", "http://a.b/c",
+    "https://x.y/profile",
+)
+_BASE_URL_POOL = tuple(url for url in _URL_POOL if url.count("/") == 2)
+
+_STEP_NAME_ST = st.sampled_from(_STEP_NAME_POOL)
+_URL_ST = st.sampled_from(_URL_POOL)
+_BASE_URL_ST = st.sampled_from(_BASE_URL_POOL)
+
+_STEP_NAME_REGEX = r"[a-z]+-[a-z]+(-[a-z]+)?"
+_URL_REGEX = r"https?://[a-z]+\.[a-z]+(/[a-z]*)?"
+
+
+# --- 識別子・セレクタ文字列ストラテジー ---
+#
+# testId / css / role の name はテスト対象にとって意味を持たない代表値で足りるため、
+# Unicode 全域を走査する st.text ではなく固定プールから選ぶ。
+# 任意テキストの扱いは title / value / text など st.text のままのフィールドでカバーする。
+
+_ID_POOL = tuple(f"id-{i}" for i in range(32))
+_CSS_POOL = ("#a", "#b", ".c", ".d", "div > span")
+
+_ID_ST = st.sampled_from(_ID_POOL)
+_CSS_ST = st.sampled_from(_CSS_POOL)
+
+
+# --- vars ストラテジー ---
+#
+# 可変長の st.dictionaries はキーの重複排除を伴い遅いため、既知の変数名を
+# 任意キーとして持つ固定スキーマの辞書を生成する。任意キー・任意長の辞書は
+# slow マーカー付きテストで make_random_vars_strategy() を使って別途カバーする。
+
+_VARS_ST = st.fixed_dictionaries(
+    {},
+    optional={
+        "email": st.sampled_from(("a@b.c", "x@y.z")),
+        "password": st.sampled_from(("pw1", "pw2")),
+        "user": st.sampled_from(("admin", "guest")),
+    },
+)
+
+
+# --- 辞書形式セレクタストラテジー（click / fill で共有） ---
+
+_ROLE_ST = st.sampled_from(["button", "textbox", "link", "checkbox"])
+_BY_DICT_CLICK_ST = st.one_of(
+    st.fixed_dictionaries({"testId": _ID_ST}),
+    st.fixed_dictionaries({
+        "role": _ROLE_ST,
+        "name": _ID_ST,
+    }),
+    st.fixed_dictionaries({"css": _CSS_ST}),
+)
+_BY_DICT_FILL_ST = st.one_of(
+    st.fixed_dictionaries({"css": _CSS_ST}),
+    st.fixed_dictionaries({"testId": _ID_ST}),
+)
+
+
 # --- セレクタ生成ストラテジー ---
 
 def make_test_id_selector_strategy():
@@ -159,9 +279,15 @@ def make_test_id_selector_strategy():
     schema = _import_schema()
     if schema is None:
         pytest.skip("brt.dsl.schema が未実装のためスキップ")
+    return _build_test_id_selector_strategy(schema)
+
+
+@functools.lru_cache(maxsize=None)
+def _build_test_id_selector_strategy(schema):
+    """make_test_id_selector_strategy のストラテジー本体（キャッシュ対象）。"""
     return st.builds(
         schema.TestIdSelector,
-        testId=st.text(min_size=1, max_size=50),
+        testId=_ID_ST,
     )
 
 
@@ -170,9 +296,15 @@ def make_role_selector_strategy():
     schema = _import_schema()
     if schema is None:
         pytest.skip("brt.dsl.schema が未実装のためスキップ")
+    return _build_role_selector_strategy(schema)
+
+
+@functools.lru_cache(maxsize=None)
+def _build_role_selector_strategy(schema):
+    """make_role_selector_strategy のストラテジー本体（キャッシュ対象）。"""
     return st.builds(
         schema.RoleSelector,
-        role=st.sampled_from(["button", "textbox", "link", "checkbox"]),
+        role=_ROLE_ST,
         name=st.one_of(st.none(), st.text(min_size=1, max_size=50)),
     )
 
@@ -182,13 +314,20 @@ def make_css_selector_strategy():
     schema = _import_schema()
     if schema is None:
         pytest.skip("brt.dsl.schema が未実装のためスキップ")
+    return _build_css_selector_strategy(schema)
+
+
+@functools.lru_cache(maxsize=None)
+def _build_css_selector_strategy(schema):
+    """make_css_selector_strategy のストラテジー本体（キャッシュ対象）。"""
     return st.builds(
         schema.CssSelector,
-        css=st.text(min_size=1, max_size=100),
+        css=_CSS_ST,
         text=st.one_of(st.none(), st.text(min_size=1, max_size=50)),
     )
 
 
+@functools.lru_cache(maxsize=None)
 def make_by_selector_strategy():
     """BySelector（TestId / Role / Css のいずれか）を生成する Hypothesis ストラテジー。"""
     return st.one_of(
@@ -200,58 +339,80 @@ def make_by_selector_strategy():
 
 # --- ステップ名生成ストラテジー ---
 
+@functools.lru_cache(maxsize=None)
 def make_step_name_strategy():
     """動詞-目的語形式のステップ名を生成する Hypothesis ストラテジー。
 
     例: "click-button", "fill-email-field"
     """
-    return st.from_regex(r"[a-z]+-[a-z]+(-[a-z]+)?", fullmatch=True)
+    return _STEP_NAME_ST
 
 
 # --- ステップ生成ストラテジー ---
 
+@functools.lru_cache(maxsize=None)
 def make_goto_step_strategy():
     """GotoStep 用の辞書を生成する Hypothesis ストラテジー。"""
     return st.fixed_dictionaries({
         "goto": st.fixed_dictionaries({
-            "url": st.from_regex(r"https?://[a-z]+\.[a-z]+(/[a-z]*)?", fullmatch=True),
+            "url": _URL_ST,
             "name": make_step_name_strategy(),
         }),
     })
 
 
+@functools.lru_cache(maxsize=None)
+def make_regex_goto_step_strategy():
+    """正規表現ベースで GotoStep 用の辞書を生成する Hypothesis ストラテジー。
+
+    生成は遅いため、slow マーカー付きのテストでのみ使用する。
+    """
+    return st.fixed_dictionaries({
+        "goto": st.fixed_dictionaries({
+            "url": st.from_regex(_URL_REGEX, fullmatch=True),
+            "name": st.from_regex(_STEP_NAME_REGEX, fullmatch=True),
+        }),
+    })
+
+
+@functools.lru_cache(maxsize=None)
+def make_random_vars_strategy():
+    """任意キー・任意長の vars 辞書を生成する Hypothesis ストラテジー。
+
+    生成は遅いため、slow マーカー付きのテストでのみ使用する。
+    変数展開構文の検証対象にならないよう、値には "${" を含めない。
+    """
+    return st.dictionaries(
+        st.text(min_size=1, max_size=20),
+        st.text(max_size=100).filter(lambda v: "${" not in v),
+    )
+
+
 def make_click_step_strategy():
     """ClickStep 用の辞書を生成する Hypothesis ストラテジー。"""
     schema = _import_schema()
     if schema is None:
         pytest.skip("brt.dsl.schema が未実装のためスキップ")
+    return _build_click_step_strategy(schema)
 
-    # セレクタを辞書形式で生成
-    by_dict = st.one_of(
-        st.fixed_dictionaries({"testId": st.text(min_size=1, max_size=50)}),
-        st.fixed_dictionaries({
-            "role": st.sampled_from(["button", "textbox", "link", "checkbox"]),
-            "name": st.text(min_size=1, max_size=50),
-        }),
-        st.fixed_dictionaries({"css": st.text(min_size=1, max_size=100)}),
-    )
+
+@functools.lru_cache(maxsize=None)
+def _build_click_step_strategy(schema):
+    """make_click_step_strategy のストラテジー本体（キャッシュ対象）。"""
     return st.fixed_dictionaries({
         "click": st.fixed_dictionaries({
-            "by": by_dict,
+            "by": _BY_DICT_CLICK_ST,
             "name": make_step_name_strategy(),
         }),
     })
 
 
+@functools.lru_cache(maxsize=None)
 def make_fill_step_strategy():
     """FillStep 用の辞書を生成する Hypothesis ストラテジー。"""
-    by_dict = st.one_of(
-        st.fixed_dictionaries({"css": st.text(min_size=1, max_size=100)}),
-        st.fixed_dictionaries({"testId": st.text(min_size=1, max_size=50)}),
-    )
     return st.fixed_dictionaries({
         "fill": st.fixed_dictionaries({
-            "by": by_dict,
+            "by": _BY_DICT_FILL_ST,
             "value": st.text(max_size=100),
             "name": make_step_name_strategy(),
         }),
@@ -260,6 +421,7 @@ def make_fill_step_strategy():
 
 # --- Scenario 生成ストラテジー ---
 
+@functools.lru_cache(maxsize=None)
 def make_scenario_strategy():
     """Scenario を生成する Hypothesis ストラテジー。
 
@@ -280,22 +442,16 @@ def make_scenario_strategy():
         return st.builds(
             schema.Scenario,
             title=st.text(min_size=1, max_size=100),
-            baseUrl=st.from_regex(r"https?://[a-z]+\.[a-z]+", fullmatch=True),
-            vars=st.dictionaries(
-                st.text(min_size=1, max_size=20),
-                st.text(max_size=100),
-            ),
+            baseUrl=_BASE_URL_ST,
+            vars=_VARS_ST,
             steps=steps,
         )
 
     # スキーマ未実装時は辞書形式で生成
     return st.fixed_dictionaries({
         "title": st.text(min_size=1, max_size=100),
-        "baseUrl": st.from_regex(r"https?://[a-z]+\.[a-z]+", fullmatch=True),
-        "vars": st.dictionaries(
-            st.text(min_size=1, max_size=20),
-            st.text(max_size=100),
-        ),
+        "baseUrl": _BASE_URL_ST,
+        "vars": _VARS_ST,
         "steps": steps,
         "healing": st.just("off"),
     })
@@ -0,0 +1,50 @@
+"""
+AI Authoring テスト共通フィクスチャ
+
+brt.ai の import グラフ（Pydantic スキーマ・YAML・プロンプト定義）は重いため、
+テスト収集時ではなく最初に使うテストの実行時まで import を遅延する。
+"""
+
+from __future__ import annotations
+
+import json
+from types import SimpleNamespace
+from typing import TYPE_CHECKING
+
+import pytest
+
+if TYPE_CHECKING:
+    from brt.dsl.schema import Scenario
+
+
+def scenario_from_yaml(text: str) -> Scenario:
+    """YAML 文字列から Scenario を生成する。
+
+    パース結果を JSON に変換し、pydantic-core の JSON 検証経路
+    （model_validate_json）で一括検証する。
+    """
+    from ruamel.yaml import YAML
+
+    from brt.dsl.schema import Scenario
+
+    return Scenario.model_validate_json(json.dumps(YAML(typ="safe").load(text)))
+
+
+@pytest.fixture(scope="session")
+def ai() -> SimpleNamespace:
+    """brt.ai のテスト対象クラスとスキーマをまとめた名前空間を提供する。"""
+    from brt.ai.draft import AiDrafter, LlmClient
+    from brt.ai.explain import AiExplainer
+    from brt.ai.prompts import DRAFT_SYSTEM_PROMPT
+    from brt.ai.refine import AiRefiner
+    from brt.dsl.schema import Scenario
+
+    return SimpleNamespace(
+        AiDrafter=AiDrafter,
+        AiExplainer=AiExplainer,
+        AiRefiner=AiRefiner,
+        LlmClient=LlmClient,
+        Scenario=Scenario,
+        DRAFT_SYSTEM_PROMPT=DRAFT_SYSTEM_PROMPT,
+        scenario_from_yaml=scenario_from_yaml,
+    )
@@ -13,12 +13,61 @@ AiExplainer: Scenario からアウトライン（説明）を生成する機能
 
 from __future__ import annotations
 
+from types import SimpleNamespace
+from typing import TYPE_CHECKING
+
 import pytest
 
-from brt.ai.draft import AiDrafter, LlmClient
-from brt.ai.explain import AiExplainer
-from brt.ai.prompts import DRAFT_SYSTEM_PROMPT, DRAFT_USER_TEMPLATE
-from brt.dsl.schema import Scenario
+if TYPE_CHECKING:
+    from brt.dsl.schema import Scenario
+
+
+# ---------------------------------------------------------------------------
+# LLM クライアントが返す YAML（モジュール定数として 1 回だけ生成）
+# ---------------------------------------------------------------------------
+
+_VALID_YAML = """\
+title: カスタムテスト
+baseUrl: http://example.com
+vars:
+  user: admin
+artifacts:
+  screenshots:
+    mode: before_each_step
+    format: jpeg
+    quality: 70
+  trace:
+    mode: on_failure
+  video:
+    mode: on_failure
+hooks: {}
+steps:
+  - goto: http://example.com/login
+  - click:
+      by:
+        role: button
+        name: ログイン
+healing: off
+"""
+
+_CAPTURE_YAML = """\
+title: キャプチャテスト
+baseUrl: http://localhost
+vars: {}
+artifacts:
+  screenshots:
+    mode: before_each_step
+    format: jpeg
+    quality: 70
+  trace:
+    mode: on_failure
+  video:
+    mode: on_failure
+hooks: {}
+steps:
+  - goto: http://localhost/
+healing: off
+"""
 
 
 # ---------------------------------------------------------------------------
@@ -29,29 +78,7 @@ class _ValidYamlClient:
     """有効な YAML を返すカスタム LLM クライアント。"""
 
     def generate(self, system_prompt: str, user_prompt: str) -> str:
-        return (
-            "title: カスタムテスト\n"
-            "baseUrl: http://example.com\n"
-            "vars:\n"
-            "  user: admin\n"
-            "artifacts:\n"
-            "  screenshots:\n"
-            "    mode: before_each_step\n"
-            "    format: jpeg\n"
-            "    quality: 70\n"
-            "  trace:\n"
-            "    mode: on_failure\n"
-            "  video:\n"
-            "    mode: on_failure\n"
-            "hooks: {}\n"
-            "steps:\n"
-            "  - goto: http://example.com/login\n"
-            "  - click:\n"
-            "      by:\n"
-            "        role: button\n"
-            "        name: ログイン\n"
-            "healing: off\n"
-        )
+        return _VALID_YAML
 
 
 class _InvalidYamlClient:
@@ -90,24 +117,7 @@ class _PromptCapturingClient:
     def generate(self, system_prompt: str, user_prompt: str) -> str:
         self.last_system_prompt = system_prompt
         self.last_user_prompt = user_prompt
-        return (
-            "title: キャプチャテスト\n"
-            "baseUrl: http://localhost\n"
-            "vars: {}\n"
-            "artifacts:\n"
-            "  screenshots:\n"
-            "    mode: before_each_step\n"
-            "    format: jpeg\n"
-            "    quality: 70\n"
-            "  trace:\n"
-            "    mode: on_failure\n"
-            "  video:\n"
-            "    mode: on_failure\n"
-            "hooks: {}\n"
-            "steps:\n"
-            "  - goto: http://localhost/\n"
-            "healing: off\n"
-        )
+        return _CAPTURE_YAML
 
 
 # ---------------------------------------------------------------------------
@@ -117,82 +127,88 @@ class _PromptCapturingClient:
 class TestAiDrafter:
     """AiDrafter のテストクラス。"""
 
-    def test_default_stub_returns_valid_scenario(self) -> None:
+    def test_default_stub_returns_valid_scenario(self, ai: SimpleNamespace) -> None:
         """デフォルトスタブで有効な Scenario が返されること。"""
-        drafter = AiDrafter()
+        drafter = ai.AiDrafter()
         scenario = drafter.draft("ログインフローをテストする")
-        assert isinstance(scenario, Scenario)
+        assert isinstance(scenario, ai.Scenario)
 
-    def test_scenario_title_not_empty(self) -> None:
+    def test_scenario_title_not_empty(self, ai: SimpleNamespace) -> None:
         """返された Scenario の title が空でないこと。"""
-        drafter = AiDrafter()
+        drafter = ai.AiDrafter()
         scenario = drafter.draft("ログインフローをテストする")
         assert scenario.title
         assert len(scenario.title) > 0
 
-    def test_scenario_base_url_not_empty(self) -> None:
+    def test_scenario_base_url_not_empty(self, ai: SimpleNamespace) -> None:
         """返された Scenario の baseUrl が空でないこと。"""
-        drafter = AiDrafter()
+        drafter = ai.AiDrafter()
         scenario = drafter.draft("ログインフローをテストする")
         assert scenario.baseUrl
         assert len(scenario.baseUrl) > 0
 
-    def test_scenario_steps_not_empty(self) -> None:
+    def test_scenario_steps_not_empty(self, ai: SimpleNamespace) -> None:
         """返された Scenario の steps が空でないこと。"""
-        drafter = AiDrafter()
+        drafter = ai.AiDrafter()
         scenario = drafter.draft("ログインフローをテストする")
         assert len(scenario.steps) > 0
 
-    def test_custom_llm_client_injection(self) -> None:
+    def test_custom_llm_client_injection(self, ai: SimpleNamespace) -> None:
         """カスタム LLM クライアントを注入できること。"""
         client = _ValidYamlClient()
-        drafter = AiDrafter(llm_client=client)
+        drafter = ai.AiDrafter(llm_client=client)
         scenario = drafter.draft("カスタムテスト")
         assert scenario.title == "カスタムテスト"
         assert scenario.baseUrl == "http://example.com"
 
-    def test_invalid_yaml_raises_error(self) -> None:
+    def test_custom_client_result_matches_source_yaml(self, ai: SimpleNamespace) -> None:
+        """LLM が返した YAML の内容がそのまま Scenario に反映されること。"""
+        drafter = ai.AiDrafter(llm_client=_ValidYamlClient())
+        scenario = drafter.draft("カスタムテスト")
+        assert scenario == ai.scenario_from_yaml(_VALID_YAML)
+
+    def test_invalid_yaml_raises_error(self, ai: SimpleNamespace) -> None:
         """LLM が不正な YAML を返した場合に ValueError が発生すること。"""
-        drafter = AiDrafter(llm_client=_InvalidYamlClient())
+        drafter = ai.AiDrafter(llm_client=_InvalidYamlClient())
         with pytest.raises(ValueError, match="YAML パース"):
             drafter.draft("テスト仕様")
 
-    def test_empty_response_raises_error(self) -> None:
+    def test_empty_response_raises_error(self, ai: SimpleNamespace) -> None:
         """LLM が空のレスポンスを返した場合に ValueError が発生すること。"""
-        drafter = AiDrafter(llm_client=_EmptyResponseClient())
+        drafter = ai.AiDrafter(llm_client=_EmptyResponseClient())
         with pytest.raises(ValueError, match="空の YAML"):
             drafter.draft("テスト仕様")
 
-    def test_missing_fields_raises_error(self) -> None:
+    def test_missing_fields_raises_error(self, ai: SimpleNamespace) -> None:
         """必須フィールドが欠けた YAML で ValueError が発生すること。"""
-        drafter = AiDrafter(llm_client=_MissingFieldsClient())
+        drafter = ai.AiDrafter(llm_client=_MissingFieldsClient())
         with pytest.raises(ValueError, match="スキーマ検証"):
             drafter.draft("テスト仕様")
 
-    def test_prompt_template_built_correctly(self) -> None:
+    def test_prompt_template_built_correctly(self, ai: SimpleNamespace) -> None:
         """プロンプトテンプレートが正しく構築されること。"""
         client = _PromptCapturingClient()
-        drafter = AiDrafter(llm_client=client)
+        drafter = ai.AiDrafter(llm_client=client)
         spec = "ユーザーがログインできることを確認する"
         drafter.draft(spec)
 
         # システムプロンプトが DRAFT_SYSTEM_PROMPT と一致
-        assert client.last_system_prompt == DRAFT_SYSTEM_PROMPT
+        assert client.last_system_prompt == ai.DRAFT_SYSTEM_PROMPT
         # ユーザープロンプトに仕様テキストが含まれる
         assert spec in client.last_user_prompt
 
-    def test_custom_client_with_vars(self) -> None:
+    def test_custom_client_with_vars(self, ai: SimpleNamespace) -> None:
         """カスタムクライアントで vars を含む Scenario が生成されること。"""
         client = _ValidYamlClient()
-        drafter = AiDrafter(llm_client=client)
+        drafter = ai.AiDrafter(llm_client=client)
         scenario = drafter.draft("管理者ログインテスト")
         assert "user" in scenario.vars
         assert scenario.vars["user"] == "admin"
 
-    def test_llm_client_protocol_compliance(self) -> None:
+    def test_llm_client_protocol_compliance(self, ai: SimpleNamespace) -> None:
         """LlmClient Protocol に準拠したオブジェクトが受け入れられること。"""
-        assert isinstance(_ValidYamlClient(), LlmClient)
-        assert isinstance(_PromptCapturingClient(), LlmClient)
+        assert isinstance(_ValidYamlClient(), ai.LlmClient)
+        assert isinstance(_PromptCapturingClient(), ai.LlmClient)
 
 
 # ---------------------------------------------------------------------------
@@ -202,10 +218,10 @@ class TestAiDrafter:
 class TestAiExplainer:
     """AiExplainer のテストクラス。"""
 
-    @pytest.fixture()
-    def sample_scenario(self) -> Scenario:
-        """テスト用の Scenario フィクスチャ。"""
-        return Scenario(
+    @pytest.fixture(scope="session")
+    def sample_scenario(self, ai: SimpleNamespace) -> Scenario:
+        """テスト用の Scenario フィクスチャ（読み取り専用のためセッションで共有）。"""
+        return ai.Scenario(
             title="ログインフローのテスト",
             baseUrl="http://localhost:4200",
             vars={"email": "test@example.com"},
@@ -216,42 +232,50 @@ class TestAiExplainer:
             ],
         )
 
-    def test_default_stub_returns_explanation(self, sample_scenario: Scenario) -> None:
+    def test_default_stub_returns_explanation(
+        self, sample_scenario: Scenario, ai: SimpleNamespace
+    ) -> None:
         """デフォルトスタブで説明テキストが返されること。"""
-        explainer = AiExplainer()
+        explainer = ai.AiExplainer()
         result = explainer.explain(sample_scenario)
         assert isinstance(result, str)
 
-    def test_explanation_not_empty(self, sample_scenario: Scenario) -> None:
+    def test_explanation_not_empty(self, sample_scenario: Scenario, ai: SimpleNamespace) -> None:
         """説明テキストが空でないこと。"""
-        explainer = AiExplainer()
+        explainer = ai.AiExplainer()
         result = explainer.explain(sample_scenario)
         assert len(result.strip()) > 0
 
-    def test_explanation_contains_title(self, sample_scenario: Scenario) -> None:
+    def test_explanation_contains_title(
+        self, sample_scenario: Scenario, ai: SimpleNamespace
+    ) -> None:
         """Scenario のタイトルが説明に含まれること。"""
-        explainer = AiExplainer()
+        explainer = ai.AiExplainer()
         result = explainer.explain(sample_scenario)
         assert sample_scenario.title in result
 
-    def test_custom_llm_client_for_explainer(self, sample_scenario: Scenario) -> None:
+    def test_custom_llm_client_for_explainer(
+        self, sample_scenario: Scenario, ai: SimpleNamespace
+    ) -> None:
         """カスタム LLM クライアントを AiExplainer に注入できること。"""
 
         class _CustomExplainClient:
             def generate(self, system_prompt: str, user_prompt: str) -> str:
                 return "カスタム説明: テストシナリオの概要です。"
 
-        explainer = AiExplainer(llm_client=_CustomExplainClient())
+        explainer = ai.AiExplainer(llm_client=_CustomExplainClient())
         result = explainer.explain(sample_scenario)
         assert "カスタム説明" in result
 
-    def test_empty_explanation_raises_error(self, sample_scenario: Scenario) -> None:
+    def test_empty_explanation_raises_error(
+        self, sample_scenario: Scenario, ai: SimpleNamespace
+    ) -> None:
         """LLM が空の説明を返した場合に ValueError が発生すること。"""
 
         class _EmptyExplainClient:
             def generate(self, system_prompt: str, user_prompt: str) -> str:
                 return ""
 
-        explainer = AiExplainer(llm_client=_EmptyExplainClient())
+        explainer = ai.AiExplainer(llm_client=_EmptyExplainClient())
         with pytest.raises(ValueError, match="空の説明"):
             explainer.explain(sample_scenario)
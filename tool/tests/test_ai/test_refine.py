@@ -13,20 +13,25 @@ AiRefiner: 既存の YAML DSL Scenario を改善する機能を検証する。
 
 from __future__ import annotations
 
+from types import SimpleNamespace
+from typing import TYPE_CHECKING
+
 import pytest
 
-from brt.ai.refine import AiRefiner
-from brt.dsl.schema import Scenario
+if TYPE_CHECKING:
+    from brt.dsl.schema import Scenario
 
 
 # ---------------------------------------------------------------------------
 # テスト用フィクスチャ
+#
+# Scenario は読み取り専用で使うため、構築と検証はモジュールで 1 回だけ行う。
 # ---------------------------------------------------------------------------
 
-@pytest.fixture()
-def minimal_scenario() -> Scenario:
+@pytest.fixture(scope="module")
+def minimal_scenario(ai: SimpleNamespace) -> Scenario:
     """最小構成の Scenario フィクスチャ。"""
-    return Scenario(
+    return ai.Scenario(
         title="最小テスト",
         baseUrl="http://localhost:3000",
         steps=[
@@ -35,10 +40,10 @@ def minimal_scenario() -> Scenario:
     )
 
 
-@pytest.fixture()
-def scenario_with_secret() -> Scenario:
+@pytest.fixture(scope="module")
+def scenario_with_secret(ai: SimpleNamespace) -> Scenario:
     """secret: true を含む Scenario フィクスチャ。"""
-    return Scenario(
+    return ai.Scenario(
         title="ログインテスト",
         baseUrl="http://localhost:4200",
         vars={"email": "test@example.com", "password": "secret123"},
@@ -57,10 +62,23 @@ def scenario_with_secret() -> Scenario:
     )
 
 
-@pytest.fixture()
-def scenario_with_multiple_secrets() -> Scenario:
+def _fast_clone(scenario: Scenario) -> Scenario:
+    """Scenario を再検証なしで深いコピーする。
+
+    共有フィクスチャを隔離したい場面で使う。__init__ 経由の再構築と異なり
+    ステップの再検証を行わない。
+    """
+    return scenario.model_copy(deep=True)
+
+
+# scenario_with_multiple_secrets に含まれる secret: true の数（既知の正解値）
+_MULTIPLE_SECRETS_COUNT = 3
+
+
+@pytest.fixture(scope="module")
+def scenario_with_multiple_secrets(ai: SimpleNamespace) -> Scenario:
     """複数の secret: true を含む Scenario フィクスチャ。"""
-    return Scenario(
+    return ai.Scenario(
         title="複数シークレットテスト",
         baseUrl="http://localhost:4200",
         vars={"user": "admin"},
@@ -92,6 +110,45 @@ def scenario_with_multiple_secrets() -> Scenario:
     )
 
 
+# ---------------------------------------------------------------------------
+# LLM クライアントが返す YAML（モジュール定数として 1 回だけ生成）
+# ---------------------------------------------------------------------------
+
+# password の fill から secret: true が意図的に欠落している
+_SECRET_DROPPED_YAML = """\
+title: ログインテスト
+baseUrl: http://localhost:4200
+vars:
+  email: test@example.com
+  password: secret123
+artifacts:
+  screenshots:
+    mode: before_each_step
+    format: jpeg
+    quality: 70
+  trace:
+    mode: on_failure
+  video:
+    mode: on_failure
+hooks: {}
+steps:
+  - goto: http://localhost:4200/login
+  - fill:
+      by:
+        css: '#email'
+      value: test@example.com
+  - fill:
+      by:
+        css: '#password'
+      value: secret123
+  - click:
+      by:
+        role: button
+        name: ログイン
+healing: off
+"""
+
+
 # ---------------------------------------------------------------------------
 # テスト用カスタム LLM クライアント
 # ---------------------------------------------------------------------------
@@ -107,39 +164,7 @@ class _SecretDroppingClient:
     """secret フラグを削除した YAML を返す LLM クライアント。"""
 
     def generate(self, system_prompt: str, user_prompt: str) -> str:
-        return (
-            "title: ログインテスト\n"
-            "baseUrl: http://localhost:4200\n"
-            "vars:\n"
-            "  email: test@example.com\n"
-            "  password: secret123\n"
-            "artifacts:\n"
-            "  screenshots:\n"
-            "    mode: before_each_step\n"
-            "    format: jpeg\n"
-            "    quality: 70\n"
-            "  trace:\n"
-            "    mode: on_failure\n"
-            "  video:\n"
-            "    mode: on_failure\n"
-            "hooks: {}\n"
-            "steps:\n"
-            "  - goto: http://localhost:4200/login\n"
-            "  - fill:\n"
-            "      by:\n"
-            "        css: '#email'\n"
-            "      value: test@example.com\n"
-            "  - fill:\n"
-            "      by:\n"
-            "        css: '#password'\n"
-            "      value: secret123\n"
-            # secret: true が意図的に欠落
-            "  - click:\n"
-            "      by:\n"
-            "        role: button\n"
-            "        name: ログイン\n"
-            "healing: off\n"
-        )
+        return _SECRET_DROPPED_YAML
 
 
 class _PassthroughClient:
@@ -161,42 +186,42 @@ class TestAiRefiner:
     """AiRefiner のテストクラス。"""
 
     def test_default_stub_returns_valid_scenario(
-        self, minimal_scenario: Scenario
+        self, minimal_scenario: Scenario, ai: SimpleNamespace
     ) -> None:
         """デフォルトスタブで有効な Scenario が返されること。"""
-        refiner = AiRefiner()
+        refiner = ai.AiRefiner()
         result = refiner.refine(minimal_scenario)
-        assert isinstance(result, Scenario)
+        assert isinstance(result, ai.Scenario)
 
     def test_title_preserved_after_refine(
-        self, scenario_with_secret: Scenario
+        self, scenario_with_secret: Scenario, ai: SimpleNamespace
     ) -> None:
         """refine 後も title が保持されること。"""
-        refiner = AiRefiner()
+        refiner = ai.AiRefiner()
         result = refiner.refine(scenario_with_secret)
         assert result.title == scenario_with_secret.title
 
     def test_base_url_preserved_after_refine(
-        self, scenario_with_secret: Scenario
+        self, scenario_with_secret: Scenario, ai: SimpleNamespace
     ) -> None:
         """refine 後も baseUrl が保持されること。"""
-        refiner = AiRefiner()
+        refiner = ai.AiRefiner()
         result = refiner.refine(scenario_with_secret)
         assert result.baseUrl == scenario_with_secret.baseUrl
 
     def test_steps_not_empty_after_refine(
-        self, scenario_with_secret: Scenario
+        self, scenario_with_secret: Scenario, ai: SimpleNamespace
     ) -> None:
         """refine 後も steps が空でないこと。"""
-        refiner = AiRefiner()
+        refiner = ai.AiRefiner()
         result = refiner.refine(scenario_with_secret)
         assert len(result.steps) > 0
 
     def test_single_secret_flag_preserved(
-        self, scenario_with_secret: Scenario
+        self, scenario_with_secret: Scenario, ai: SimpleNamespace
     ) -> None:
         """secret: true フラグが保持されること（最重要要件）。"""
-        refiner = AiRefiner()
+        refiner = ai.AiRefiner()
         result = refiner.refine(scenario_with_secret)
 
         # refine 後のステップ内に secret: true が存在することを確認
@@ -204,67 +229,74 @@ class TestAiRefiner:
         assert secret_count >= 1, "secret: true フラグが失われています"
 
     def test_multiple_secret_flags_all_preserved(
-        self, scenario_with_multiple_secrets: Scenario
+        self, scenario_with_multiple_secrets: Scenario, ai: SimpleNamespace
     ) -> None:
         """複数の secret: true フラグが全て保持されること。"""
-        refiner = AiRefiner()
+        refiner = ai.AiRefiner()
         result = refiner.refine(scenario_with_multiple_secrets)
 
-        original_count = self._count_secrets(scenario_with_multiple_secrets)
         refined_count = self._count_secrets(result)
-        assert refined_count >= original_count, (
-            f"secret フラグが減少: {original_count} → {refined_count}"
+        assert refined_count >= _MULTIPLE_SECRETS_COUNT, (
+            f"secret フラグが減少: {_MULTIPLE_SECRETS_COUNT} → {refined_count}"
         )
 
     def test_custom_llm_client_injection(
-        self, minimal_scenario: Scenario
+        self, minimal_scenario: Scenario, ai: SimpleNamespace
     ) -> None:
         """カスタム LLM クライアントを注入できること。"""
         client = _PassthroughClient()
-        refiner = AiRefiner(llm_client=client)
+        refiner = ai.AiRefiner(llm_client=client)
         result = refiner.refine(minimal_scenario)
-        assert isinstance(result, Scenario)
+        assert isinstance(result, ai.Scenario)
 
     def test_invalid_yaml_raises_error(
-        self, minimal_scenario: Scenario
+        self, minimal_scenario: Scenario, ai: SimpleNamespace
     ) -> None:
         """LLM が不正な YAML を返した場合に ValueError が発生すること。"""
-        refiner = AiRefiner(llm_client=_InvalidYamlClient())
+        refiner = ai.AiRefiner(llm_client=_InvalidYamlClient())
         with pytest.raises(ValueError, match="YAML パース"):
             refiner.refine(minimal_scenario)
 
     def test_secret_dropping_detected(
-        self, scenario_with_secret: Scenario
+        self, scenario_with_secret: Scenario, ai: SimpleNamespace
     ) -> None:
         """secret フラグが失われた場合に ValueError が発生すること。"""
-        refiner = AiRefiner(llm_client=_SecretDroppingClient())
+        refiner = ai.AiRefiner(llm_client=_SecretDroppingClient())
         with pytest.raises(ValueError, match="secret フラグが失われました"):
             refiner.refine(scenario_with_secret)
 
     def test_refined_scenario_passes_pydantic_validation(
-        self, scenario_with_secret: Scenario
+        self, scenario_with_secret: Scenario, ai: SimpleNamespace
     ) -> None:
         """refine 後の Scenario が Pydantic 検証に成功すること。"""
-        refiner = AiRefiner()
+        refiner = ai.AiRefiner()
         result = refiner.refine(scenario_with_secret)
-        # Pydantic モデルとして再検証
-        revalidated = Scenario(**result.model_dump())
+        # シリアライズ結果を pydantic-core の JSON 検証経路で再検証
+        revalidated = ai.Scenario.model_validate_json(result.model_dump_json())
         assert revalidated.title == result.title
 
+    def test_refine_does_not_mutate_input(
+        self, scenario_with_secret: Scenario, ai: SimpleNamespace
+    ) -> None:
+        """refine が入力の Scenario を変更しないこと（共有フィクスチャの前提）。"""
+        before = _fast_clone(scenario_with_secret)
+        ai.AiRefiner().refine(scenario_with_secret)
+        assert scenario_with_secret == before
+
     def test_vars_preserved_after_refine(
-        self, scenario_with_secret: Scenario
+        self, scenario_with_secret: Scenario, ai: SimpleNamespace
     ) -> None:
         """refine 後も vars が保持されること。"""
-        refiner = AiRefiner()
+        refiner = ai.AiRefiner()
         result = refiner.refine(scenario_with_secret)
         assert "email" in result.vars
         assert "password" in result.vars
 
     def test_healing_preserved_after_refine(
-        self, minimal_scenario: Scenario
+        self, minimal_scenario: Scenario, ai: SimpleNamespace
     ) -> None:
         """refine 後も healing 設定が保持されること。"""
-        refiner = AiRefiner()
+        refiner = ai.AiRefiner()
         result = refiner.refine(minimal_scenario)
         assert result.healing == minimal_scenario.healing
 
@@ -274,23 +306,20 @@ class TestAiRefiner:
 
     @staticmethod
     def _count_secrets(scenario: Scenario) -> int:
-        """Scenario 内の secret: true の数をカウントする。"""
+        """Scenario 内の secret: true の数をカウントする。
+
+        再帰の代わりに明示的なスタックで steps 以下を 1 パスで走査する。
+        """
+        stack: list[object] = list(scenario.steps)
         count = 0
-        for step in scenario.steps:
-            count += TestAiRefiner._count_in_dict(step)
+        while stack:
+            node = stack.pop()
+            if isinstance(node, dict):
+                for key, value in node.items():
+                    if key == "secret" and value is True:
+                        count += 1
+                    else:
+                        stack.append(value)
+            elif isinstance(node, list):
+                stack.extend(node)
         return count
-
-    @staticmethod
-    def _count_in_dict(d: object) -> int:
-        """辞書を再帰的に走査し secret: true をカウントする。"""
-        if isinstance(d, dict):
-            c = 0
-            for key, value in d.items():
-                if key == "secret" and value is True:
-                    c += 1
-                else:
-                    c += TestAiRefiner._count_in_dict(value)
-            return c
-        if isinstance(d, list):
-            return sum(TestAiRefiner._count_in_dict(item) for item in d)
-        return 0
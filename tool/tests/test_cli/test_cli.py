@@ -7,15 +7,47 @@ CLI テスト — typer.testing.CliRunner を使用した CLI コマンドのテ
 from __future__ import annotations
 
 import json
+from collections.abc import Iterator
 from pathlib import Path
+from typing import TYPE_CHECKING
 from unittest.mock import MagicMock, patch
 
 import pytest
-from typer.testing import CliRunner
 
-from brt.cli import app
+try:
+    # orjson があれば高速なエンコーダを使う（extras: speedups）
+    from orjson import dumps as _dumps
+except ImportError:
+    def _dumps(obj: object) -> bytes:
+        return json.dumps(obj, ensure_ascii=False).encode("utf-8")
 
-runner = CliRunner()
+if TYPE_CHECKING:
+    import typer
+    from click.testing import Result
+    from typer.testing import CliRunner
+
+
+# ---------------------------------------------------------------------------
+# フィクスチャ
+#
+# typer と brt.cli の import グラフは重いため、収集時ではなく
+# 最初に使うテストの実行時まで遅延する。
+# ---------------------------------------------------------------------------
+
+@pytest.fixture(scope="session")
+def runner() -> CliRunner:
+    """CLI テスト用の CliRunner。"""
+    from typer.testing import CliRunner
+
+    return CliRunner()
+
+
+@pytest.fixture(scope="session")
+def app() -> typer.Typer:
+    """テスト対象の CLI アプリケーション。"""
+    from brt.cli import app
+
+    return app
 
 
 # ---------------------------------------------------------------------------
@@ -40,50 +72,111 @@ title: テスト
   invalid_indent: true
 """
 
+# ファイルへ書き出す際の再エンコードを避けるため、UTF-8 バイト列も保持する
+_VALID_YAML_B = VALID_YAML.encode("utf-8")
+_INVALID_YAML_B = INVALID_YAML.encode("utf-8")
+_MALFORMED_YAML_B = MALFORMED_YAML.encode("utf-8")
+
+
+@pytest.fixture(scope="session")
+def shared_yaml_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """セッションで共有するサンプル YAML の置き場所。"""
+    return tmp_path_factory.mktemp("shared_yaml")
+
+
+@pytest.fixture(scope="session")
+def valid_yaml(shared_yaml_dir: Path) -> Path:
+    """VALID_YAML を書き出した読み取り専用ファイル（セッションで 1 回だけ作成）。"""
+    path = shared_yaml_dir / "valid.yaml"
+    path.write_bytes(_VALID_YAML_B)
+    return path
+
+
+@pytest.fixture(scope="session")
+def invalid_yaml(shared_yaml_dir: Path) -> Path:
+    """INVALID_YAML を書き出した読み取り専用ファイル（セッションで 1 回だけ作成）。"""
+    path = shared_yaml_dir / "invalid.yaml"
+    path.write_bytes(_INVALID_YAML_B)
+    return path
+
 
 # ===========================================================================
 # 1. init コマンド
 # ===========================================================================
 
+@pytest.fixture(scope="module")
+def inited_project(
+    tmp_path_factory: pytest.TempPathFactory, runner: CliRunner, app: typer.Typer
+) -> tuple[Path, Result]:
+    """init を 1 回だけ実行したプロジェクトディレクトリと実行結果。
+
+    生成物を読むだけのテストで共有する。前提条件が異なるテストは個別に実行する。
+    """
+    path = tmp_path_factory.mktemp("inited")
+    result = runner.invoke(app, ["init", str(path)], catch_exceptions=False)
+    return path, result
+
+
+@pytest.fixture(scope="module")
+def init_root(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """init テスト用の作業ディレクトリのルート（モジュールで 1 回だけ作成）。"""
+    return tmp_path_factory.mktemp("init_root")
+
+
+@pytest.fixture
+def init_dir(init_root: Path, request: pytest.FixtureRequest) -> Path:
+    """テストごとの空ディレクトリ。init_root 配下にテスト名で作成する。"""
+    path = init_root / request.node.name
+    path.mkdir()
+    return path
+
+
 class TestInitCommand:
     """init コマンドのテスト。"""
 
-    def test_init_creates_directories(self, tmp_path: Path) -> None:
+    def test_init_creates_directories(self, inited_project: tuple[Path, Result]) -> None:
         """ディレクトリ構造（flows/, recordings/, artifacts/）が生成される。"""
-        result = runner.invoke(app, ["init", str(tmp_path)])
+        path, result = inited_project
         assert result.exit_code == 0
-        assert (tmp_path / "flows").is_dir()
-        assert (tmp_path / "recordings").is_dir()
-        assert (tmp_path / "artifacts").is_dir()
+        assert (path / "flows").is_dir()
+        assert (path / "recordings").is_dir()
+        assert (path / "artifacts").is_dir()
 
-    def test_init_creates_config_template(self, tmp_path: Path) -> None:
+    def test_init_creates_config_template(self, inited_project: tuple[Path, Result]) -> None:
         """設定ファイルテンプレート（brt.yaml）が生成される。"""
-        result = runner.invoke(app, ["init", str(tmp_path)])
+        path, result = inited_project
         assert result.exit_code == 0
-        config_path = tmp_path / "brt.yaml"
+        config_path = path / "brt.yaml"
         assert config_path.exists()
         content = config_path.read_text(encoding="utf-8")
         assert "default_base_url" in content
 
-    def test_init_does_not_overwrite_existing_config(self, tmp_path: Path) -> None:
-        """既存の brt.yaml を上書きしない。"""
-        config_path = tmp_path / "brt.yaml"
+    def test_init_does_not_overwrite_existing_config(self, init_dir: Path) -> None:
+        """既存の brt.yaml を上書きしない。
+
+        検証対象はファイルシステムのみのため、CliRunner の入出力差し替えを
+        経由せずコマンド関数を直接呼び出す。
+        """
+        from brt.cli import init
+
+        config_path = init_dir / "brt.yaml"
         config_path.write_text("custom: true", encoding="utf-8")
 
-        result = runner.invoke(app, ["init", str(tmp_path)])
-        assert result.exit_code == 0
+        init(init_dir)
         assert config_path.read_text(encoding="utf-8") == "custom: true"
 
-    def test_init_default_current_dir(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    def test_init_default_current_dir(
+        self, init_dir: Path, monkeypatch: pytest.MonkeyPatch, runner: CliRunner, app: typer.Typer
+    ) -> None:
         """引数なしでカレントディレクトリに初期化する。"""
-        monkeypatch.chdir(tmp_path)
-        result = runner.invoke(app, ["init"])
+        monkeypatch.chdir(init_dir)
+        result = runner.invoke(app, ["init"], catch_exceptions=False)
         assert result.exit_code == 0
-        assert (tmp_path / "flows").is_dir()
+        assert (init_dir / "flows").is_dir()
 
-    def test_init_output_message(self, tmp_path: Path) -> None:
+    def test_init_output_message(self, inited_project: tuple[Path, Result]) -> None:
         """初期化完了メッセージが出力される。"""
-        result = runner.invoke(app, ["init", str(tmp_path)])
+        _, result = inited_project
         assert result.exit_code == 0
         assert "プロジェクトを初期化しました" in result.output
 
@@ -95,32 +188,34 @@ class TestInitCommand:
 class TestValidateCommand:
     """validate コマンドのテスト。"""
 
-    def test_validate_valid_yaml(self, tmp_path: Path) -> None:
+    def test_validate_valid_yaml(
+        self, valid_yaml: Path, runner: CliRunner, app: typer.Typer
+    ) -> None:
         """有効な YAML で成功（終了コード 0）。"""
-        yaml_file = tmp_path / "valid.yaml"
-        yaml_file.write_text(VALID_YAML, encoding="utf-8")
-
-        result = runner.invoke(app, ["validate", str(yaml_file)])
+        result = runner.invoke(app, ["validate", str(valid_yaml)], catch_exceptions=False)
         assert result.exit_code == 0
         assert "スキーマ検証 OK" in result.output
 
-    def test_validate_invalid_yaml_schema(self, tmp_path: Path) -> None:
+    def test_validate_invalid_yaml_schema(
+        self, invalid_yaml: Path, runner: CliRunner, app: typer.Typer
+    ) -> None:
         """スキーマ違反の YAML で失敗（終了コード 1）。"""
-        yaml_file = tmp_path / "invalid.yaml"
-        yaml_file.write_text(INVALID_YAML, encoding="utf-8")
-
-        result = runner.invoke(app, ["validate", str(yaml_file)])
+        result = runner.invoke(app, ["validate", str(invalid_yaml)])
         assert result.exit_code == 1
 
-    def test_validate_nonexistent_file(self, tmp_path: Path) -> None:
+    def test_validate_nonexistent_file(
+        self, tmp_path: Path, runner: CliRunner, app: typer.Typer
+    ) -> None:
         """存在しないファイルで失敗（終了コード 1）。"""
         result = runner.invoke(app, ["validate", str(tmp_path / "missing.yaml")])
         assert result.exit_code == 1
 
-    def test_validate_malformed_yaml(self, tmp_path: Path) -> None:
+    def test_validate_malformed_yaml(
+        self, tmp_path: Path, runner: CliRunner, app: typer.Typer
+    ) -> None:
         """構文エラーの YAML で失敗（終了コード 1）。"""
         yaml_file = tmp_path / "malformed.yaml"
-        yaml_file.write_text(MALFORMED_YAML, encoding="utf-8")
+        yaml_file.write_bytes(_MALFORMED_YAML_B)
 
         result = runner.invoke(app, ["validate", str(yaml_file)])
         assert result.exit_code == 1
@@ -133,7 +228,7 @@ class TestValidateCommand:
 class TestLintCommand:
     """lint コマンドのテスト。"""
 
-    def test_lint_clean_yaml(self, tmp_path: Path) -> None:
+    def test_lint_clean_yaml(self, tmp_path: Path, runner: CliRunner, app: typer.Typer) -> None:
         """lint 問題のない YAML で成功。"""
         yaml_content = """\
 title: クリーンなシナリオ
@@ -145,11 +240,11 @@ healing: off
         yaml_file = tmp_path / "clean.yaml"
         yaml_file.write_text(yaml_content, encoding="utf-8")
 
-        result = runner.invoke(app, ["lint", str(yaml_file)])
+        result = runner.invoke(app, ["lint", str(yaml_file)], catch_exceptions=False)
         assert result.exit_code == 0
         assert "lint 問題なし" in result.output
 
-    def test_lint_with_issues(self, tmp_path: Path) -> None:
+    def test_lint_with_issues(self, tmp_path: Path, runner: CliRunner, app: typer.Typer) -> None:
         """lint 問題がある YAML で結果が出力される。"""
         # text セレクタ単体使用 → warning が出るはず
         yaml_content = """\
@@ -167,7 +262,7 @@ healing: off
         # warning/info が出力されることを確認
         assert "warning" in result.output or "info" in result.output
 
-    def test_lint_invalid_file(self, tmp_path: Path) -> None:
+    def test_lint_invalid_file(self, tmp_path: Path, runner: CliRunner, app: typer.Typer) -> None:
         """存在しないファイルで失敗。"""
         result = runner.invoke(app, ["lint", str(tmp_path / "missing.yaml")])
         assert result.exit_code == 1
@@ -177,27 +272,29 @@ healing: off
 # 4. list-steps コマンド
 # ===========================================================================
 
+@pytest.fixture(scope="class")
+def list_steps_output(runner: CliRunner, app: typer.Typer) -> str:
+    """list-steps を 1 回だけ実行した出力（クラス内の各テストで共有する）。"""
+    result = runner.invoke(app, ["list-steps"], catch_exceptions=False)
+    assert result.exit_code == 0
+    return result.output
+
+
 class TestListStepsCommand:
     """list-steps コマンドのテスト。"""
 
-    def test_list_steps_output(self) -> None:
+    def test_list_steps_output(self, list_steps_output: str) -> None:
         """ステップ一覧が出力される。"""
-        result = runner.invoke(app, ["list-steps"])
-        assert result.exit_code == 0
-        assert "合計:" in result.output
+        assert "合計:" in list_steps_output
 
-    def test_list_steps_contains_builtin(self) -> None:
+    def test_list_steps_contains_builtin(self, list_steps_output: str) -> None:
         """組み込みステップ（click, fill 等）が含まれる。"""
-        result = runner.invoke(app, ["list-steps"])
-        assert result.exit_code == 0
-        assert "click" in result.output
-        assert "fill" in result.output
+        assert "click" in list_steps_output
+        assert "fill" in list_steps_output
 
-    def test_list_steps_contains_high_level(self) -> None:
+    def test_list_steps_contains_high_level(self, list_steps_output: str) -> None:
         """高レベルステップ（selectOverlayOption 等）が含まれる。"""
-        result = runner.invoke(app, ["list-steps"])
-        assert result.exit_code == 0
-        assert "selectOverlayOption" in result.output
+        assert "selectOverlayOption" in list_steps_output
 
 
 # ===========================================================================
@@ -207,7 +304,7 @@ class TestListStepsCommand:
 class TestImportFlowCommand:
     """import-flow コマンドのテスト。"""
 
-    def test_import_flow_basic(self, tmp_path: Path) -> None:
+    def test_import_flow_basic(self, tmp_path: Path, runner: CliRunner, app: typer.Typer) -> None:
         """Python → YAML 変換が動作する。"""
         # 最小限の Playwright codegen 出力
         py_source = """\
@@ -222,12 +319,14 @@ page.get_by_role("button", name="Submit").click()
         result = runner.invoke(app, [
             "import-flow", str(py_file),
             "-o", str(output_file),
-        ])
+        ], catch_exceptions=False)
         assert result.exit_code == 0
         assert output_file.exists()
         assert "変換完了" in result.output
 
-    def test_import_flow_nonexistent_file(self, tmp_path: Path) -> None:
+    def test_import_flow_nonexistent_file(
+        self, tmp_path: Path, runner: CliRunner, app: typer.Typer
+    ) -> None:
         """存在しないファイルで失敗。"""
         output_file = tmp_path / "output.yaml"
         result = runner.invoke(app, [
@@ -236,7 +335,9 @@ page.get_by_role("button", name="Submit").click()
         ])
         assert result.exit_code == 1
 
-    def test_import_flow_with_expects(self, tmp_path: Path) -> None:
+    def test_import_flow_with_expects(
+        self, tmp_path: Path, runner: CliRunner, app: typer.Typer
+    ) -> None:
         """--with-expects オプションが動作する。"""
         py_source = """\
 page.goto("http://localhost:3000/")
@@ -250,7 +351,7 @@ page.get_by_role("button", name="Submit").click()
             "import-flow", str(py_file),
             "-o", str(output_file),
             "--with-expects",
-        ])
+        ], catch_exceptions=False)
         assert result.exit_code == 0
         assert output_file.exists()
 
@@ -263,11 +364,11 @@ class TestRecordCommand:
     """record コマンドのテスト（subprocess をモック）。"""
 
     @patch("subprocess.run")
-    def test_record_basic(self, mock_run: MagicMock) -> None:
+    def test_record_basic(self, mock_run: MagicMock, runner: CliRunner, app: typer.Typer) -> None:
         """基本的な record コマンドが subprocess を呼ぶ。"""
         mock_run.return_value = MagicMock(returncode=0)
 
-        result = runner.invoke(app, ["record", "http://localhost:3000"])
+        result = runner.invoke(app, ["record", "http://localhost:3000"], catch_exceptions=False)
         assert result.exit_code == 0
         mock_run.assert_called_once()
         cmd = mock_run.call_args[0][0]
@@ -276,7 +377,9 @@ class TestRecordCommand:
         assert "http://localhost:3000" in cmd
 
     @patch("subprocess.run")
-    def test_record_with_output(self, mock_run: MagicMock, tmp_path: Path) -> None:
+    def test_record_with_output(
+        self, mock_run: MagicMock, tmp_path: Path, runner: CliRunner, app: typer.Typer
+    ) -> None:
         """--output オプションが subprocess に渡される。"""
         mock_run.return_value = MagicMock(returncode=0)
         output_file = tmp_path / "recordings" / "raw.py"
@@ -284,14 +387,16 @@ class TestRecordCommand:
         result = runner.invoke(app, [
             "record", "http://localhost:3000",
             "--output", str(output_file),
-        ])
+        ], catch_exceptions=False)
         assert result.exit_code == 0
         cmd = mock_run.call_args[0][0]
         assert "--output" in cmd
         assert str(output_file) in cmd
 
     @patch("subprocess.run")
-    def test_record_failure_propagates_exit_code(self, mock_run: MagicMock) -> None:
+    def test_record_failure_propagates_exit_code(
+        self, mock_run: MagicMock, runner: CliRunner, app: typer.Typer
+    ) -> None:
         """subprocess の失敗が終了コードに反映される。"""
         mock_run.return_value = MagicMock(returncode=1)
 
@@ -303,62 +408,50 @@ class TestRecordCommand:
 # 7. run コマンド
 # ===========================================================================
 
-class TestRunCommand:
-    """run コマンドのテスト（Runner をモック）。"""
-
-    def test_run_success(self, tmp_path: Path) -> None:
-        """成功するシナリオ実行で終了コード 0。"""
-        yaml_file = tmp_path / "scenario.yaml"
-        yaml_file.write_text(VALID_YAML, encoding="utf-8")
-
-        from brt.core.runner import ScenarioResult
-
-        mock_result = ScenarioResult(
-            scenario_title="テストシナリオ",
-            status="passed",
-            duration_ms=100.0,
-        )
-
-        # 遅延インポート先のモジュールをモック
-        with patch("brt.steps.create_full_registry") as mock_registry, \
-             patch("brt.core.runner.Runner") as MockRunner:
-            mock_runner_instance = MockRunner.return_value
-
-            async def mock_run(*args, **kwargs):
-                return mock_result
+@pytest.fixture(scope="class")
+def runner_patches() -> Iterator[MagicMock]:
+    """brt.core.runner.Runner をクラス単位で一度だけモックに差し替える。
 
-            mock_runner_instance.run = mock_run
+    レジストリは実物を使う（構築は軽量）ため、ここでは Runner のみを差し替える。
+    """
+    with patch("brt.core.runner.Runner") as MockRunner:
+        yield MockRunner
 
-            result = runner.invoke(app, ["run", str(yaml_file)])
-            assert result.exit_code == 0
-            assert "passed" in result.output
 
-    def test_run_failure(self, tmp_path: Path) -> None:
-        """失敗するシナリオ実行で終了コード 1。"""
-        yaml_file = tmp_path / "scenario.yaml"
-        yaml_file.write_text(VALID_YAML, encoding="utf-8")
+class TestRunCommand:
+    """run コマンドのテスト（Runner をモック）。"""
 
+    @pytest.mark.parametrize(("status", "expected_exit"), [("passed", 0), ("failed", 1)])
+    def test_run_status(
+        self,
+        valid_yaml: Path,
+        runner: CliRunner,
+        app: typer.Typer,
+        runner_patches: MagicMock,
+        status: str,
+        expected_exit: int,
+    ) -> None:
+        """シナリオの実行結果に応じた終了コードになること。"""
         from brt.core.runner import ScenarioResult
 
         mock_result = ScenarioResult(
             scenario_title="テストシナリオ",
-            status="failed",
+            status=status,
             duration_ms=100.0,
         )
 
-        with patch("brt.steps.create_full_registry") as mock_registry, \
-             patch("brt.core.runner.Runner") as MockRunner:
-            mock_runner_instance = MockRunner.return_value
-
-            async def mock_run(*args, **kwargs):
-                return mock_result
+        async def mock_run(*args, **kwargs):
+            return mock_result
 
-            mock_runner_instance.run = mock_run
+        runner_patches.return_value.run = mock_run
 
-            result = runner.invoke(app, ["run", str(yaml_file)])
-            assert result.exit_code == 1
+        result = runner.invoke(app, ["run", str(valid_yaml)], catch_exceptions=False)
+        assert result.exit_code == expected_exit
+        assert status in result.output
 
-    def test_run_nonexistent_file(self, tmp_path: Path) -> None:
+    def test_run_nonexistent_file(
+        self, tmp_path: Path, runner: CliRunner, app: typer.Typer
+    ) -> None:
         """存在しないファイルで失敗。"""
         result = runner.invoke(app, ["run", str(tmp_path / "missing.yaml")])
         assert result.exit_code == 1
@@ -368,42 +461,46 @@ class TestRunCommand:
 # 8. report コマンド
 # ===========================================================================
 
+_REPORT_DATA = {
+    "title": "テストシナリオ",
+    "status": "passed",
+    "duration_ms": 1234.5,
+    "started_at": "2024-01-01T00:00:00",
+    "finished_at": "2024-01-01T00:00:01",
+    "steps": [
+        {
+            "step_name": "goto",
+            "step_type": "goto",
+            "step_index": 0,
+            "status": "passed",
+            "duration_ms": 100.0,
+            "error": None,
+            "section": None,
+        },
+    ],
+    "summary": {"total": 1, "passed": 1, "failed": 0, "skipped": 0},
+}
+
+# テストごとの JSON エンコードを避けるため、report.json のバイト列を一度だけ生成する
+_REPORT_JSON_BYTES = _dumps(_REPORT_DATA)
+
+
 class TestReportCommand:
     """report コマンドのテスト。"""
 
-    def test_report_generates_html(self, tmp_path: Path) -> None:
+    def test_report_generates_html(
+        self, tmp_path: Path, runner: CliRunner, app: typer.Typer
+    ) -> None:
         """report.json から HTML レポートが再生成される。"""
-        # report.json を作成
-        report_data = {
-            "title": "テストシナリオ",
-            "status": "passed",
-            "duration_ms": 1234.5,
-            "started_at": "2024-01-01T00:00:00",
-            "finished_at": "2024-01-01T00:00:01",
-            "steps": [
-                {
-                    "step_name": "goto",
-                    "step_type": "goto",
-                    "step_index": 0,
-                    "status": "passed",
-                    "duration_ms": 100.0,
-                    "error": None,
-                    "section": None,
-                },
-            ],
-            "summary": {"total": 1, "passed": 1, "failed": 0, "skipped": 0},
-        }
         report_json = tmp_path / "report.json"
-        report_json.write_text(
-            json.dumps(report_data, ensure_ascii=False), encoding="utf-8",
-        )
+        report_json.write_bytes(_REPORT_JSON_BYTES)
 
-        result = runner.invoke(app, ["report", str(tmp_path)])
+        result = runner.invoke(app, ["report", str(tmp_path)], catch_exceptions=False)
         assert result.exit_code == 0
         assert "HTML レポートを生成しました" in result.output
         assert (tmp_path / "report.html").exists()
 
-    def test_report_missing_json(self, tmp_path: Path) -> None:
+    def test_report_missing_json(self, tmp_path: Path, runner: CliRunner, app: typer.Typer) -> None:
         """report.json が存在しない場合に失敗。"""
         result = runner.invoke(app, ["report", str(tmp_path)])
         assert result.exit_code == 1
@@ -417,7 +514,7 @@ class TestReportCommand:
 class TestAiDraftCommand:
     """ai draft コマンドのテスト。"""
 
-    def test_ai_draft_from_text(self, tmp_path: Path) -> None:
+    def test_ai_draft_from_text(self, tmp_path: Path, runner: CliRunner, app: typer.Typer) -> None:
         """テキスト仕様からドラフトが生成される。"""
         output_file = tmp_path / "draft.yaml"
 
@@ -425,12 +522,12 @@ class TestAiDraftCommand:
             "ai", "draft",
             "ログインページのテスト",
             "-o", str(output_file),
-        ])
+        ], catch_exceptions=False)
         assert result.exit_code == 0
         assert output_file.exists()
         assert "ドラフトを生成しました" in result.output
 
-    def test_ai_draft_from_file(self, tmp_path: Path) -> None:
+    def test_ai_draft_from_file(self, tmp_path: Path, runner: CliRunner, app: typer.Typer) -> None:
         """ファイルから仕様を読み込んでドラフトが生成される。"""
         spec_file = tmp_path / "spec.txt"
         spec_file.write_text("ログインフローのテスト仕様", encoding="utf-8")
@@ -440,7 +537,7 @@ class TestAiDraftCommand:
             "ai", "draft",
             str(spec_file),
             "-o", str(output_file),
-        ])
+        ], catch_exceptions=False)
         assert result.exit_code == 0
         assert output_file.exists()
 
@@ -452,22 +549,24 @@ class TestAiDraftCommand:
 class TestAiRefineCommand:
     """ai refine コマンドのテスト。"""
 
-    def test_ai_refine_basic(self, tmp_path: Path) -> None:
+    def test_ai_refine_basic(
+        self, tmp_path: Path, valid_yaml: Path, runner: CliRunner, app: typer.Typer
+    ) -> None:
         """リファイン処理が動作する。"""
-        yaml_file = tmp_path / "scenario.yaml"
-        yaml_file.write_text(VALID_YAML, encoding="utf-8")
         output_file = tmp_path / "refined.yaml"
 
         result = runner.invoke(app, [
             "ai", "refine",
-            str(yaml_file),
+            str(valid_yaml),
             "-o", str(output_file),
-        ])
+        ], catch_exceptions=False)
         assert result.exit_code == 0
         assert output_file.exists()
         assert "リファイン完了" in result.output
 
-    def test_ai_refine_nonexistent_file(self, tmp_path: Path) -> None:
+    def test_ai_refine_nonexistent_file(
+        self, tmp_path: Path, runner: CliRunner, app: typer.Typer
+    ) -> None:
         """存在しないファイルで失敗。"""
         output_file = tmp_path / "refined.yaml"
         result = runner.invoke(app, [
@@ -485,20 +584,19 @@ class TestAiRefineCommand:
 class TestAiExplainCommand:
     """ai explain コマンドのテスト。"""
 
-    def test_ai_explain_basic(self, tmp_path: Path) -> None:
+    def test_ai_explain_basic(self, valid_yaml: Path, runner: CliRunner, app: typer.Typer) -> None:
         """説明生成が動作する。"""
-        yaml_file = tmp_path / "scenario.yaml"
-        yaml_file.write_text(VALID_YAML, encoding="utf-8")
-
         result = runner.invoke(app, [
             "ai", "explain",
-            str(yaml_file),
-        ])
+            str(valid_yaml),
+        ], catch_exceptions=False)
         assert result.exit_code == 0
         # スタブクライアントが返す説明テキストが出力される
         assert "テストシナリオ" in result.output or "シナリオ" in result.output
 
-    def test_ai_explain_nonexistent_file(self, tmp_path: Path) -> None:
+    def test_ai_explain_nonexistent_file(
+        self, tmp_path: Path, runner: CliRunner, app: typer.Typer
+    ) -> None:
         """存在しないファイルで失敗。"""
         result = runner.invoke(app, [
             "ai", "explain",
@@ -514,25 +612,31 @@ class TestAiExplainCommand:
 class TestExitCodes:
     """終了コードの統一テスト。"""
 
-    def test_success_exit_code_zero(self, tmp_path: Path) -> None:
+    def test_success_exit_code_zero(
+        self, tmp_path: Path, runner: CliRunner, app: typer.Typer
+    ) -> None:
         """成功時は終了コード 0。"""
-        result = runner.invoke(app, ["init", str(tmp_path)])
+        result = runner.invoke(app, ["init", str(tmp_path)], catch_exceptions=False)
         assert result.exit_code == 0
 
-    def test_failure_exit_code_one_validate(self, tmp_path: Path) -> None:
+    def test_failure_exit_code_one_validate(
+        self, invalid_yaml: Path, runner: CliRunner, app: typer.Typer
+    ) -> None:
         """validate 失敗時は終了コード 1。"""
-        yaml_file = tmp_path / "bad.yaml"
-        yaml_file.write_text(INVALID_YAML, encoding="utf-8")
-        result = runner.invoke(app, ["validate", str(yaml_file)])
+        result = runner.invoke(app, ["validate", str(invalid_yaml)])
         assert result.exit_code == 1
 
-    def test_failure_exit_code_one_missing_file(self, tmp_path: Path) -> None:
+    def test_failure_exit_code_one_missing_file(
+        self, tmp_path: Path, runner: CliRunner, app: typer.Typer
+    ) -> None:
         """存在しないファイル指定時は終了コード 1。"""
         result = runner.invoke(app, ["validate", str(tmp_path / "nope.yaml")])
         assert result.exit_code == 1
 
     @patch("subprocess.run")
-    def test_record_exit_code_propagation(self, mock_run: MagicMock) -> None:
+    def test_record_exit_code_propagation(
+        self, mock_run: MagicMock, runner: CliRunner, app: typer.Typer
+    ) -> None:
         """record コマンドは subprocess の終了コードを伝播する。"""
         mock_run.return_value = MagicMock(returncode=2)
         result = runner.invoke(app, ["record", "http://example.com"])
@@ -546,16 +650,18 @@ class TestExitCodes:
 class TestErrorOutput:
     """エラーメッセージの出力テスト。"""
 
-    def test_validate_error_to_stderr(self, tmp_path: Path) -> None:
+    def test_validate_error_to_stderr(
+        self, invalid_yaml: Path, runner: CliRunner, app: typer.Typer
+    ) -> None:
         """validate のエラーメッセージが出力される。"""
-        yaml_file = tmp_path / "bad.yaml"
-        yaml_file.write_text(INVALID_YAML, encoding="utf-8")
-        result = runner.invoke(app, ["validate", str(yaml_file)])
+        result = runner.invoke(app, ["validate", str(invalid_yaml)])
         assert result.exit_code == 1
         # エラーメッセージが出力に含まれる（CliRunner は stdout/stderr を混合）
         assert result.output  # 何らかの出力がある
 
-    def test_lint_error_on_missing_file(self, tmp_path: Path) -> None:
+    def test_lint_error_on_missing_file(
+        self, tmp_path: Path, runner: CliRunner, app: typer.Typer
+    ) -> None:
         """lint で存在しないファイルを指定するとエラーメッセージが出力される。"""
         result = runner.invoke(app, ["lint", str(tmp_path / "missing.yaml")])
         assert result.exit_code == 1
@@ -1,7 +1,7 @@
 ﻿"""
 ArtifactsManager のユニットテスト
 
-Playwright の Page, BrowserContext はモック（unittest.mock.AsyncMock）を使用する。
+Playwright の Page, BrowserContext は呼び出しを記録するだけの軽量スタブを使用する。
 Scenario は実際の Pydantic モデルを使用する。
 
 テスト対象:
@@ -19,7 +19,7 @@ import json
 import re
 from datetime import datetime
 from pathlib import Path
-from unittest.mock import AsyncMock, MagicMock, PropertyMock
+from unittest.mock import MagicMock, PropertyMock
 
 import pytest
 from ruamel.yaml import YAML
@@ -34,6 +34,10 @@ from brt.dsl.schema import (
     VideoConfig,
 )
 
+# flow.yaml 検証用の safe ローダー。ruamel.yaml.clib があれば libyaml ベースの
+# C パーサーが使われる。ラウンドトリップ情報は不要なため typ="safe" で足りる。
+_SAFE_YAML = YAML(typ="safe")
+
 
 # ---------------------------------------------------------------------------
 # ヘルパー: テスト用 Scenario 生成
@@ -92,23 +96,57 @@ def _make_artifacts_config(**overrides) -> ArtifactsConfig:
     return ArtifactsConfig(**defaults)
 
 
-def _make_mock_page() -> AsyncMock:
-    """モック Page を生成する。"""
-    page = AsyncMock()
-    page.screenshot = AsyncMock()
-    # video プロパティのモック
-    video = AsyncMock()
-    video.path = AsyncMock(return_value="/tmp/video.webm")
-    page.video = video
-    return page
+class _StubVideo:
+    """Playwright Video のスタブ。"""
+
+    __slots__ = ()
+
+    async def path(self) -> str:
+        return "/tmp/video.webm"
+
+
+class _StubPage:
+    """Playwright Page のスタブ（screenshot の呼び出し引数を記録する）。"""
+
+    __slots__ = ("screenshot_calls", "video")
+
+    def __init__(self) -> None:
+        self.screenshot_calls: list[dict] = []
+        self.video = _StubVideo()
+
+    async def screenshot(self, **kwargs) -> None:
+        self.screenshot_calls.append(kwargs)
+
+
+class _StubTracing:
+    """Playwright Tracing のスタブ（stop の呼び出し引数を記録する）。"""
+
+    __slots__ = ("stop_calls",)
+
+    def __init__(self) -> None:
+        self.stop_calls: list[dict] = []
 
+    async def stop(self, **kwargs) -> None:
+        self.stop_calls.append(kwargs)
 
-def _make_mock_context() -> AsyncMock:
-    """モック BrowserContext を生成する。"""
-    context = AsyncMock()
-    context.tracing = AsyncMock()
-    context.tracing.stop = AsyncMock()
-    return context
+
+class _StubContext:
+    """Playwright BrowserContext のスタブ。"""
+
+    __slots__ = ("tracing",)
+
+    def __init__(self) -> None:
+        self.tracing = _StubTracing()
+
+
+def _make_mock_page() -> _StubPage:
+    """スタブ Page を生成する。"""
+    return _StubPage()
+
+
+def _make_mock_context() -> _StubContext:
+    """スタブ BrowserContext を生成する。"""
+    return _StubContext()
 
 
 # ===========================================================================
@@ -174,41 +212,49 @@ class TestArtifactsManagerInit:
 # テスト: スクリーンショット保存
 # ===========================================================================
 
+@pytest.fixture(scope="class")
+def base_manager(tmp_path_factory: pytest.TempPathFactory) -> ArtifactsManager:
+    """デフォルト設定の ArtifactsManager（run_dir 作成済み、クラス内で共有）。"""
+    manager = ArtifactsManager(
+        config=_make_artifacts_config(),
+        base_dir=tmp_path_factory.mktemp("artifacts"),
+    )
+    manager.create_run_dir()
+    return manager
+
+
+@pytest.fixture
+def mock_page() -> _StubPage:
+    """テストごとに新しいモック Page。"""
+    return _make_mock_page()
+
+
 class TestSaveScreenshot:
     """save_screenshot のテスト。"""
 
-    async def test_filename_format(self, tmp_path: Path) -> None:
+    async def test_filename_format(
+        self, base_manager: ArtifactsManager, mock_page: _StubPage
+    ) -> None:
         """ファイル名が NNNN_before-<step-name>.jpg 形式であること。"""
-        config = _make_artifacts_config()
-        manager = ArtifactsManager(config=config, base_dir=tmp_path)
-        manager.create_run_dir()
-        page = _make_mock_page()
-
-        result = await manager.save_screenshot(page, 1, "fill-email")
+        result = await base_manager.save_screenshot(mock_page, 1, "fill-email")
 
         assert result is not None
         assert result.name == "0001_before-fill-email.jpg"
 
-    async def test_step_index_zero_padded(self, tmp_path: Path) -> None:
+    async def test_step_index_zero_padded(
+        self, base_manager: ArtifactsManager, mock_page: _StubPage
+    ) -> None:
         """step_index が4桁ゼロ埋めであること。"""
-        config = _make_artifacts_config()
-        manager = ArtifactsManager(config=config, base_dir=tmp_path)
-        manager.create_run_dir()
-        page = _make_mock_page()
-
-        result = await manager.save_screenshot(page, 42, "click-button")
+        result = await base_manager.save_screenshot(mock_page, 42, "click-button")
 
         assert result is not None
         assert result.name.startswith("0042_")
 
-    async def test_step_name_sanitized(self, tmp_path: Path) -> None:
+    async def test_step_name_sanitized(
+        self, base_manager: ArtifactsManager, mock_page: _StubPage
+    ) -> None:
         """ステップ名の特殊文字がサニタイズされること。"""
-        config = _make_artifacts_config()
-        manager = ArtifactsManager(config=config, base_dir=tmp_path)
-        manager.create_run_dir()
-        page = _make_mock_page()
-
-        result = await manager.save_screenshot(page, 1, "fill email/password")
+        result = await base_manager.save_screenshot(mock_page, 1, "fill email/password")
 
         assert result is not None
         # 特殊文字がハイフンに置換されていること
@@ -227,16 +273,13 @@ class TestSaveScreenshot:
         result = await manager.save_screenshot(page, 1, "fill-email")
 
         assert result is None
-        page.screenshot.assert_not_called()
+        assert page.screenshot_calls == []
 
-    async def test_screenshot_saved_in_screenshots_dir(self, tmp_path: Path) -> None:
+    async def test_screenshot_saved_in_screenshots_dir(
+        self, base_manager: ArtifactsManager, mock_page: _StubPage
+    ) -> None:
         """スクリーンショットが screenshots/ ディレクトリに保存されること。"""
-        config = _make_artifacts_config()
-        manager = ArtifactsManager(config=config, base_dir=tmp_path)
-        manager.create_run_dir()
-        page = _make_mock_page()
-
-        result = await manager.save_screenshot(page, 1, "fill-email")
+        result = await base_manager.save_screenshot(mock_page, 1, "fill-email")
 
         assert result is not None
         assert result.parent.name == "screenshots"
@@ -252,8 +295,8 @@ class TestSaveScreenshot:
 
         await manager.save_screenshot(page, 1, "test-step")
 
-        page.screenshot.assert_called_once()
-        call_kwargs = page.screenshot.call_args[1]
+        assert len(page.screenshot_calls) == 1
+        call_kwargs = page.screenshot_calls[0]
         assert call_kwargs["type"] == "jpeg"
         assert call_kwargs["quality"] == 80
 
@@ -270,7 +313,7 @@ class TestSaveScreenshot:
 
         assert result is not None
         assert result.name.endswith(".png")
-        call_kwargs = page.screenshot.call_args[1]
+        call_kwargs = page.screenshot_calls[0]
         assert call_kwargs["type"] == "png"
 
 
@@ -303,9 +346,7 @@ class TestSaveFlowCopy:
         flow_path = manager.save_flow_copy(scenario)
 
         # 保存された YAML を読み込んで比較
-        yaml = YAML()
-        with open(flow_path, "r", encoding="utf-8") as f:
-            loaded_data = yaml.load(f)
+        loaded_data = _SAFE_YAML.load(flow_path.read_bytes())
 
         # 元の Scenario と比較
         original_data = scenario.model_dump(mode="python")
@@ -589,6 +630,15 @@ class TestSanitizeStepName:
         assert not result.startswith("-")
         assert not result.endswith("-")
 
+    @pytest.mark.parametrize(
+        "name",
+        ["fill email/password", 'a\\b:c*d?e"f<g>h|i\tj\nk', "~!@#$%^&()+=[]{};',.`", "ログイン ボタン/押下"],
+    )
+    def test_matches_regex_sanitizer(self, name: str) -> None:
+        """置換テーブル経路でも正規表現によるサニタイズと同じ結果になること。"""
+        expected = re.sub(r"-+", "-", re.sub(r"[^\w\-]", "-", name)).strip("-")
+        assert _sanitize_step_name(name) == expected
+
 
 # ===========================================================================
 # テスト: トレース保存
@@ -611,7 +661,7 @@ class TestSaveTrace:
         assert result is not None
         assert result.name == "trace.zip"
         assert result.parent.name == "trace"
-        context.tracing.stop.assert_called_once()
+        assert len(context.tracing.stop_calls) == 1
 
     async def test_trace_mode_none_skips(self, tmp_path: Path) -> None:
         """trace モードが none の場合はスキップされること。"""
@@ -625,4 +675,4 @@ class TestSaveTrace:
         result = await manager.save_trace(context)
 
         assert result is None
-        context.tracing.stop.assert_not_called()
+        assert context.tracing.stop_calls == []
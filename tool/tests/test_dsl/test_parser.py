@@ -13,7 +13,7 @@ from pathlib import Path
 
 import pytest
 
-from brt.dsl.parser import DslParser, DslValidationError
+from brt.dsl.parser import CACHE_DIR_NAME, DslParser, DslValidationError
 from brt.dsl.schema import Scenario
 
 
@@ -112,6 +112,14 @@ class TestDslParserLoad:
         assert len(scenario.steps) == 3
         assert scenario.healing == "off"
 
+    def test_sample_yaml_matches_sample_dict(
+        self, sample_scenario_parsed: dict, sample_scenario_dict: dict
+    ):
+        """共有サンプル YAML のパース結果が共有サンプル辞書と一致すること。"""
+        assert sample_scenario_parsed == sample_scenario_dict
+        scenario = Scenario(**sample_scenario_parsed)
+        assert scenario.title == "ログインフローのテスト"
+
     def test_load_file_not_found(self, parser: DslParser, tmp_path: Path):
         """存在しないファイルで FileNotFoundError が発生すること。"""
         with pytest.raises(FileNotFoundError, match="YAML ファイルが見つかりません"):
@@ -375,3 +383,69 @@ class TestDslParserValidate:
         assert len(errors) == 1
         # 行番号が設定されていること（None でないこと）
         assert errors[0].line is not None
+
+
+# ---------------------------------------------------------------------------
+# パース済みツリーキャッシュ テスト
+# ---------------------------------------------------------------------------
+
+class TestDslParserCache:
+    """cache=True 指定時のディスクキャッシュのテスト。"""
+
+    def test_cache_disabled_by_default(
+        self, parser: DslParser, tmp_path: Path, minimal_yaml_content: str
+    ):
+        """デフォルトではキャッシュディレクトリが作成されないこと。"""
+        yaml_file = tmp_path / "scenario.yaml"
+        yaml_file.write_text(minimal_yaml_content, encoding="utf-8")
+
+        parser.load(yaml_file)
+
+        assert not (tmp_path / CACHE_DIR_NAME).exists()
+
+    def test_cache_written_and_reused(
+        self, tmp_path: Path, minimal_yaml_content: str
+    ):
+        """初回 load でキャッシュが書き込まれ、2回目で同等の Scenario が返ること。"""
+        yaml_file = tmp_path / "scenario.yaml"
+        yaml_file.write_text(minimal_yaml_content, encoding="utf-8")
+        cached_parser = DslParser(cache=True)
+
+        first = cached_parser.load(yaml_file)
+        cache_files = list((tmp_path / CACHE_DIR_NAME).glob("scenario.yaml.*.pkl"))
+        second = cached_parser.load(yaml_file)
+
+        assert len(cache_files) == 1
+        assert second.model_dump() == first.model_dump()
+
+    def test_cache_invalidated_on_content_change(
+        self, tmp_path: Path, minimal_yaml_content: str
+    ):
+        """YAML の内容が変わるとキャッシュが使われないこと。"""
+        yaml_file = tmp_path / "scenario.yaml"
+        yaml_file.write_text(minimal_yaml_content, encoding="utf-8")
+        cached_parser = DslParser(cache=True)
+        cached_parser.load(yaml_file)
+
+        yaml_file.write_text(
+            minimal_yaml_content.replace("テストシナリオ", "変更後"),
+            encoding="utf-8",
+        )
+        scenario = cached_parser.load(yaml_file)
+
+        assert scenario.title == "変更後"
+
+    def test_corrupt_cache_falls_back_to_parse(
+        self, tmp_path: Path, minimal_yaml_content: str
+    ):
+        """壊れたキャッシュファイルは無視され、通常パースされること。"""
+        yaml_file = tmp_path / "scenario.yaml"
+        yaml_file.write_text(minimal_yaml_content, encoding="utf-8")
+        cached_parser = DslParser(cache=True)
+        cached_parser.load(yaml_file)
+        for cache_file in (tmp_path / CACHE_DIR_NAME).iterdir():
+            cache_file.write_bytes(b"not a pickle")
+
+        scenario = cached_parser.load(yaml_file)
+
+        assert scenario.title == "テストシナリオ"
@@ -13,6 +13,7 @@ HooksConfig, Section, Scenario モデルの動作を検証する。
 """
 
 import pytest
+from hypothesis import given, settings
 from pydantic import ValidationError
 
 from brt.dsl.schema import (
@@ -24,6 +25,7 @@ from brt.dsl.schema import (
     TraceConfig,
     VideoConfig,
 )
+from tests.conftest import make_random_vars_strategy, make_regex_goto_step_strategy
 
 
 # ---------------------------------------------------------------------------
@@ -422,3 +424,34 @@ class TestScenarioVarsValidation:
             steps=[{"goto": "/"}],
         )
         assert scenario.vars["db"] == "${env.DB_HOST_NAME}"
+
+
+# ---------------------------------------------------------------------------
+# 遅い生成器を使うプロパティテスト（slow）
+# ---------------------------------------------------------------------------
+
+@pytest.mark.slow
+@settings(max_examples=50, deadline=None)
+@given(step=make_regex_goto_step_strategy())
+def test_regex_generated_goto_step_accepted(step):
+    """正規表現の定義域全体から生成した goto ステップが受け入れられること。"""
+    scenario = Scenario(
+        title="テスト",
+        baseUrl="http://localhost:4200",
+        steps=[step],
+    )
+    assert len(scenario.steps) == 1
+
+
+@pytest.mark.slow
+@settings(max_examples=50, deadline=None)
+@given(vars_=make_random_vars_strategy())
+def test_random_vars_accepted(vars_):
+    """任意キー・任意長の vars 辞書がそのまま保持されること。"""
+    scenario = Scenario(
+        title="テスト",
+        baseUrl="http://localhost:4200",
+        vars=vars_,
+        steps=[{"goto": "/"}],
+    )
+    assert scenario.vars == vars_
@@ -124,6 +124,32 @@ class TestExpandMixed:
         result = expander.expand("${env.EMAIL} と ${vars.name}")
         assert "${" not in result
 
+    def test_expand_unknown_namespace_raises(self, expander: VariableExpander):
+        """env / vars 以外の参照で VariableNotFoundError が発生すること。"""
+        with pytest.raises(VariableNotFoundError) as exc_info:
+            expander.expand("前 ${env.EMAIL} ${other.KEY} 後")
+        assert exc_info.value.namespace == "unknown"
+        assert exc_info.value.var_name == "${other.KEY}"
+
+    def test_expand_invalid_var_name_raises(self, expander: VariableExpander):
+        """識別子として不正な変数名の参照で VariableNotFoundError が発生すること。"""
+        with pytest.raises(VariableNotFoundError) as exc_info:
+            expander.expand("${vars.1abc}")
+        assert exc_info.value.namespace == "unknown"
+
+    def test_value_containing_reference_raises(self):
+        """変数の値に含まれる ${...} が未解決のまま残らず、例外になること。"""
+        expander = VariableExpander(env={}, vars={"url": "${env.BASE}/login"})
+        with pytest.raises(VariableNotFoundError) as exc_info:
+            expander.expand("${vars.url}")
+        assert exc_info.value.var_name == "${env.BASE}"
+
+    def test_step_value_containing_reference_raises(self):
+        """一括展開経路でも、値に含まれる ${...} が例外になること。"""
+        expander = VariableExpander(env={}, vars={"url": "${env.BASE}/login", "a": "x"})
+        with pytest.raises(VariableNotFoundError):
+            expander.expand_step({"goto": "${vars.url}", "name": "${vars.a}"})
+
 
 # ---------------------------------------------------------------------------
 # set_var() テスト
@@ -150,6 +176,12 @@ class TestSetVar:
         result = expander.expand("Bearer ${vars.token}")
         assert result == "Bearer abc123"
 
+    def test_set_var_invalidates_cached_expansion(self, expander: VariableExpander):
+        """展開済みのテキストも set_var() 後は新しい値で展開されること。"""
+        assert expander.expand("Hi ${vars.name}") == "Hi テストユーザー"
+        expander.set_var("name", "別ユーザー")
+        assert expander.expand("Hi ${vars.name}") == "Hi 別ユーザー"
+
 
 # ---------------------------------------------------------------------------
 # expand_step() テスト
@@ -221,6 +253,54 @@ class TestExpandStep:
         with pytest.raises(VariableNotFoundError):
             expander.expand_step(step)
 
+    def test_expand_step_reports_first_undefined_var(self, expander: VariableExpander):
+        """複数の未定義変数がある場合、文書順で最初のものが報告されること。"""
+        step = {
+            "fill": {
+                "by": {"label": "${vars.M1}"},
+                "value": "${vars.M2}",
+                "extra": ["${vars.M3}"],
+            },
+            "name": "${vars.M4}",
+        }
+        with pytest.raises(VariableNotFoundError) as exc_info:
+            expander.expand_step(step)
+        assert exc_info.value.var_name == "M1"
+
+    def test_expand_step_multiple_leaves(self, expander: VariableExpander):
+        """複数の文字列値がそれぞれ正しい位置に展開されること。"""
+        step = {
+            "fill": {
+                "by": {"label": "${vars.name}"},
+                "value": "${env.EMAIL}",
+                "extra": ["${vars.email}", "固定", "${env.BASE_URL}/x"],
+            },
+        }
+        result = expander.expand_step(step)
+        assert result == {
+            "fill": {
+                "by": {"label": "テストユーザー"},
+                "value": "admin@example.com",
+                "extra": ["test@example.com", "固定", "http://localhost:4200/x"],
+            },
+        }
+
+    def test_expand_step_value_containing_separator(self):
+        """展開後の値に一括展開用の区切り文字が含まれても正しく展開されること。"""
+        expander = VariableExpander(env={"A": "x\x1ey"}, vars={"b": "z"})
+        result = expander.expand_step({"s": ["${env.A}", "${vars.b}"]})
+        assert result == {"s": ["x\x1ey", "z"]}
+
+    def test_expand_step_deeply_nested(self, expander: VariableExpander):
+        """再帰上限を超える深さのネストでも展開できること。"""
+        step: dict = {"value": "${vars.email}"}
+        for _ in range(2000):
+            step = {"nested": [step]}
+        result = expander.expand_step(step)
+        for _ in range(2000):
+            result = result["nested"][0]
+        assert result == {"value": "test@example.com"}
+
 
 # ---------------------------------------------------------------------------
 # プロパティアクセステスト
@@ -229,33 +309,36 @@ class TestExpandStep:
 class TestExpanderProperties:
     """env / vars プロパティのテスト。"""
 
-    def test_env_property_returns_copy(self, expander: VariableExpander):
-        """env プロパティが辞書のコピーを返すこと。"""
-        env_copy = expander.env
-        env_copy["NEW_KEY"] = "new_value"
-        # 内部状態は変更されていない
+    def test_env_property_is_read_only(self, expander: VariableExpander):
+        """env プロパティが変更不可のビューを返すこと。"""
+        with pytest.raises(TypeError):
+            expander.env["NEW_KEY"] = "new_value"  # type: ignore[index]
         assert "NEW_KEY" not in expander.env
 
-    def test_vars_property_returns_copy(self, expander: VariableExpander):
-        """vars プロパティが辞書のコピーを返すこと。"""
-        vars_copy = expander.vars
-        vars_copy["new_key"] = "new_value"
-        # 内部状態は変更されていない
+    def test_vars_property_is_read_only(self, expander: VariableExpander):
+        """vars プロパティが変更不可のビューを返すこと。"""
+        with pytest.raises(TypeError):
+            expander.vars["new_key"] = "new_value"  # type: ignore[index]
         assert "new_key" not in expander.vars
 
-    def test_constructor_copies_input_dicts(self):
-        """コンストラクタが入力辞書をコピーすること（外部変更の影響を受けない）。"""
-        env = {"KEY": "value"}
+    def test_vars_property_reflects_set_var(self, expander: VariableExpander):
+        """vars プロパティが set_var() の結果を反映すること。"""
+        view = expander.vars
+        expander.set_var("token", "abc123")
+        assert view["token"] == "abc123"
+
+    def test_constructor_copies_vars(self):
+        """コンストラクタが vars をコピーすること（set_var が入力辞書を変更しない）。"""
         vars_dict = {"var": "val"}
-        expander = VariableExpander(env=env, vars=vars_dict)
+        expander = VariableExpander(env={}, vars=vars_dict)
 
         # 元の辞書を変更
-        env["KEY"] = "changed"
         vars_dict["var"] = "changed"
+        expander.set_var("added", "x")
 
-        # expander 内部は変更されていない
-        assert expander.expand("${env.KEY}") == "value"
+        # expander 内部と入力辞書は互いに独立
         assert expander.expand("${vars.var}") == "val"
+        assert "added" not in vars_dict
 
 
 # ---------------------------------------------------------------------------
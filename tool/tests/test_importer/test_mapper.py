@@ -80,6 +80,21 @@ class TestClickMapping:
 
         assert result[0] == {"click": {"by": {"role": "button", "name": "Submit"}}}
 
+    def test_click_by_role_uses_locator_kwargs(self, mapper: Mapper) -> None:
+        """locator_kwargs がある場合はその値を型を保ったまま使うこと。"""
+        raw = RawAction(
+            action_type="click",
+            locator_chain=["get_by_role", "button", "name=1", "exact=True"],
+            args={},
+            line_number=1,
+            locator_kwargs={"name": "1", "exact": True},
+        )
+        result = mapper.map([raw])
+
+        assert result[0] == {
+            "click": {"by": {"role": "button", "name": "1", "exact": True}}
+        }
+
     def test_click_by_role_without_name(self, mapper: Mapper) -> None:
         """role のみの click が正しく変換されること。"""
         raw = RawAction(
@@ -469,6 +484,25 @@ class TestEdgeCases:
 class TestMultipleActions:
     """複数アクションの連続変換テスト。"""
 
+    def test_large_input_keeps_order(self, mapper: Mapper) -> None:
+        """大量の入力でも入力順が保たれ、変換不能分が除外されること。"""
+        raw_actions = [
+            RawAction(
+                action_type="click" if i % 10 else "unknown",
+                locator_chain=["get_by_test_id", f"item-{i}"],
+                args={},
+                line_number=i,
+            )
+            for i in range(1000)
+        ]
+        result = mapper.map(raw_actions)
+
+        assert result == [
+            {"click": {"by": {"testId": f"item-{i}"}}}
+            for i in range(1000)
+            if i % 10
+        ]
+
     def test_login_flow(self, mapper: Mapper) -> None:
         """ログインフロー全体が正しく変換されること。"""
         raw_actions = [
@@ -51,7 +51,7 @@ class TestGotoPattern:
         assert len(actions) == 1
         assert actions[0].action_type == "goto"
         assert actions[0].args["url"] == "https://example.com"
-        assert actions[0].locator_chain == []
+        assert actions[0].locator_chain == ()
 
     def test_goto_with_path(self, parser: PyAstParser) -> None:
         """パス付き URL の goto パターンを認識できること。"""
@@ -93,6 +93,13 @@ class TestClickPattern:
         assert "button" in action.locator_chain
         assert "name=Submit" in action.locator_chain
 
+    def test_click_by_role_keeps_kwarg_types(self, parser: PyAstParser) -> None:
+        """キーワード引数が元の型のまま locator_kwargs に保持されること。"""
+        source = 'page.get_by_role("button", name="Submit", exact=True).click()'
+        actions = parser.parse(source)
+
+        assert actions[0].locator_kwargs == {"name": "Submit", "exact": True}
+
     def test_click_by_role_without_name(self, parser: PyAstParser) -> None:
         """get_by_role（name なし）+ click パターンを認識できること。"""
         source = 'page.get_by_role("textbox").click()'
@@ -101,7 +108,7 @@ class TestClickPattern:
         assert len(actions) == 1
         action = actions[0]
         assert action.action_type == "click"
-        assert action.locator_chain == ["get_by_role", "textbox"]
+        assert action.locator_chain == ("get_by_role", "textbox")
 
     def test_click_by_test_id(self, parser: PyAstParser) -> None:
         """get_by_test_id + click パターンを認識できること。"""
@@ -111,7 +118,7 @@ class TestClickPattern:
         assert len(actions) == 1
         action = actions[0]
         assert action.action_type == "click"
-        assert action.locator_chain == ["get_by_test_id", "login-btn"]
+        assert action.locator_chain == ("get_by_test_id", "login-btn")
 
     def test_click_by_text(self, parser: PyAstParser) -> None:
         """get_by_text + click パターンを認識できること。"""
@@ -121,7 +128,7 @@ class TestClickPattern:
         assert len(actions) == 1
         action = actions[0]
         assert action.action_type == "click"
-        assert action.locator_chain == ["get_by_text", "Submit"]
+        assert action.locator_chain == ("get_by_text", "Submit")
 
     def test_click_by_label(self, parser: PyAstParser) -> None:
         """get_by_label + click パターンを認識できること。"""
@@ -131,7 +138,7 @@ class TestClickPattern:
         assert len(actions) == 1
         action = actions[0]
         assert action.action_type == "click"
-        assert action.locator_chain == ["get_by_label", "Accept terms"]
+        assert action.locator_chain == ("get_by_label", "Accept terms")
 
     def test_click_by_placeholder(self, parser: PyAstParser) -> None:
         """get_by_placeholder + click パターンを認識できること。"""
@@ -141,7 +148,7 @@ class TestClickPattern:
         assert len(actions) == 1
         action = actions[0]
         assert action.action_type == "click"
-        assert action.locator_chain == ["get_by_placeholder", "Search..."]
+        assert action.locator_chain == ("get_by_placeholder", "Search...")
 
 
 # ===========================================================================
@@ -159,7 +166,7 @@ class TestFillPattern:
         assert len(actions) == 1
         action = actions[0]
         assert action.action_type == "fill"
-        assert action.locator_chain == ["locator", "#email"]
+        assert action.locator_chain == ("locator", "#email")
         assert action.args["value"] == "test@example.com"
 
     def test_fill_by_label(self, parser: PyAstParser) -> None:
@@ -170,7 +177,7 @@ class TestFillPattern:
         assert len(actions) == 1
         action = actions[0]
         assert action.action_type == "fill"
-        assert action.locator_chain == ["get_by_label", "Email"]
+        assert action.locator_chain == ("get_by_label", "Email")
         assert action.args["value"] == "test@example.com"
 
     def test_fill_by_placeholder(self, parser: PyAstParser) -> None:
@@ -181,7 +188,7 @@ class TestFillPattern:
         assert len(actions) == 1
         action = actions[0]
         assert action.action_type == "fill"
-        assert action.locator_chain == ["get_by_placeholder", "Enter email"]
+        assert action.locator_chain == ("get_by_placeholder", "Enter email")
         assert action.args["value"] == "test@example.com"
 
     def test_fill_by_role(self, parser: PyAstParser) -> None:
@@ -318,7 +325,7 @@ class TestExpectPattern:
         assert len(actions) == 1
         action = actions[0]
         assert action.action_type == "expect_text"
-        assert action.locator_chain == ["get_by_test_id", "message"]
+        assert action.locator_chain == ("get_by_test_id", "message")
         assert action.args["text"] == "Hello"
 
     def test_expect_have_url(self, parser: PyAstParser) -> None:
@@ -330,7 +337,7 @@ class TestExpectPattern:
         action = actions[0]
         assert action.action_type == "expect_url"
         assert action.args["url"] == "https://example.com/dashboard"
-        assert action.locator_chain == []
+        assert action.locator_chain == ()
 
     def test_expect_hidden(self, parser: PyAstParser) -> None:
         """expect(...).to_be_hidden() パターンを認識できること。"""
@@ -457,6 +464,22 @@ expect(page.get_by_role("heading", name="Done")).to_be_visible()
         for i in range(len(actions) - 1):
             assert actions[i].line_number < actions[i + 1].line_number
 
+    def test_nested_blocks_in_source_order(self, parser: PyAstParser) -> None:
+        """ネストしたブロック内のアクションがソース順に抽出されること。"""
+        source = """\
+def run(page):
+    page.goto("https://example.com")
+    with context:
+        if flag:
+            page.get_by_role("button", name="A").click()
+        else:
+            page.get_by_role("button", name="B").click()
+    page.get_by_role("button", name="C").click()
+"""
+        actions = parser.parse(source)
+
+        assert [a.line_number for a in actions] == [2, 5, 7, 8]
+
 
 # ===========================================================================
 # 11. locator チェーンの正確性
@@ -470,35 +493,35 @@ class TestLocatorChainAccuracy:
         source = 'page.get_by_role("link", name="Home").click()'
         actions = parser.parse(source)
 
-        assert actions[0].locator_chain == ["get_by_role", "link", "name=Home"]
+        assert actions[0].locator_chain == ("get_by_role", "link", "name=Home")
 
     def test_test_id_chain(self, parser: PyAstParser) -> None:
         """get_by_test_id のチェーンが正確であること。"""
         source = 'page.get_by_test_id("submit-form").click()'
         actions = parser.parse(source)
 
-        assert actions[0].locator_chain == ["get_by_test_id", "submit-form"]
+        assert actions[0].locator_chain == ("get_by_test_id", "submit-form")
 
     def test_locator_css_chain(self, parser: PyAstParser) -> None:
         """locator(css) のチェーンが正確であること。"""
         source = 'page.locator("div.container > input").fill("value")'
         actions = parser.parse(source)
 
-        assert actions[0].locator_chain == ["locator", "div.container > input"]
+        assert actions[0].locator_chain == ("locator", "div.container > input")
 
     def test_get_by_label_chain(self, parser: PyAstParser) -> None:
         """get_by_label のチェーンが正確であること。"""
         source = 'page.get_by_label("Username").fill("admin")'
         actions = parser.parse(source)
 
-        assert actions[0].locator_chain == ["get_by_label", "Username"]
+        assert actions[0].locator_chain == ("get_by_label", "Username")
 
     def test_expect_locator_chain(self, parser: PyAstParser) -> None:
         """expect 内のロケータチェーンが正確であること。"""
         source = 'expect(page.get_by_role("alert", name="Error")).to_be_visible()'
         actions = parser.parse(source)
 
-        assert actions[0].locator_chain == ["get_by_role", "alert", "name=Error"]
+        assert actions[0].locator_chain == ("get_by_role", "alert", "name=Error")
 
 
 # ===========================================================================
@@ -579,4 +602,4 @@ class TestScrollPattern:
 
         assert len(actions) == 1
         assert actions[0].action_type == "scroll_into_view"
-        assert actions[0].locator_chain == ["get_by_test_id", "target"]
+        assert actions[0].locator_chain == ("get_by_test_id", "target")
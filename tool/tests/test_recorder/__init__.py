@@ -0,0 +1 @@
+# Recorder テスト
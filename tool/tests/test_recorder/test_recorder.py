@@ -0,0 +1,60 @@
+﻿"""
+BrowserRecorder テスト — 全タブが閉じられるまでの待機処理を検証する。
+
+実ブラウザは起動せず、Page / BrowserContext はモックで代替する。
+"""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+from brt.recorder.recorder import BrowserRecorder
+
+
+def _make_page(context: MagicMock) -> MagicMock:
+    """wait_for_event("close") で自身を閉じるモック Page を生成する。"""
+    page = MagicMock()
+    page.is_closed.return_value = False
+
+    def close(*args, **kwargs):
+        page.is_closed.return_value = True
+        context.pages.remove(page)
+
+    page.wait_for_event.side_effect = close
+    return page
+
+
+class TestWaitUntilAllPagesClosed:
+    """_wait_until_all_pages_closed のテスト。"""
+
+    def test_waits_for_every_page(self) -> None:
+        """context の全ページが閉じられるまで待機すること。"""
+        context = MagicMock()
+        context.pages = []
+        pages = [_make_page(context) for _ in range(3)]
+        context.pages.extend(pages)
+
+        BrowserRecorder()._wait_until_all_pages_closed(context)
+
+        assert context.pages == []
+        for page in pages:
+            page.wait_for_event.assert_called_once_with("close", timeout=0)
+
+    def test_returns_when_no_pages(self) -> None:
+        """ページが無ければ即座に戻ること。"""
+        context = MagicMock()
+        context.pages = []
+
+        BrowserRecorder()._wait_until_all_pages_closed(context)
+
+    def test_stops_when_browser_closed(self) -> None:
+        """待機中に例外（ブラウザ終了等）が起きたら待機を終えること。"""
+        context = MagicMock()
+        page = MagicMock()
+        page.is_closed.return_value = False
+        page.wait_for_event.side_effect = RuntimeError("browser closed")
+        context.pages = [page]
+
+        BrowserRecorder()._wait_until_all_pages_closed(context)
+
+        page.wait_for_event.assert_called_once()
@@ -0,0 +1,45 @@
+﻿"""
+ScriptWriter テスト — セレクタ辞書から locator コードへの変換を検証する。
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from brt.recorder.script_writer import ScriptWriter
+
+
+@pytest.fixture
+def writer() -> ScriptWriter:
+    """テスト用の ScriptWriter。"""
+    return ScriptWriter()
+
+
+# ---------------------------------------------------------------------------
+# _selector_to_locator
+# ---------------------------------------------------------------------------
+
+class TestSelectorToLocator:
+    """_selector_to_locator のテスト。"""
+
+    def test_test_id(self, writer: ScriptWriter) -> None:
+        """testId セレクタが get_by_test_id に変換されること。"""
+        result = writer._selector_to_locator({"type": "testId", "value": "submit"})
+        assert result == 'page.get_by_test_id("submit")'
+
+    def test_role_with_name(self, writer: ScriptWriter) -> None:
+        """role セレクタが name 付きの get_by_role に変換されること。"""
+        result = writer._selector_to_locator(
+            {"type": "role", "role": "button", "name": "ログイン"}
+        )
+        assert result == 'page.get_by_role("button", name="ログイン", exact=True)'
+
+    @pytest.mark.parametrize(
+        "selector",
+        [{"value": "x"}, {"type": None, "value": "x"}, {"type": 1, "value": "x"}],
+    )
+    def test_missing_or_non_string_type(
+        self, writer: ScriptWriter, selector: dict
+    ) -> None:
+        """type が欠落・null・文字列以外の場合は空文字列を返すこと。"""
+        assert writer._selector_to_locator(selector) == ""
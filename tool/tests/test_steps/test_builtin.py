@@ -477,6 +477,17 @@ class TestHighLevelHelperHandlers:
         with pytest.raises(AssertionError):
             asyncio.run(handler.execute(page, {}, ctx))
 
+    def test_assert_no_console_error_reports_total_count(self):
+        """上限超過で破棄されたエラーも件数に含めて報告すること。"""
+        page = _make_mock_page()
+        ctx = _make_mock_context()
+        ctx.console_errors = ["error-a", "error-b"]
+        ctx.console_errors_dropped = 3
+        handler = AssertNoConsoleErrorHandler()
+
+        with pytest.raises(AssertionError, match="5 件のエラー.*直近 2 件"):
+            asyncio.run(handler.execute(page, {}, ctx))
+
     def test_api_mock_handler_has_schema(self):
         """apiMock ハンドラが正しいスキーマを返すこと。"""
         handler = ApiMockHandler()
@@ -545,3 +556,53 @@ class TestHighLevelStepRegistration:
 
         # 標準 31 + 高レベル 5 = 36
         assert len(registry.names) == 36
+
+    def test_full_registry_returns_independent_instances(self):
+        """呼び出しごとに独立したレジストリを返し、追加登録が他へ波及しないこと。"""
+        from brt.steps import create_full_registry
+        registry = create_full_registry()
+        registry.register("extra", registry.get("click"))
+
+        other = create_full_registry()
+        assert other is not registry
+        assert "extra" not in other.names
+
+
+# ---------------------------------------------------------------------------
+# setDatePicker ハンドラのテスト
+# ---------------------------------------------------------------------------
+
+class TestSetDatePickerHandler:
+    """SetDatePickerHandler のテスト。"""
+
+    def test_default_uses_click_and_fill(self):
+        """既定では click → fill("") → fill(date) → Enter で入力し、evaluate は使わないこと。"""
+        from brt.steps.datepicker import SetDatePickerHandler
+
+        page = _make_mock_page()
+        locator = page.get_by_test_id.return_value
+        ctx = _make_mock_context()
+        params = {"by": {"testId": "date"}, "date": "2024-01-31"}
+
+        asyncio.run(SetDatePickerHandler().execute(page, params, ctx))
+
+        locator.click.assert_awaited_once()
+        assert [c.args for c in locator.fill.await_args_list] == [("",), ("2024-01-31",)]
+        locator.press.assert_awaited_once_with("Enter")
+        locator.evaluate.assert_not_called()
+
+    def test_direct_set_uses_single_evaluate(self):
+        """directSet: true では 1 回の evaluate で値を設定し、click / fill を使わないこと。"""
+        from brt.steps.datepicker import _SET_VALUE_JS, SetDatePickerHandler
+
+        page = _make_mock_page()
+        locator = page.get_by_test_id.return_value
+        ctx = _make_mock_context()
+        params = {"by": {"testId": "date"}, "date": "2024-01-31", "directSet": True}
+
+        asyncio.run(SetDatePickerHandler().execute(page, params, ctx))
+
+        locator.evaluate.assert_awaited_once_with(_SET_VALUE_JS, "2024-01-31")
+        locator.click.assert_not_called()
+        locator.fill.assert_not_called()
+        locator.press.assert_awaited_once_with("Enter")
@@ -113,6 +113,15 @@ class TestStepRegistryRegisterGet:
         with pytest.raises(TypeError, match="StepHandler Protocol"):
             registry.register("invalid", InvalidHandler())
 
+    def test_register_non_callable_execute_raises_type_error(self):
+        """execute が呼び出し可能でないハンドラで TypeError が発生すること。"""
+        registry = StepRegistry()
+        handler = InvalidHandler()
+        handler.execute = "not callable"
+
+        with pytest.raises(TypeError, match="StepHandler Protocol"):
+            registry.register("invalid", handler)
+
 
 # ---------------------------------------------------------------------------
 # list_all テスト
@@ -136,6 +145,18 @@ class TestStepRegistryListAll:
         names = [s.name for s in registry.list_all()]
         assert names == ["alpha", "middle", "zebra"]
 
+    def test_list_all_reflects_later_register(self):
+        """list_all() / names の呼び出し後に登録したステップも反映されること。"""
+        registry = StepRegistry()
+        registry.register("beta", DummyHandler())
+        assert [s.name for s in registry.list_all()] == ["beta"]
+        assert registry.names == ["beta"]
+
+        registry.register("alpha", DummyHandler())
+
+        assert [s.name for s in registry.list_all()] == ["alpha", "beta"]
+        assert registry.names == ["alpha", "beta"]
+
     def test_list_all_count(self):
         """登録数と list_all() の件数が一致すること。"""
         registry = StepRegistry()
@@ -189,3 +210,64 @@ class TestStepHandlerProtocol:
         """InvalidHandler が StepHandler Protocol を満たさないこと。"""
         handler = InvalidHandler()
         assert not isinstance(handler, StepHandler)
+
+
+# ---------------------------------------------------------------------------
+# freeze テスト
+# ---------------------------------------------------------------------------
+
+class TestStepRegistryFreeze:
+    """freeze() の動作テスト。"""
+
+    def test_get_after_freeze(self):
+        """freeze 後も登録済みハンドラを取得できること。"""
+        registry = StepRegistry()
+        handler = DummyHandler()
+        registry.register("frozen-step", handler)
+        registry.freeze()
+
+        assert registry.get("frozen-step") is handler
+        with pytest.raises(KeyError, match="frozen-step"):
+            registry.get("missing")
+
+    def test_register_after_freeze_raises(self):
+        """freeze 後の register() が RuntimeError になること。"""
+        registry = StepRegistry()
+        registry.freeze()
+
+        with pytest.raises(RuntimeError):
+            registry.register("late-step", DummyHandler())
+        assert registry.has("late-step") is False
+
+
+# ---------------------------------------------------------------------------
+# StepContext テスト
+# ---------------------------------------------------------------------------
+
+class TestStepContextConsoleErrors:
+    """StepContext.console_errors の上限テスト。"""
+
+    def test_console_errors_keeps_latest_entries(self):
+        """上限を超えたエラーは古いものから捨てられること。"""
+        from brt.steps.registry import CONSOLE_ERRORS_CAP
+
+        ctx = StepContext(selector_resolver=None, variable_expander=None)
+        for i in range(CONSOLE_ERRORS_CAP + 5):
+            ctx.add_console_error(f"error-{i}")
+
+        assert len(ctx.console_errors) == CONSOLE_ERRORS_CAP
+        assert ctx.console_errors[0] == "error-5"
+        assert ctx.console_errors[-1] == f"error-{CONSOLE_ERRORS_CAP + 4}"
+
+    def test_console_error_count_includes_dropped(self, caplog):
+        """破棄分も総数に数えられ、破棄開始時に一度だけ警告されること。"""
+        from brt.steps.registry import CONSOLE_ERRORS_CAP
+
+        ctx = StepContext(selector_resolver=None, variable_expander=None)
+        with caplog.at_level("WARNING", logger="brt.steps.registry"):
+            for i in range(CONSOLE_ERRORS_CAP + 5):
+                ctx.add_console_error(f"error-{i}")
+
+        assert ctx.console_errors_dropped == 5
+        assert ctx.console_error_count == CONSOLE_ERRORS_CAP + 5
+        assert len(caplog.records) == 1